@@ -0,0 +1,57 @@
+import numpy as np
+from benchmark import Benchmark
+from benchmarker import run_benchmarks
+
+import freud
+
+
+class BenchmarkBox(Benchmark):
+    def __init__(self, L, tilt, method):
+        self.L = L
+        self.tilt = tilt
+        self.method = method
+
+    def bench_setup(self, N):
+        seed = 0
+        np.random.seed(seed)
+        self.box = freud.box.Box(self.L, self.L, self.L, *self.tilt)
+        self.points = np.random.uniform(-self.L, self.L, (N, 3)).astype(np.float32)
+        self.out = np.empty_like(self.points)
+
+    def bench_run(self, N):
+        getattr(self.box, self.method)(self.points, out=self.out)
+
+
+def run():
+    Ns = [10000, 100000, 1000000]
+    number = 100
+    L = 10
+
+    name = "freud.box.Box.wrap"
+    return run_benchmarks(
+        name, Ns, number, BenchmarkBox, L=L, tilt=(0.3, 0.2, 0.1), method="wrap"
+    )
+
+
+def run_box_types():
+    Ns = [10000, 100000, 1000000]
+    number = 100
+    L = 10
+
+    results = []
+    for method in ("wrap", "make_fractional"):
+        for box_type, tilt in (
+            ("orthorhombic", (0, 0, 0)),
+            ("triclinic", (0.3, 0.2, 0.1)),
+        ):
+            name = f"freud.box.Box.{method} ({box_type})"
+            results.append(
+                run_benchmarks(
+                    name, Ns, number, BenchmarkBox, L=L, tilt=tilt, method=method
+                )
+            )
+    return results
+
+
+if __name__ == "__main__":
+    run_box_types()
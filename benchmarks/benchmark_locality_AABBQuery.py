@@ -21,6 +21,39 @@ class BenchmarkLocalityAABBQuery(Benchmark):
         aq.query(self.points, {"r_max": self.r_max, "exclude_ii": True})
 
 
+class BenchmarkLocalityAABBQueryFrames(Benchmark):
+    """Process a trajectory with small displacements between frames, either
+    refitting one tree with :meth:`freud.locality.AABBQuery.update` or
+    building a new tree for every frame."""
+
+    def __init__(self, L, r_max, num_frames, sigma, refit):
+        self.L = L
+        self.r_max = r_max
+        self.num_frames = num_frames
+        self.sigma = sigma
+        self.refit = refit
+
+    def bench_setup(self, N):
+        self.box = freud.box.Box.cube(self.L)
+        np.random.seed(0)
+        points = np.random.uniform(-self.L / 2, self.L / 2, (N, 3))
+        self.frames = []
+        for _ in range(self.num_frames):
+            points = self.box.wrap(
+                points + np.random.normal(scale=self.sigma, size=points.shape)
+            )
+            self.frames.append(points)
+        self.aq = freud.locality.AABBQuery(self.box, self.frames[0])
+
+    def bench_run(self, N):
+        for points in self.frames:
+            if self.refit:
+                aq = self.aq.update(points)
+            else:
+                aq = freud.locality.AABBQuery(self.box, points)
+            aq.query(points, {"r_max": self.r_max, "exclude_ii": True})
+
+
 def run():
     Ns = [1000, 10000]
     r_max = 0.5
@@ -33,5 +66,33 @@ def run():
     )
 
 
+def run_frames():
+    Ns = [1000, 10000, 100000]
+    r_max = 0.5
+    L = 10
+    num_frames = 10
+    sigma = 0.01
+    number = 10
+
+    results = []
+    for refit in (False, True):
+        name = "freud.locality.AABBQuery ({})".format("refit" if refit else "rebuild")
+        results.append(
+            run_benchmarks(
+                name,
+                Ns,
+                number,
+                BenchmarkLocalityAABBQueryFrames,
+                L=L,
+                r_max=r_max,
+                num_frames=num_frames,
+                sigma=sigma,
+                refit=refit,
+            )
+        )
+    return results
+
+
 if __name__ == "__main__":
     run()
+    run_frames()
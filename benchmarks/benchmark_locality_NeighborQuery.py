@@ -0,0 +1,167 @@
+import numpy as np
+from benchmark import Benchmark
+from benchmarker import run_benchmarks
+
+import freud
+
+
+class BenchmarkLocalityNeighborQuery(Benchmark):
+    """Benchmark per-point neighbor iteration overhead.
+
+    Uses a small cutoff so that each query point has only a handful of
+    neighbors, which makes the fixed per-point cost of setting up a query
+    iterator dominate the runtime.
+    """
+
+    def __init__(self, L, query_args, nq_type, nq_kwargs=None):
+        self.L = L
+        self.query_args = query_args
+        self.nq_type = nq_type
+        self.nq_kwargs = nq_kwargs if nq_kwargs is not None else {}
+
+    def bench_setup(self, N):
+        self.box = freud.box.Box.cube(self.L)
+        seed = 0
+        np.random.seed(seed)
+        self.points = np.random.uniform(-self.L / 2, self.L / 2, (N, 3)).astype(
+            np.float32
+        )
+        self.nq = self.nq_type(self.box, self.points, **self.nq_kwargs)
+
+    def bench_run(self, N):
+        self.nq.query(self.points, self.query_args).toNeighborList()
+
+
+def run():
+    Ns = [1000, 10000, 100000]
+    number = 10
+    L = 30
+    query_args = dict(r_max=0.5, exclude_ii=True)
+
+    name = "freud.locality.AABBQuery.query"
+    return run_benchmarks(
+        name,
+        Ns,
+        number,
+        BenchmarkLocalityNeighborQuery,
+        L=L,
+        query_args=query_args,
+        nq_type=freud.locality.AABBQuery,
+    )
+
+
+def run_query_types():
+    Ns = [1000, 10000, 100000]
+    number = 10
+    L = 30
+    r_max = 0.5
+
+    results = []
+    for nq_type in (freud.locality.AABBQuery, freud.locality.LinkCell):
+        for query_args in (
+            dict(r_max=r_max, exclude_ii=True),
+            dict(num_neighbors=4, exclude_ii=True),
+        ):
+            nq_kwargs = (
+                dict(cell_width=r_max) if nq_type is freud.locality.LinkCell else {}
+            )
+            name = "freud.locality.{}.query ({})".format(
+                nq_type.__name__, "ball" if "r_max" in query_args else "nearest"
+            )
+            results.append(
+                run_benchmarks(
+                    name,
+                    Ns,
+                    number,
+                    BenchmarkLocalityNeighborQuery,
+                    L=L,
+                    query_args=query_args,
+                    nq_type=nq_type,
+                    nq_kwargs=nq_kwargs,
+                )
+            )
+    return results
+
+
+def run_num_neighbors():
+    Ns = [10000, 100000]
+    number = 10
+    L = 30
+
+    results = []
+    for nq_type in (freud.locality.AABBQuery, freud.locality.LinkCell):
+        for num_neighbors in (4, 8, 16, 32, 64):
+            query_args = dict(num_neighbors=num_neighbors, exclude_ii=True)
+            nq_kwargs = dict(cell_width=1) if nq_type is freud.locality.LinkCell else {}
+            name = "freud.locality.{}.query (num_neighbors={})".format(
+                nq_type.__name__, num_neighbors
+            )
+            results.append(
+                run_benchmarks(
+                    name,
+                    Ns,
+                    number,
+                    BenchmarkLocalityNeighborQuery,
+                    L=L,
+                    query_args=query_args,
+                    nq_type=nq_type,
+                    nq_kwargs=nq_kwargs,
+                )
+            )
+    return results
+
+
+class BenchmarkLocalityNeighborQueryLoop(BenchmarkLocalityNeighborQuery):
+    """Benchmark a parallel loop over query points without a neighbor list.
+
+    The loop is driven by :class:`freud.density.RDF`, whose output is a small
+    histogram, so that the runtime is dominated by the per-point query
+    machinery, including any heap allocations it makes, rather than by
+    building a neighbor list.
+    """
+
+    def bench_setup(self, N):
+        super().bench_setup(N)
+        self.rdf = freud.density.RDF(bins=10, r_max=self.query_args["r_max"])
+
+    def bench_run(self, N):
+        self.rdf.compute(self.nq, neighbors=self.query_args)
+
+
+def run_query_loop():
+    Ns = [10000, 100000]
+    number = 10
+    L = 30
+    r_max = 0.5
+
+    results = []
+    for nq_type in (freud.locality.AABBQuery, freud.locality.LinkCell):
+        for query_args in (
+            dict(r_max=r_max, exclude_ii=True),
+            dict(r_max=r_max, num_neighbors=4, exclude_ii=True),
+        ):
+            nq_kwargs = (
+                dict(cell_width=r_max) if nq_type is freud.locality.LinkCell else {}
+            )
+            name = "freud.locality.{}.query loop ({})".format(
+                nq_type.__name__, "nearest" if "num_neighbors" in query_args else "ball"
+            )
+            results.append(
+                run_benchmarks(
+                    name,
+                    Ns,
+                    number,
+                    BenchmarkLocalityNeighborQueryLoop,
+                    L=L,
+                    query_args=query_args,
+                    nq_type=nq_type,
+                    nq_kwargs=nq_kwargs,
+                )
+            )
+    return results
+
+
+if __name__ == "__main__":
+    run_query_types()
+    run_num_neighbors()
+    run_query_loop()
@@ -6,9 +6,14 @@
 
 #include "utils.h"
 #include <algorithm>
-#include <complex>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <numeric>
 #include <sstream>
 #include <stdexcept>
+#include <tbb/enumerable_thread_specific.h>
+#include <vector>
 
 #include "VectorMath.h"
 
@@ -266,11 +271,49 @@ public:
     void makeFractional(const vec3<float>* vecs, unsigned int Nvecs, vec3<float>* out) const
     {
         util::forLoopWrapper(0, Nvecs, [=](size_t begin, size_t end) {
-            for (size_t i = begin; i < end; ++i)
+            makeFractionalBatch(vecs + begin, end - begin, out + begin);
+        });
+    }
+
+    //! Convert a contiguous range of points from absolute to fractional box coordinates.
+    /*! This is the serial kernel used by the parallel array overload. The box
+        parameters are hoisted out of the loop and orthorhombic boxes use a
+        separate loop without tilt terms, so the loop bodies are branch-free.
+        Results are identical to calling makeFractional on each vector.
+
+        \param vecs Vectors to convert
+        \param Nvecs Number of vectors
+        \param out The array in which to place the converted vectors (may be vecs).
+     */
+    void makeFractionalBatch(const vec3<float>* vecs, size_t Nvecs, vec3<float>* out) const
+    {
+        const vec3<float> lo(m_lo);
+        const vec3<float> L(m_L);
+        const float xy(m_xy);
+        const float yz(m_yz);
+        const float xz_eff(m_xz - m_yz * m_xy);
+        const bool is_2d(m_2d);
+
+        if (isOrthorhombic())
+        {
+            for (size_t i = 0; i < Nvecs; ++i)
             {
-                out[i] = makeFractional(vecs[i]);
+                const vec3<float> v(vecs[i]);
+                const float fz((v.z - lo.z) / L.z);
+                out[i] = vec3<float>((v.x - lo.x) / L.x, (v.y - lo.y) / L.y, is_2d ? float(0.0) : fz);
             }
-        });
+        }
+        else
+        {
+            for (size_t i = 0; i < Nvecs; ++i)
+            {
+                const vec3<float> v(vecs[i]);
+                const float fx(((v.x - lo.x) - (xz_eff * v.z + xy * v.y)) / L.x);
+                const float fy(((v.y - lo.y) - yz * v.z) / L.y);
+                const float fz((v.z - lo.z) / L.z);
+                out[i] = vec3<float>(fx, fy, is_2d ? float(0.0) : fz);
+            }
+        }
     }
 
     //! Get periodic image of a vector.
@@ -319,15 +362,15 @@ public:
         vec3<float> v_frac = makeFractional(v);
         if (m_periodic.x)
         {
-            v_frac.x = util::modulusPositive(v_frac.x, float(1.0));
+            v_frac.x = wrapFraction(v_frac.x);
         }
         if (m_periodic.y)
         {
-            v_frac.y = util::modulusPositive(v_frac.y, float(1.0));
+            v_frac.y = wrapFraction(v_frac.y);
         }
         if (m_periodic.z)
         {
-            v_frac.z = util::modulusPositive(v_frac.z, float(1.0));
+            v_frac.z = wrapFraction(v_frac.z);
         }
         return makeAbsolute(v_frac);
     }
@@ -340,11 +383,77 @@ public:
     void wrap(const vec3<float>* vecs, unsigned int Nvecs, vec3<float>* out) const
     {
         util::forLoopWrapper(0, Nvecs, [=](size_t begin, size_t end) {
-            for (size_t i = begin; i < end; ++i)
+            wrapBatch(vecs + begin, end - begin, out + begin);
+        });
+    }
+
+    //! Wrap a contiguous range of vectors back into the box.
+    /*! This is the serial kernel used by the parallel array overload and by
+        the bulk distance computations. The box parameters are hoisted out of
+        the loop, orthorhombic boxes use a separate loop without tilt terms,
+        and periodicity is applied with selects rather than branches. Results
+        are identical to calling wrap on each vector.
+
+        \param vecs Vectors to wrap
+        \param Nvecs Number of vectors
+        \param out The array in which to place the wrapped vectors (may be vecs).
+     */
+    void wrapBatch(const vec3<float>* vecs, size_t Nvecs, vec3<float>* out) const
+    {
+        if (!m_periodic.x && !m_periodic.y && !m_periodic.z)
+        {
+            if (vecs != out)
             {
-                out[i] = wrap(vecs[i]);
+                std::copy(vecs, vecs + Nvecs, out);
             }
-        });
+            return;
+        }
+
+        const vec3<float> lo(m_lo);
+        const vec3<float> L(m_L);
+        const float xy(m_xy);
+        const float xz(m_xz);
+        const float yz(m_yz);
+        const float xz_eff(m_xz - m_yz * m_xy);
+        const bool periodic_x(m_periodic.x);
+        const bool periodic_y(m_periodic.y);
+        const bool periodic_z(m_periodic.z);
+        const bool is_2d(m_2d);
+
+        if (isOrthorhombic())
+        {
+            for (size_t i = 0; i < Nvecs; ++i)
+            {
+                const vec3<float> v(vecs[i]);
+                float fx((v.x - lo.x) / L.x);
+                float fy((v.y - lo.y) / L.y);
+                float fz(is_2d ? float(0.0) : (v.z - lo.z) / L.z);
+                fx = periodic_x ? wrapFraction(fx) : fx;
+                fy = periodic_y ? wrapFraction(fy) : fy;
+                fz = periodic_z ? wrapFraction(fz) : fz;
+                const float z(lo.z + fz * L.z);
+                out[i] = vec3<float>(lo.x + fx * L.x, lo.y + fy * L.y, is_2d ? float(0.0) : z);
+            }
+        }
+        else
+        {
+            for (size_t i = 0; i < Nvecs; ++i)
+            {
+                const vec3<float> v(vecs[i]);
+                float fx(((v.x - lo.x) - (xz_eff * v.z + xy * v.y)) / L.x);
+                float fy(((v.y - lo.y) - yz * v.z) / L.y);
+                float fz(is_2d ? float(0.0) : (v.z - lo.z) / L.z);
+                fx = periodic_x ? wrapFraction(fx) : fx;
+                fy = periodic_y ? wrapFraction(fy) : fy;
+                fz = periodic_z ? wrapFraction(fz) : fz;
+                float x(lo.x + fx * L.x);
+                float y(lo.y + fy * L.y);
+                const float z(lo.z + fz * L.z);
+                x += xy * y + xz * z;
+                y += yz * z;
+                out[i] = vec3<float>(x, y, is_2d ? float(0.0) : z);
+            }
+        }
     }
 
     //! Unwrap given positions to their absolute location in place
@@ -374,26 +483,169 @@ public:
      *  \param masses Optional array of masses, of length Nvecs
      *  \return Center of mass as a vec3<float>
      */
-    vec3<float> centerOfMass(vec3<float>* vecs, size_t Nvecs, const float* masses = nullptr) const
+    vec3<float> centerOfMass(const vec3<float>* vecs, size_t Nvecs, const float* masses = nullptr) const
     {
-        // This roughly follows the implementation in
-        // https://en.wikipedia.org/wiki/Center_of_mass#Systems_with_periodic_boundary_conditions
-        float total_mass(0);
-        vec3<std::complex<float>> xi_mean;
+        vec3<float> center;
+        centerOfMassGroups(vecs, Nvecs, masses, nullptr, 1, &center);
+        return center;
+    }
+
+    //! Compute the center of mass of each group of vectors
+    /*! This roughly follows the implementation in
+        https://en.wikipedia.org/wiki/Center_of_mass#Systems_with_periodic_boundary_conditions
+        The mass-weighted phases of the fractional coordinates are summed in
+        double precision by a parallel reduction over all vectors, so every
+        group is computed in a single pass. Groups without any vectors or
+        with zero total mass have a center of NaN.
 
-        for (size_t i = 0; i < Nvecs; ++i)
+        \param vecs Vectors to compute center of mass
+        \param Nvecs Number of vectors
+        \param masses Optional array of masses, of length Nvecs
+        \param groups Optional array of length Nvecs containing the group of
+       each vector, which must be less than n_groups. If nullptr, all vectors
+       belong to group 0.
+        \param n_groups The number of groups.
+        \param centers Pointer to array of length n_groups containing the
+       center of mass of each group (overwritten in place).
+     */
+    void centerOfMassGroups(const vec3<float>* vecs, size_t Nvecs, const float* masses,
+                            const unsigned int* groups, unsigned int n_groups, vec3<float>* centers) const
+    {
+        // Each group accumulates its total mass and the sums of the cosines
+        // and sines of the phases in x, y, and z.
+        // The phases are computed in double precision as well, since the
+        // error of single precision trigonometry does not average out over
+        // large groups.
+        const size_t stride(7);
+        const double two_pi(2.0 * M_PI);
+        const auto accumulate = [&](size_t i, double* sum) {
+            const vec3<float> fraction(makeFractional(vecs[i]));
+            const double phase_x(two_pi * fraction.x);
+            const double phase_y(two_pi * fraction.y);
+            const double phase_z(two_pi * fraction.z);
+            const double mass = (masses != nullptr) ? masses[i] : 1.0;
+            sum[0] += mass;
+            sum[1] += mass * std::cos(phase_x);
+            sum[2] += mass * std::cos(phase_y);
+            sum[3] += mass * std::cos(phase_z);
+            sum[4] += mass * std::sin(phase_x);
+            sum[5] += mass * std::sin(phase_y);
+            sum[6] += mass * std::sin(phase_z);
+        };
+        const auto finish = [&](const double* sum, unsigned int group) {
+            vec3<float> fraction(std::numeric_limits<float>::quiet_NaN(),
+                                 std::numeric_limits<float>::quiet_NaN(),
+                                 std::numeric_limits<float>::quiet_NaN());
+            if (sum[0] != 0)
+            {
+                fraction = vec3<float>(std::atan2(sum[4], sum[1]) / two_pi,
+                                       std::atan2(sum[5], sum[2]) / two_pi,
+                                       std::atan2(sum[6], sum[3]) / two_pi);
+            }
+            centers[group] = wrap(makeAbsolute(fraction));
+        };
+
+        // Per-thread sums of every group are cheap for a few groups, but
+        // their size and the cost of combining them grow with the number of
+        // threads times the number of groups. Many groups are instead
+        // bucketed with a counting sort and each group is summed by one
+        // thread.
+        const unsigned int max_dense_groups(64);
+        if (groups == nullptr || n_groups <= max_dense_groups)
         {
-            vec3<float> phase(constants::TWO_PI * makeFractional(vecs[i]));
-            vec3<std::complex<float>> xi(std::polar(float(1.0), phase.x), std::polar(float(1.0), phase.y),
-                                         std::polar(float(1.0), phase.z));
-            float mass = (masses != nullptr) ? masses[i] : float(1.0);
-            total_mass += mass;
-            xi_mean += std::complex<float>(mass, 0) * xi;
+            const size_t sums_size(stride * n_groups);
+            tbb::enumerable_thread_specific<std::vector<double>> local_sums(
+                [sums_size]() { return std::vector<double>(sums_size, 0); });
+            util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+                std::vector<double>& sums = local_sums.local();
+                for (size_t i = begin; i < end; ++i)
+                {
+                    accumulate(i, sums.data() + stride * ((groups != nullptr) ? groups[i] : 0));
+                }
+            });
+
+            std::vector<double> group_sum(stride);
+            for (unsigned int group = 0; group < n_groups; ++group)
+            {
+                std::fill(group_sum.begin(), group_sum.end(), 0);
+                for (const auto& sums : local_sums)
+                {
+                    for (size_t k = 0; k < stride; ++k)
+                    {
+                        group_sum[k] += sums[stride * group + k];
+                    }
+                }
+                finish(group_sum.data(), group);
+            }
+            return;
         }
-        xi_mean /= std::complex<float>(total_mass, 0);
 
-        return wrap(makeAbsolute(vec3<float>(std::arg(xi_mean.x), std::arg(xi_mean.y), std::arg(xi_mean.z))
-                                 / constants::TWO_PI));
+        // The counting sort is parallel over blocks of vectors: the members
+        // of each group in each block are counted, the counts are scanned to
+        // find where each block writes the members of each group, and the
+        // blocks are then scattered independently. Blocks hold at least
+        // n_groups vectors, so the counts take no more memory than the
+        // vectors themselves.
+        const size_t num_groups(n_groups);
+        const size_t block_size(std::max<size_t>(16384, num_groups));
+        const size_t num_blocks((Nvecs + block_size - 1) / block_size);
+        std::vector<size_t> block_cursors(num_blocks * num_groups, 0);
+        util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+            for (size_t block = begin; block < end; ++block)
+            {
+                size_t* counts = block_cursors.data() + block * num_groups;
+                const size_t i_end(std::min(Nvecs, (block + 1) * block_size));
+                for (size_t i = block * block_size; i < i_end; ++i)
+                {
+                    ++counts[groups[i]];
+                }
+            }
+        });
+
+        // Each group's counts are scanned over the blocks, giving the
+        // position of each block's members within the group.
+        std::vector<size_t> group_offsets(num_groups + 1, 0);
+        util::forLoopWrapper(0, num_groups, [&](size_t begin, size_t end) {
+            for (size_t group = begin; group < end; ++group)
+            {
+                size_t group_size(0);
+                for (size_t block = 0; block < num_blocks; ++block)
+                {
+                    const size_t count(block_cursors[block * num_groups + group]);
+                    block_cursors[block * num_groups + group] = group_size;
+                    group_size += count;
+                }
+                group_offsets[group + 1] = group_size;
+            }
+        });
+        std::partial_sum(group_offsets.begin(), group_offsets.end(), group_offsets.begin());
+
+        std::vector<size_t> group_members(Nvecs);
+        util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+            for (size_t block = begin; block < end; ++block)
+            {
+                size_t* cursors = block_cursors.data() + block * num_groups;
+                const size_t i_end(std::min(Nvecs, (block + 1) * block_size));
+                for (size_t i = block * block_size; i < i_end; ++i)
+                {
+                    const unsigned int group(groups[i]);
+                    group_members[group_offsets[group] + cursors[group]++] = i;
+                }
+            }
+        });
+
+        util::forLoopWrapper(0, n_groups, [&](size_t begin, size_t end) {
+            double sum[stride];
+            for (size_t group = begin; group < end; ++group)
+            {
+                std::fill(sum, sum + stride, 0);
+                for (size_t member = group_offsets[group]; member < group_offsets[group + 1]; ++member)
+                {
+                    accumulate(group_members[member], sum);
+                }
+                finish(sum, static_cast<unsigned int>(group));
+            }
+        });
     }
 
     //! Subtract center of mass from vectors
@@ -407,8 +659,9 @@ public:
         util::forLoopWrapper(0, Nvecs, [=](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
-                vecs[i] = wrap(vecs[i] - com);
+                vecs[i] -= com;
             }
+            wrapBatch(vecs + begin, end - begin, vecs + begin);
         });
     }
 
@@ -437,10 +690,17 @@ public:
         {
             throw std::invalid_argument("The number of query points and points must match.");
         }
+        const size_t block_size(1024);
         util::forLoopWrapper(0, n_query_points, [&](size_t begin, size_t end) {
-            for (size_t i = begin; i < end; ++i)
+            std::vector<vec3<float>> deltas(std::min(end - begin, block_size));
+            for (size_t block = begin; block < end; block += block_size)
             {
-                distances[i] = computeDistance(query_points[i], points[i]);
+                const size_t block_end = std::min(end, block + block_size);
+                for (size_t i = block; i < block_end; ++i)
+                {
+                    deltas[i - block] = points[i] - query_points[i];
+                }
+                computeWrappedLengths(deltas.data(), block_end - block, distances + block);
             }
         });
     }
@@ -458,16 +718,175 @@ public:
     {
         util::forLoopWrapper2D(
             0, n_query_points, 0, n_points, [&](size_t begin_n, size_t end_n, size_t begin_m, size_t end_m) {
+                std::vector<vec3<float>> deltas(end_m - begin_m);
                 for (size_t i = begin_n; i < end_n; ++i)
                 {
                     for (size_t j = begin_m; j < end_m; ++j)
                     {
-                        distances[i * n_points + j] = computeDistance(query_points[i], points[j]);
+                        deltas[j - begin_m] = points[j] - query_points[i];
+                    }
+                    computeWrappedLengths(deltas.data(), end_m - begin_m, distances + i * n_points + begin_m);
+                }
+            });
+    }
+
+    //! Apply a reduction to all pairwise distances, one tile of the distance matrix at a time.
+    /*! The full distance matrix is never stored. Rows of query points are
+        distributed across threads, and each thread computes tiles of at most
+        16 query points by 1024 points into a buffer of bounded size before
+        calling reduce(begin_row, end_row, begin_col, end_col, tile). The tile
+        is stored row-major with end_col - begin_col columns. All tiles of a
+        given query point are passed to the same thread in order of increasing
+        column.
+
+        \param query_points Query point positions.
+        \param n_query_points The number of query points.
+        \param points Point positions.
+        \param n_points The number of points.
+        \param reduce Function called with each tile of distances.
+    */
+    template<typename Reduce>
+    void reduceAllDistances(const vec3<float>* query_points, const unsigned int n_query_points,
+                            const vec3<float>* points, const unsigned int n_points,
+                            const Reduce& reduce) const
+    {
+        const size_t tile_rows(16);
+        const size_t tile_cols(1024);
+        util::forLoopWrapper(0, n_query_points, [&](size_t begin, size_t end) {
+            std::vector<float> tile(tile_rows * std::min(tile_cols, static_cast<size_t>(n_points)));
+            std::vector<vec3<float>> deltas(std::min(tile_cols, static_cast<size_t>(n_points)));
+            for (size_t begin_row = begin; begin_row < end; begin_row += tile_rows)
+            {
+                const size_t end_row = std::min(end, begin_row + tile_rows);
+                for (size_t begin_col = 0; begin_col < n_points; begin_col += tile_cols)
+                {
+                    const size_t end_col = std::min(static_cast<size_t>(n_points), begin_col + tile_cols);
+                    const size_t num_cols = end_col - begin_col;
+                    for (size_t i = begin_row; i < end_row; ++i)
+                    {
+                        for (size_t j = begin_col; j < end_col; ++j)
+                        {
+                            deltas[j - begin_col] = points[j] - query_points[i];
+                        }
+                        computeWrappedLengths(deltas.data(), num_cols,
+                                              tile.data() + (i - begin_row) * num_cols);
+                    }
+                    reduce(begin_row, end_row, begin_col, end_col, static_cast<const float*>(tile.data()));
+                }
+            }
+        });
+    }
+
+    //! Calculate the distance from each query point to its nearest point.
+    /*! \param query_points Query point positions.
+        \param n_query_points The number of query points.
+        \param points Point positions.
+        \param n_points The number of points.
+        \param min_distances Pointer to array of length n_query_points containing the distance from each
+       query point to its nearest point (overwritten in place).
+        \param min_indices Pointer to array of length n_query_points containing the index of the nearest
+       point to each query point, the smallest index in case of ties (overwritten in place).
+    */
+    void computeMinDistances(const vec3<float>* query_points, const unsigned int n_query_points,
+                             const vec3<float>* points, const unsigned int n_points, float* min_distances,
+                             unsigned int* min_indices) const
+    {
+        std::fill(min_distances, min_distances + n_query_points, std::numeric_limits<float>::infinity());
+        std::fill(min_indices, min_indices + n_query_points, std::numeric_limits<unsigned int>::max());
+        reduceAllDistances(
+            query_points, n_query_points, points, n_points,
+            [&](size_t begin_row, size_t end_row, size_t begin_col, size_t end_col, const float* tile) {
+                const size_t num_cols = end_col - begin_col;
+                for (size_t i = begin_row; i < end_row; ++i)
+                {
+                    const float* row = tile + (i - begin_row) * num_cols;
+                    const float* nearest = std::min_element(row, row + num_cols);
+                    if (*nearest < min_distances[i])
+                    {
+                        min_distances[i] = *nearest;
+                        min_indices[i] = static_cast<unsigned int>(begin_col + (nearest - row));
                     }
                 }
             });
     }
 
+    //! Count the points closer than a cutoff distance to each query point.
+    /*! \param query_points Query point positions.
+        \param n_query_points The number of query points.
+        \param points Point positions.
+        \param n_points The number of points.
+        \param r_max Cutoff distance. Points at distances less than r_max are counted.
+        \param counts Pointer to array of length n_query_points containing the number of points within r_max
+       of each query point (overwritten in place).
+    */
+    void countDistances(const vec3<float>* query_points, const unsigned int n_query_points,
+                        const vec3<float>* points, const unsigned int n_points, float r_max,
+                        unsigned int* counts) const
+    {
+        std::fill(counts, counts + n_query_points, 0);
+        reduceAllDistances(
+            query_points, n_query_points, points, n_points,
+            [&](size_t begin_row, size_t end_row, size_t begin_col, size_t end_col, const float* tile) {
+                const size_t num_cols = end_col - begin_col;
+                for (size_t i = begin_row; i < end_row; ++i)
+                {
+                    const float* row = tile + (i - begin_row) * num_cols;
+                    counts[i] += static_cast<unsigned int>(std::count_if(
+                        row, row + num_cols, [r_max](float distance) { return distance < r_max; }));
+                }
+            });
+    }
+
+    //! Compute a histogram of all pairwise distances between a set of query points and points.
+    /*! \param query_points Query point positions.
+        \param n_query_points The number of query points.
+        \param points Point positions.
+        \param n_points The number of points.
+        \param bins The number of bins, evenly spaced in [0, r_max).
+        \param r_max Upper edge of the last bin. Pairs at distances of r_max or more are not counted.
+        \param histogram Pointer to array of length bins containing the number of pairs in each bin
+       (overwritten in place).
+    */
+    void computeDistanceHistogram(const vec3<float>* query_points, const unsigned int n_query_points,
+                                  const vec3<float>* points, const unsigned int n_points, unsigned int bins,
+                                  float r_max, uint64_t* histogram) const
+    {
+        if (bins == 0)
+        {
+            throw std::invalid_argument("The number of bins must be positive.");
+        }
+        if (r_max <= 0)
+        {
+            throw std::invalid_argument("r_max must be positive.");
+        }
+        const float bin_scale = static_cast<float>(bins) / r_max;
+        tbb::enumerable_thread_specific<std::vector<uint64_t>> local_histograms(
+            [bins]() { return std::vector<uint64_t>(bins, 0); });
+        reduceAllDistances(
+            query_points, n_query_points, points, n_points,
+            [&](size_t begin_row, size_t end_row, size_t begin_col, size_t end_col, const float* tile) {
+                std::vector<uint64_t>& local_histogram = local_histograms.local();
+                const float* tile_end = tile + (end_row - begin_row) * (end_col - begin_col);
+                for (const float* distance = tile; distance != tile_end; ++distance)
+                {
+                    if (*distance < r_max)
+                    {
+                        // Rounding may place distances just below r_max at index bins.
+                        const auto bin = std::min(static_cast<unsigned int>(*distance * bin_scale), bins - 1);
+                        ++local_histogram[bin];
+                    }
+                }
+            });
+        std::fill(histogram, histogram + bins, 0);
+        for (const auto& local_histogram : local_histograms)
+        {
+            for (unsigned int bin = 0; bin < bins; ++bin)
+            {
+                histogram[bin] += local_histogram[bin];
+            }
+        }
+    }
+
     //! Get mask of points that fit inside the box.
     /*! \param points Point positions.
         \param n_points The number of points.
@@ -600,6 +1019,39 @@ public:
     }
 
 private:
+    //! Check whether all tilt factors are zero.
+    bool isOrthorhombic() const
+    {
+        return m_xy == float(0.0) && m_xz == float(0.0) && m_yz == float(0.0);
+    }
+
+    //! Map a fractional coordinate into [0, 1).
+    /*! Equivalent to util::modulusPositive(f, 1), but computed with a
+        truncation instead of two calls to fmod so that it can be evaluated
+        without branches. Values whose magnitude is at least 2^23 have no
+        fractional part and map to 0, while infinities and NaN map to NaN.
+     */
+    static inline float wrapFraction(float f)
+    {
+        const bool in_range = std::abs(f) < float(8388608.0);
+        const float clamped = in_range ? f : float(0.0);
+        int floored = static_cast<int>(clamped);
+        floored -= static_cast<int>(static_cast<float>(floored) > clamped);
+        float fraction = clamped - static_cast<float>(floored);
+        fraction = (fraction < float(1.0)) ? fraction : float(0.0);
+        return in_range ? fraction : f * float(0.0) + float(0.0);
+    }
+
+    //! Wrap difference vectors in place and store their lengths.
+    void computeWrappedLengths(vec3<float>* deltas, size_t n, float* lengths) const
+    {
+        wrapBatch(deltas, n, deltas);
+        for (size_t i = 0; i < n; ++i)
+        {
+            lengths[i] = std::sqrt(dot(deltas[i], deltas[i]));
+        }
+    }
+
     vec3<float> m_lo;      //!< Minimum coords in the box
     vec3<float> m_hi;      //!< Maximum coords in the box
     vec3<float> m_L;       //!< L precomputed (used to avoid subtractions in boundary conditions)
@@ -611,6 +1063,122 @@ private:
     bool m_2d;             //!< Specify whether box is 2D.
 };
 
+//! Apply an operation to every vector of a trajectory whose frames each have their own box.
+/*! The vectors of all frames are processed by a single parallel loop.
+
+    \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param Nvecs The number of vectors in each frame.
+    \param body Function called as body(box, index) for the vector at index frame * Nvecs + i.
+*/
+template<typename Body>
+inline void forEachFrameVector(const Box* boxes, unsigned int n_frames, unsigned int Nvecs, const Body& body)
+{
+    util::forLoopWrapper2D(0, n_frames, 0, Nvecs,
+                           [&](size_t begin_frame, size_t end_frame, size_t begin_vec, size_t end_vec) {
+                               for (size_t frame = begin_frame; frame < end_frame; ++frame)
+                               {
+                                   const Box& box = boxes[frame];
+                                   const size_t end = frame * Nvecs + end_vec;
+                                   for (size_t i = frame * Nvecs + begin_vec; i < end; ++i)
+                                   {
+                                       body(box, i);
+                                   }
+                               }
+                           });
+}
+
+//! Convert fractional coordinates of each frame into absolute coordinates using the frame's box.
+/*! \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param vecs Array of n_frames * Nvecs fractional coordinates, stored frame by frame.
+    \param Nvecs The number of vectors in each frame.
+    \param out Array of n_frames * Nvecs absolute coordinates (overwritten in place).
+*/
+inline void makeAbsoluteFrames(const Box* boxes, unsigned int n_frames, const vec3<float>* vecs,
+                               unsigned int Nvecs, vec3<float>* out)
+{
+    forEachFrameVector(boxes, n_frames, Nvecs,
+                       [&](const Box& box, size_t i) { out[i] = box.makeAbsolute(vecs[i]); });
+}
+
+//! Convert absolute coordinates of each frame into fractional coordinates using the frame's box.
+/*! \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param vecs Array of n_frames * Nvecs absolute coordinates, stored frame by frame.
+    \param Nvecs The number of vectors in each frame.
+    \param out Array of n_frames * Nvecs fractional coordinates (overwritten in place).
+*/
+inline void makeFractionalFrames(const Box* boxes, unsigned int n_frames, const vec3<float>* vecs,
+                                 unsigned int Nvecs, vec3<float>* out)
+{
+    util::forLoopWrapper2D(0, n_frames, 0, Nvecs,
+                           [&](size_t begin_frame, size_t end_frame, size_t begin_vec, size_t end_vec) {
+                               for (size_t frame = begin_frame; frame < end_frame; ++frame)
+                               {
+                                   const size_t offset = frame * Nvecs + begin_vec;
+                                   boxes[frame].makeFractionalBatch(vecs + offset, end_vec - begin_vec,
+                                                                    out + offset);
+                               }
+                           });
+}
+
+//! Get the periodic images of the vectors of each frame using the frame's box.
+/*! \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param vecs Array of n_frames * Nvecs vectors, stored frame by frame.
+    \param Nvecs The number of vectors in each frame.
+    \param res Array of n_frames * Nvecs images (overwritten in place).
+*/
+inline void getImagesFrames(const Box* boxes, unsigned int n_frames, const vec3<float>* vecs,
+                            unsigned int Nvecs, vec3<int>* res)
+{
+    forEachFrameVector(boxes, n_frames, Nvecs,
+                       [&](const Box& box, size_t i) { box.getImage(vecs[i], res[i]); });
+}
+
+//! Wrap the vectors of each frame into the frame's box.
+/*! \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param vecs Array of n_frames * Nvecs vectors, stored frame by frame.
+    \param Nvecs The number of vectors in each frame.
+    \param out Array of n_frames * Nvecs wrapped vectors (overwritten in place).
+*/
+inline void wrapFrames(const Box* boxes, unsigned int n_frames, const vec3<float>* vecs, unsigned int Nvecs,
+                       vec3<float>* out)
+{
+    util::forLoopWrapper2D(0, n_frames, 0, Nvecs,
+                           [&](size_t begin_frame, size_t end_frame, size_t begin_vec, size_t end_vec) {
+                               for (size_t frame = begin_frame; frame < end_frame; ++frame)
+                               {
+                                   const size_t offset = frame * Nvecs + begin_vec;
+                                   boxes[frame].wrapBatch(vecs + offset, end_vec - begin_vec, out + offset);
+                               }
+                           });
+}
+
+//! Unwrap the vectors of each frame using their images in the frame's box.
+/*! \param boxes Array of n_frames boxes, one for each frame.
+    \param n_frames The number of frames.
+    \param vecs Array of n_frames * Nvecs vectors, stored frame by frame.
+    \param images Array of n_frames * Nvecs image indices.
+    \param Nvecs The number of vectors in each frame.
+    \param out Array of n_frames * Nvecs unwrapped vectors (overwritten in place).
+*/
+inline void unwrapFrames(const Box* boxes, unsigned int n_frames, const vec3<float>* vecs,
+                         const vec3<int>* images, unsigned int Nvecs, vec3<float>* out)
+{
+    forEachFrameVector(boxes, n_frames, Nvecs, [&](const Box& box, size_t i) {
+        vec3<float> unwrapped = vecs[i] + box.getLatticeVector(0) * float(images[i].x)
+            + box.getLatticeVector(1) * float(images[i].y);
+        if (!box.is2D())
+        {
+            unwrapped += box.getLatticeVector(2) * float(images[i].z);
+        }
+        out[i] = unwrapped;
+    });
+}
+
 }; }; // end namespace freud::box
 
 #endif // BOX_H
@@ -2,12 +2,16 @@
 // This file is from the freud project, released under the BSD 3-Clause License.
 
 #include <algorithm>
+#include <cstdint>
 #include <numeric>
+#include <tbb/parallel_sort.h>
+#include <vector>
 
 #include "Cluster.h"
 #include "NeighborBond.h"
 #include "NeighborComputeFunctional.h"
 #include "dset/dset.h"
+#include "utils.h"
 
 //! Finds clusters using a network of neighbors.
 namespace freud { namespace cluster {
@@ -19,7 +23,9 @@ void Cluster::compute(const freud::locality::NeighborQuery* nq, const freud::loc
     m_cluster_idx.prepare(num_points);
     DisjointSets dj(num_points);
 
-    freud::locality::loopOverNeighbors(
+    // Merging is symmetric, so each pair only needs to be found once.
+    freud::locality::enableHalfQuery(nq, nlist, nq->getPoints(), num_points, qargs);
+    freud::locality::loopOverNeighbors<false>(
         nq, nq->getPoints(), num_points, qargs, nlist,
         [&dj](const freud::locality::NeighborBond& neighbor_bond) {
             // Merge the two sets using the disjoint set
@@ -30,94 +36,107 @@ void Cluster::compute(const freud::locality::NeighborQuery* nq, const freud::loc
         });
 
     // Done looping over points. All clusters are now determined.
-    // Next, we renumber clusters from zero to num_clusters-1.
-    // These new cluster indexes are then sorted by cluster size from largest
-    // to smallest, with equally-sized clusters sorted based on their minimum
-    // point index.
-    std::vector<size_t> cluster_label(num_points, num_points);
-    std::vector<size_t> cluster_label_count(num_points);
-    std::vector<size_t> cluster_min_id(num_points, num_points);
-
-    // Loop over every point.
-    m_num_clusters = 0;
-    for (size_t i = 0; i < num_points; i++)
-    {
-        size_t s = dj.find(i);
-
-        // Label this cluster if we haven't seen it yet.
-        if (cluster_label[s] == num_points)
+    // Sort the points by the root of their set and then by index, so that
+    // each cluster becomes a contiguous segment starting at its minimum point
+    // index. Roots and indices are packed into a single integer key.
+    std::vector<uint64_t> sorted_points(num_points);
+    util::forLoopWrapper(0, num_points, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
         {
-            // Label this cluster uniquely.
-            cluster_label[s] = m_num_clusters;
-            // Track the smallest point index in this cluster.
-            cluster_min_id[cluster_label[s]] = i;
-            // Increment the count of unique clusters.
-            m_num_clusters++;
+            sorted_points[i] = (static_cast<uint64_t>(dj.find(i)) << 32) | i;
         }
-
-        // Increment the counter for this cluster label.
-        cluster_label_count[cluster_label[s]]++;
-    }
-
-    // Resize label counts and min ids to the number of unique clusters found.
-    cluster_label_count.resize(m_num_clusters);
-    cluster_label_count.shrink_to_fit();
-    cluster_min_id.resize(m_num_clusters);
-    cluster_min_id.shrink_to_fit();
-
-    // Get a permutation that reorders clusters, largest to smallest.
-    std::vector<size_t> cluster_reindex = sort_indexes_inverse(cluster_label_count, cluster_min_id);
-
-    // Clear the cluster keys
-    m_cluster_keys = std::vector<std::vector<unsigned int>>(m_num_clusters, std::vector<unsigned int>());
-
-    /* Loop over all points, set their cluster ids and add them to a list of
-     * sets. Each set contains all the keys that are part of that cluster. If
-     * no keys are provided, the keys use point ids. Get the computed list
-     * with getClusterKeys().
-     */
-    for (size_t i = 0; i < num_points; i++)
-    {
-        size_t s = dj.find(i);
-        size_t cluster_idx = cluster_reindex[cluster_label[s]];
-        m_cluster_idx[i] = cluster_idx;
-        unsigned int key = i;
-        if (keys != nullptr)
+    });
+    tbb::parallel_sort(sorted_points.begin(), sorted_points.end());
+
+    // Find the start of every segment. Blocks of points are scanned in
+    // parallel, first to count the segment starts in each block and then to
+    // write them out in order.
+    const auto is_segment_start = [&sorted_points](size_t k) {
+        return k == 0 || (sorted_points[k] >> 32) != (sorted_points[k - 1] >> 32);
+    };
+    const size_t block_size(16384);
+    const size_t num_blocks((num_points + block_size - 1) / block_size);
+    std::vector<size_t> block_offsets(num_blocks + 1, 0);
+    util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+        for (size_t block = begin; block < end; ++block)
         {
-            key = keys[i];
+            const size_t block_end(std::min(static_cast<size_t>(num_points), (block + 1) * block_size));
+            size_t num_starts(0);
+            for (size_t k = block * block_size; k < block_end; ++k)
+            {
+                num_starts += static_cast<size_t>(is_segment_start(k));
+            }
+            block_offsets[block + 1] = num_starts;
         }
-        m_cluster_keys[cluster_idx].push_back(key);
-    }
-}
+    });
+    std::partial_sum(block_offsets.begin(), block_offsets.end(), block_offsets.begin());
+    m_num_clusters = block_offsets[num_blocks];
 
-// Returns inverse permutation of cluster indexes, sorted from largest to smallest.
-// Adapted from https://stackoverflow.com/questions/1577475/c-sorting-and-keeping-track-of-indexes
-std::vector<size_t> Cluster::sort_indexes_inverse(const std::vector<size_t>& counts,
-                                                  const std::vector<size_t>& min_ids)
-{
-    // Initialize original index locations.
-    std::vector<size_t> idx(counts.size());
-    std::iota(idx.begin(), idx.end(), 0);
+    std::vector<size_t> segment_starts(m_num_clusters + 1);
+    segment_starts[m_num_clusters] = num_points;
+    util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+        for (size_t block = begin; block < end; ++block)
+        {
+            const size_t block_end(std::min(static_cast<size_t>(num_points), (block + 1) * block_size));
+            size_t segment(block_offsets[block]);
+            for (size_t k = block * block_size; k < block_end; ++k)
+            {
+                if (is_segment_start(k))
+                {
+                    segment_starts[segment++] = k;
+                }
+            }
+        }
+    });
 
-    // Sort indexes based on comparing values in counts, min_ids.
-    std::sort(idx.begin(), idx.end(), [&counts, &min_ids](size_t i1, size_t i2) {
-        if (counts[i1] != counts[i2])
+    // Renumber clusters from zero to num_clusters-1, sorted by cluster size
+    // from largest to smallest, with equally-sized clusters sorted based on
+    // their minimum point index.
+    const auto segment_size
+        = [&segment_starts](size_t segment) { return segment_starts[segment + 1] - segment_starts[segment]; };
+    const auto segment_min_id = [&](size_t segment) {
+        return static_cast<uint32_t>(sorted_points[segment_starts[segment]]);
+    };
+    std::vector<size_t> cluster_segments(m_num_clusters);
+    std::iota(cluster_segments.begin(), cluster_segments.end(), 0);
+    tbb::parallel_sort(cluster_segments.begin(), cluster_segments.end(), [&](size_t s1, size_t s2) {
+        if (segment_size(s1) != segment_size(s2))
         {
-            // If the counts are unequal, return the largest cluster first.
-            return counts[i1] > counts[i2];
+            // If the sizes are unequal, return the largest cluster first.
+            return segment_size(s1) > segment_size(s2);
         }
-        // If the counts are equal, return the cluster with the smallest
+        // If the sizes are equal, return the cluster with the smallest
         // point id first.
-        return min_ids[i1] < min_ids[i2];
+        return segment_min_id(s1) < segment_min_id(s2);
     });
 
-    // Invert the permutation.
-    std::vector<size_t> inv_idx(idx.size());
-    for (size_t i = 0; i < idx.size(); i++)
+    m_cluster_key_offsets.prepare(m_num_clusters + 1);
+    for (size_t cluster = 0; cluster < m_num_clusters; ++cluster)
     {
-        inv_idx[idx[i]] = i;
+        m_cluster_key_offsets[cluster + 1]
+            = m_cluster_key_offsets[cluster] + segment_size(cluster_segments[cluster]);
     }
-    return inv_idx;
+
+    /* Loop over all points in cluster order, set their cluster ids and store
+     * the keys of each cluster contiguously. If no keys are provided, the keys
+     * use point ids. Get the computed keys with getClusterKeys().
+     */
+    m_cluster_keys.prepare(num_points);
+    const size_t* offsets = m_cluster_key_offsets.get();
+    util::forLoopWrapper(0, num_points, [&](size_t begin, size_t end) {
+        size_t cluster = std::upper_bound(offsets, offsets + m_num_clusters + 1, begin) - offsets - 1;
+        for (size_t key_index = begin; key_index < end; ++key_index)
+        {
+            while (key_index >= offsets[cluster + 1])
+            {
+                ++cluster;
+            }
+            const size_t k = segment_starts[cluster_segments[cluster]] + (key_index - offsets[cluster]);
+            const auto point = static_cast<uint32_t>(sorted_points[k]);
+            m_cluster_idx[point] = cluster;
+            m_cluster_keys[key_index] = (keys != nullptr) ? keys[point] : point;
+        }
+    });
 }
 
 }; }; // end namespace freud::cluster
@@ -4,8 +4,6 @@
 #ifndef CLUSTER_H
 #define CLUSTER_H
 
-#include <vector>
-
 #include "ManagedArray.h"
 #include "NeighborList.h"
 #include "NeighborQuery.h"
@@ -33,9 +31,12 @@ namespace freud { namespace cluster {
  *  the cluster_idx array. Given a key value per point (e.g. the polymer id),
  *  the compute function will process clusters with the key values in mind and
  *  provide a list of keys that are present in each cluster in the attribute
- *  cluster_keys, as a list of lists. If keys are not provided, every point is
- *  assigned a key corresponding to its index, and cluster_keys contains the
- *  point ids present in each cluster.
+ *  cluster_keys. The keys are stored in compressed sparse row form: the keys
+ *  of cluster c are cluster_keys[cluster_key_offsets[c]] to
+ *  cluster_keys[cluster_key_offsets[c + 1] - 1], in order of increasing point
+ *  index. If keys are not provided, every point is assigned a key
+ *  corresponding to its index, and cluster_keys contains the point ids
+ *  present in each cluster.
  */
 class Cluster
 {
@@ -59,22 +60,23 @@ public:
         return m_cluster_idx;
     }
 
-    //! Get a reference to the cluster keys.
-    const std::vector<std::vector<unsigned int>>& getClusterKeys() const
+    //! Get a reference to the keys of all clusters, stored cluster by cluster.
+    const util::ManagedArray<unsigned int>& getClusterKeys() const
     {
         return m_cluster_keys;
     }
 
-private:
-    unsigned int m_num_clusters;                           //!< Number of clusters found
-    util::ManagedArray<unsigned int> m_cluster_idx;        //!< Cluster index for each point
-    std::vector<std::vector<unsigned int>> m_cluster_keys; //!< List of keys in each cluster
+    //! Get a reference to the offsets of each cluster's keys in getClusterKeys().
+    const util::ManagedArray<size_t>& getClusterKeyOffsets() const
+    {
+        return m_cluster_key_offsets;
+    }
 
-    // Returns inverse permutation of cluster indices, sorted from largest to
-    // smallest. Adapted from
-    // https://stackoverflow.com/questions/1577475/c-sorting-and-keeping-track-of-indexes
-    static std::vector<size_t> sort_indexes_inverse(const std::vector<size_t>& counts,
-                                                    const std::vector<size_t>& min_ids);
+private:
+    unsigned int m_num_clusters;                      //!< Number of clusters found
+    util::ManagedArray<unsigned int> m_cluster_idx;   //!< Cluster index for each point
+    util::ManagedArray<unsigned int> m_cluster_keys;  //!< Keys in each cluster, stored cluster by cluster
+    util::ManagedArray<size_t> m_cluster_key_offsets; //!< Offset of the first key of each cluster
 };
 
 }; }; // end namespace freud::cluster
@@ -1,8 +1,6 @@
 // Copyright (c) 2010-2020 The Regents of the University of Michigan
 // This file is from the freud project, released under the BSD 3-Clause License.
 
-#include <vector>
-
 #include "ClusterProperties.h"
 #include "NeighborComputeFunctional.h"
 
@@ -33,25 +31,15 @@ void ClusterProperties::compute(const freud::locality::NeighborQuery* nq, const
     m_cluster_gyrations.prepare({num_clusters, 3, 3});
     m_cluster_sizes.prepare(num_clusters);
 
-    // Create a vector to store cluster points, used to compute center of mass
-    std::vector<std::vector<vec3<float>>> cluster_points(num_clusters, std::vector<vec3<float>>());
-
-    // Start by determining the center of mass of each cluster. Since we are
-    // given an array of points, the easiest way to do this is to loop over
-    // all points and add the appropriate information to m_cluster_centers as
-    // we go.
+    // Count the points in each cluster
     for (unsigned int i = 0; i < nq->getNPoints(); i++)
     {
-        const unsigned int c = cluster_idx[i];
-        cluster_points[c].push_back((*nq)[i]);
-        m_cluster_sizes[c]++;
+        m_cluster_sizes[cluster_idx[i]]++;
     }
 
-    // Now that we have located all of the cluster vectors, compute the centers
-    for (unsigned int c = 0; c < num_clusters; c++)
-    {
-        m_cluster_centers[c] = nq->getBox().centerOfMass(cluster_points[c].data(), m_cluster_sizes[c]);
-    }
+    // Compute the centers of mass of all clusters in a single pass over the points
+    nq->getBox().centerOfMassGroups(nq->getPoints(), nq->getNPoints(), nullptr, cluster_idx, num_clusters,
+                                    m_cluster_centers.get());
 
     // Now that we have determined the centers of mass for each cluster, tally
     // up the gyration tensor. This has to be done in a loop over the points.
@@ -88,7 +88,7 @@ void CorrelationFunction<T>::accumulate(const freud::locality::NeighborQuery* ne
                                         const freud::locality::NeighborList* nlist,
                                         freud::locality::QueryArgs qargs)
 {
-    accumulateGeneral(
+    accumulateGeneral<false>(
         neighbor_query, query_points, n_query_points, nlist, qargs,
         [=](const freud::locality::NeighborBond& neighbor_bond) {
             size_t value_bin = m_histogram.bin({neighbor_bond.distance});
@@ -26,7 +26,7 @@ void LocalDensity::compute(const freud::locality::NeighborQuery* neighbor_query,
     const float area = M_PI * m_r_max * m_r_max;
     const float volume = static_cast<float>(4.0 / 3.0 * M_PI) * m_r_max * m_r_max * m_r_max;
     // compute the local density
-    freud::locality::loopOverNeighborsIterator(
+    freud::locality::loopOverNeighborsIterator<false>(
         neighbor_query, query_points, n_query_points, qargs, nlist,
         [=](size_t i, const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
             float num_neighbors = 0;
@@ -83,10 +83,14 @@ void RDF::accumulate(const freud::locality::NeighborQuery* neighbor_query, const
                      unsigned int n_query_points, const freud::locality::NeighborList* nlist,
                      freud::locality::QueryArgs qargs)
 {
-    accumulateGeneral(neighbor_query, query_points, n_query_points, nlist, qargs,
-                      [=](const freud::locality::NeighborBond& neighbor_bond) {
-                          m_local_histograms(neighbor_bond.distance);
-                      });
+    // For a self-query each pair can be found once and counted for both points.
+    const bool half
+        = freud::locality::enableHalfQuery(neighbor_query, nlist, query_points, n_query_points, qargs);
+    const util::Weight<unsigned int> weight(half ? 2 : 1);
+    accumulateGeneral<false>(neighbor_query, query_points, n_query_points, nlist, qargs,
+                             [=](const freud::locality::NeighborBond& neighbor_bond) {
+                                 m_local_histograms(neighbor_bond.distance, weight);
+                             });
 }
 
 }; }; // end namespace freud::density
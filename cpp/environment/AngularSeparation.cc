@@ -62,15 +62,16 @@ void AngularSeparationNeighbor::compute(const locality::NeighborQuery* nq, const
     const size_t tot_num_neigh = m_nlist.getNumBonds();
     m_angles.prepare(tot_num_neigh);
 
+    const auto& query_point_indices = m_nlist.getQueryPointIndices();
     util::forLoopWrapper(0, nq->getNPoints(), [=](size_t begin, size_t end) {
         size_t bond(m_nlist.find_first_index(begin));
         for (size_t i = begin; i < end; ++i)
         {
             quat<float> q = orientations[i];
 
-            for (; bond < tot_num_neigh && m_nlist.getNeighbors()(bond, 0) == i; ++bond)
+            for (; bond < tot_num_neigh && query_point_indices[bond] == i; ++bond)
             {
-                const size_t j(m_nlist.getNeighbors()(bond, 1));
+                const size_t j(m_nlist.getPointIndices()[bond]);
                 quat<float> query_q = query_orientations[j];
 
                 float theta = computeMinSeparationAngle(q, query_q, equiv_orientations, n_equiv_orientations);
@@ -56,22 +56,23 @@ void LocalBondProjection::compute(const locality::NeighborQuery* nq, const quat<
     m_nlist = locality::makeDefaultNlist(nq, nlist, query_points, n_query_points, qargs);
 
     // Get the maximum total number of bonds in the neighbor list
-    const unsigned int tot_num_neigh = m_nlist.getNumBonds();
+    const size_t tot_num_neigh = m_nlist.getNumBonds();
 
     m_local_bond_proj.prepare({tot_num_neigh, n_proj});
     m_local_bond_proj_norm.prepare({tot_num_neigh, n_proj});
 
     // compute the order parameter
+    const auto& query_point_indices = m_nlist.getQueryPointIndices();
     util::forLoopWrapper(0, n_query_points, [=](size_t begin, size_t end) {
         size_t bond(m_nlist.find_first_index(begin));
         for (size_t i = begin; i < end; ++i)
         {
-            for (; bond < tot_num_neigh && m_nlist.getNeighbors()(bond, 0) == i; ++bond)
+            for (; bond < tot_num_neigh && query_point_indices[bond] == i; ++bond)
             {
-                const size_t j(m_nlist.getNeighbors()(bond, 1));
+                const size_t j(m_nlist.getPointIndices()[bond]);
 
                 // compute bond vector between the two particles
-                vec3<float> local_bond(bondVector(locality::NeighborBond(i, j), nq, query_points));
+                vec3<float> local_bond(bondVector(&m_nlist, bond, i, nq, query_points));
                 // rotate bond vector into the local frame of particle p
                 local_bond = rotate(conj(orientations[j]), local_bond);
                 // store the length of this local bond
@@ -32,6 +32,7 @@ void LocalDescriptors::compute(const locality::NeighborQuery* nq, const vec3<flo
     }
     m_sphArray.prepare({m_nlist.getNumBonds(), getSphWidth()});
 
+    const auto& query_point_indices = m_nlist.getQueryPointIndices();
     util::forLoopWrapper(0, nq->getNPoints(), [=](size_t begin, size_t end) {
         fsph::PointSPHEvaluator<float> sph_eval(m_l_max);
 
@@ -49,11 +50,10 @@ void LocalDescriptors::compute(const locality::NeighborQuery* nq, const vec3<flo
                 util::ManagedArray<float> inertiaTensor = util::ManagedArray<float>({3, 3});
 
                 for (size_t bond_copy(bond); bond_copy < m_nlist.getNumBonds()
-                     && m_nlist.getNeighbors()(bond_copy, 0) == i && neighbor_count < max_num_neighbors;
+                     && query_point_indices[bond_copy] == i && neighbor_count < max_num_neighbors;
                      ++bond_copy, ++neighbor_count)
                 {
-                    const size_t j(m_nlist.getNeighbors()(bond_copy, 1));
-                    const vec3<float> r_ij(bondVector(locality::NeighborBond(i, j), nq, query_points));
+                    const vec3<float> r_ij(bondVector(&m_nlist, bond_copy, i, nq, query_points));
                     const float r_sq(dot(r_ij, r_ij));
 
                     for (size_t ii(0); ii < 3; ++ii)
@@ -100,13 +100,12 @@ void LocalDescriptors::compute(const locality::NeighborQuery* nq, const vec3<flo
             }
 
             neighbor_count = 0;
-            for (; bond < m_nlist.getNumBonds() && m_nlist.getNeighbors()(bond, 0) == i
+            for (; bond < m_nlist.getNumBonds() && query_point_indices[bond] == i
                  && neighbor_count < max_num_neighbors;
                  ++bond, ++neighbor_count)
             {
-                const unsigned int sphCount(bond * getSphWidth());
-                const size_t j(m_nlist.getNeighbors()(bond, 1));
-                const vec3<float> r_ij(bondVector(locality::NeighborBond(i, j), nq, query_points));
+                const size_t sphCount(bond * getSphWidth());
+                const vec3<float> r_ij(bondVector(&m_nlist, bond, i, nq, query_points));
                 const float r_sq(dot(r_ij, r_ij));
                 const vec3<float> bond_ij(dot(rotation_0, r_ij), dot(rotation_1, r_ij),
                                           dot(rotation_2, r_ij));
@@ -495,10 +495,10 @@ Environment MatchEnv::buildEnv(const freud::locality::NeighborQuery* nq,
     // set the environment index equal to the particle index
     ei.env_ind = env_ind;
 
-    for (; bond < num_bonds && nlist->getNeighbors()(bond, 0) == i; ++bond)
+    for (; bond < num_bonds && nlist->getQueryPointIndices()[bond] == i; ++bond)
     {
         // compute vec{r} between the two particles
-        const size_t j(nlist->getNeighbors()(bond, 1));
+        const size_t j(nlist->getPointIndices()[bond]);
         if (i != j)
         {
             vec3<float> delta(bondVector(locality::NeighborBond(i, j), nq, nq->getPoints()));
@@ -515,6 +515,11 @@ void EnvironmentCluster::compute(const freud::locality::NeighborQuery* nq,
                                  locality::QueryArgs env_qargs, float threshold, bool registration,
                                  bool global)
 {
+    // Unlike Cluster, this does not use half queries. Merging two
+    // environments rewrites their orientations and vector orders, and the
+    // vector matching of isSimilar is greedy, so whether j is similar to i
+    // can change after i is compared to j. Skipping the second comparison of
+    // each pair could therefore change the clusters.
     const locality::NeighborList nlist
         = locality::makeDefaultNlist(nq, nlist_arg, nq->getPoints(), nq->getNPoints(), qargs);
     const locality::NeighborList env_nlist
@@ -555,9 +560,9 @@ void EnvironmentCluster::compute(const freud::locality::NeighborQuery* nq,
         if (!global)
         {
             // loop over the neighbors
-            for (; bond < nlist.getNumBonds() && nlist.getNeighbors()(bond, 0) == i; ++bond)
+            for (; bond < nlist.getNumBonds() && nlist.getQueryPointIndices()[bond] == i; ++bond)
             {
-                const size_t j(nlist.getNeighbors()(bond, 1));
+                const size_t j(nlist.getPointIndices()[bond]);
                 std::pair<rotmat3<float>, BiMap<unsigned int, unsigned int>> mapping
                     = isSimilar(dj.s[i], dj.s[j], m_threshold_sq, registration);
                 rotmat3<float> rotation = mapping.first;
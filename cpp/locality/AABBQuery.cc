@@ -2,20 +2,27 @@
 // This file is from the freud project, released under the BSD 3-Clause License.
 
 #include <algorithm>
+#include <atomic>
+#include <limits>
 #include <stdexcept>
 
 #include "AABBQuery.h"
 
 namespace freud { namespace locality {
 
-AABBQuery::AABBQuery(const box::Box& box, const vec3<float>* points, unsigned int n_points)
+AABBQuery::AABBQuery(const box::Box& box, const vec3<float>* points, unsigned int n_points, bool reorder)
     : NeighborQuery(box, points, n_points)
 {
+    if (reorder)
+    {
+        computeOrder();
+    }
+
     // Allocate memory and create image vectors
     setupTree(m_n_points);
 
     // Build the tree
-    buildTree(m_points, m_n_points);
+    buildTree(getStoragePoints(), m_n_points);
 }
 
 AABBQuery::~AABBQuery() = default;
@@ -27,13 +34,12 @@ AABBQuery::querySingle(const vec3<float> query_point, unsigned int query_point_i
     if (args.mode == QueryType::ball)
     {
         return std::make_shared<AABBQueryBallIterator>(this, query_point, query_point_idx, args.r_max,
-                                                       args.r_min, args.exclude_ii);
+                                                       args.r_min, args.exclude_ii, args.half);
     }
     if (args.mode == QueryType::nearest)
     {
         return std::make_shared<AABBQueryIterator>(this, query_point, query_point_idx, args.num_neighbors,
-                                                   args.r_guess, args.r_max, args.r_min, args.scale,
-                                                   args.exclude_ii);
+                                                   args.r_max, args.r_min, args.exclude_ii);
     }
     throw std::runtime_error("Invalid query mode provided to query function in AABBQuery.");
 }
@@ -41,24 +47,122 @@ AABBQuery::querySingle(const vec3<float> query_point, unsigned int query_point_i
 void AABBQuery::setupTree(unsigned int Np)
 {
     m_aabbs.resize(Np);
+    m_tree_points.resize(Np);
+}
+
+void AABBQuery::computeAABBs(unsigned int Np)
+{
+    // Make a point AABB for each point in the tree
+    util::forLoopWrapper(0, Np, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
+        {
+            m_aabbs[i] = AABB(m_tree_points[i], static_cast<unsigned int>(i));
+        }
+    });
 }
 
 void AABBQuery::buildTree(const vec3<float>* points, unsigned int Np)
 {
+    // Store the position of each point in the tree
+    util::forLoopWrapper(0, Np, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
+        {
+            vec3<float> my_pos(points[i]);
+            if (m_box.is2D())
+            {
+                my_pos.z = 0;
+            }
+            m_tree_points[i] = my_pos;
+        }
+    });
+
     // Construct a point AABB for each point
-    for (unsigned int i = 0; i < Np; ++i)
+    computeAABBs(Np);
+
+    // Call the tree build routine, one tree per type
+    m_aabb_tree.buildTree(m_aabbs.data(), Np);
+    m_build_cost = m_aabb_tree.getTreeCost();
+
+    // Nodes are stored after their parents, so the largest point index in
+    // each subtree can be computed in a single reverse pass. Refitting the
+    // tree does not move points between nodes, so this is only needed when
+    // the tree is built.
+    const unsigned int num_nodes = m_aabb_tree.getNumNodes();
+    m_node_max_point_index.assign(num_nodes, 0);
+    for (unsigned int node = num_nodes; node-- > 0;)
     {
-        // Make a point AABB
-        vec3<float> my_pos(points[i]);
-        if (m_box.is2D())
+        unsigned int max_point_index(0);
+        if (m_aabb_tree.isNodeLeaf(node))
         {
-            my_pos.z = 0;
+            for (unsigned int p = 0; p < m_aabb_tree.getNodeNumParticles(node); ++p)
+            {
+                max_point_index
+                    = std::max(max_point_index, toPointIndex(m_aabb_tree.getNodeParticleTag(node, p)));
+            }
         }
-        m_aabbs[i] = AABB(my_pos, i);
+        else
+        {
+            max_point_index = std::max(m_node_max_point_index[m_aabb_tree.getNodeLeft(node)],
+                                       m_node_max_point_index[m_aabb_tree.getNodeRight(node)]);
+        }
+        m_node_max_point_index[node] = max_point_index;
     }
+}
 
-    // Call the tree build routine, one tree per type
-    m_aabb_tree.buildTree(m_aabbs.data(), Np);
+bool AABBQuery::update(const vec3<float>* points, float rebuild_threshold)
+{
+    validatePoints(points);
+    m_points = points;
+    if (isReordered())
+    {
+        updateOrderedPoints();
+    }
+    const vec3<float>* storage_points = getStoragePoints();
+
+    // A point that crosses a periodic boundary would stretch its leaf node
+    // across the whole box. Instead, each point is stored in the tree at the
+    // periodic image closest to its previous position in the tree. Since
+    // queries check all neighboring images, results remain exact as long as
+    // no point in the tree strays more than half a box length outside the
+    // box, so the tree is rebuilt if that happens.
+    const vec3<bool> periodic = m_box.getPeriodic();
+    std::atomic<bool> out_of_range(false);
+    util::forLoopWrapper(0, m_n_points, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
+        {
+            vec3<float> my_pos(storage_points[i]);
+            if (m_box.is2D())
+            {
+                my_pos.z = 0;
+            }
+            m_tree_points[i] += m_box.wrap(my_pos - m_tree_points[i]);
+
+            // Points are never wrapped along non-periodic axes, so they
+            // cannot drift away from their previous position there.
+            const vec3<float> frac = m_box.makeFractional(m_tree_points[i]);
+            if ((periodic.x && (frac.x < float(-0.5) || frac.x > float(1.5)))
+                || (periodic.y && (frac.y < float(-0.5) || frac.y > float(1.5)))
+                || (periodic.z && (frac.z < float(-0.5) || frac.z > float(1.5))))
+            {
+                out_of_range.store(true, std::memory_order_relaxed);
+            }
+        }
+    });
+
+    if (!out_of_range)
+    {
+        // The tree build permutes m_aabbs, so the AABBs are recomputed in
+        // particle index order before refitting.
+        computeAABBs(m_n_points);
+        m_aabb_tree.refit(m_aabbs.data());
+        if (m_aabb_tree.getTreeCost() <= static_cast<double>(rebuild_threshold) * m_build_cost)
+        {
+            return false;
+        }
+    }
+
+    buildTree(storage_points, m_n_points);
+    return true;
 }
 
 void AABBIterator::updateImageVectors(float r_max, bool _check_r_max)
@@ -151,30 +255,31 @@ NeighborBond AABBQueryBallIterator::next()
         // Stackless traversal of the tree
         while (cur_node_idx < m_aabb_query->m_aabb_tree.getNumNodes())
         {
-            if (overlap(m_aabb_query->m_aabb_tree.getNodeAABB(cur_node_idx), asphere))
+            // Half queries also skip subtrees whose points are all found
+            // from the other point of each pair.
+            if (overlap(m_aabb_query->m_aabb_tree.getNodeAABB(cur_node_idx), asphere)
+                && !(m_half && m_aabb_query->getNodeMaxPointIndex(cur_node_idx) < m_query_point_idx))
             {
                 if (m_aabb_query->m_aabb_tree.isNodeLeaf(cur_node_idx))
                 {
                     while (cur_ref_p < m_aabb_query->m_aabb_tree.getNodeNumParticles(cur_node_idx))
                     {
-                        // Neighbor j
-                        const unsigned int j
+                        // Neighbor j, stored at position tag in the tree
+                        const unsigned int tag
                             = m_aabb_query->m_aabb_tree.getNodeParticleTag(cur_node_idx, cur_ref_p);
+                        const unsigned int j = m_aabb_query->toPointIndex(tag);
                         // Increment before possible return.
                         cur_ref_p++;
 
-                        // Skip ii matches immediately if requested.
-                        if (m_exclude_ii && m_query_point_idx == j)
+                        // Skip ii matches immediately if requested, and for half
+                        // queries skip pairs that are found from the other point.
+                        if ((m_exclude_ii && m_query_point_idx == j) || (m_half && j < m_query_point_idx))
                         {
                             continue;
                         }
 
                         // Read in the position of j
-                        vec3<float> pos_j((*m_neighbor_query)[j]);
-                        if (m_neighbor_query->getBox().is2D())
-                        {
-                            pos_j.z = 0;
-                        }
+                        const vec3<float>& pos_j(m_aabb_query->getTreePoint(tag));
 
                         // Compute distance
                         const vec3<float> r_ij = pos_j - pos_i_image;
@@ -183,7 +288,7 @@ NeighborBond AABBQueryBallIterator::next()
                         // Check ii exclusion before including the pair.
                         if (r_sq < r_max_sq && r_sq >= r_min_sq)
                         {
-                            return NeighborBond(m_query_point_idx, j, std::sqrt(r_sq));
+                            return NeighborBond(m_query_point_idx, j, std::sqrt(r_sq), 1, r_ij);
                         }
                     }
                 }
@@ -206,130 +311,177 @@ NeighborBond AABBQueryBallIterator::next()
 
 NeighborBond AABBQueryIterator::next()
 {
-    vec3<float> plane_distance = m_neighbor_query->getBox().getNearestPlaneDistance();
-    float min_plane_distance = std::min(plane_distance.x, plane_distance.y);
-    float max_plane_distance = std::max(plane_distance.x, plane_distance.y);
-    if (!m_neighbor_query->getBox().is2D())
+    // This iterator is not truly lazy; it finds all neighbors of the current
+    // point the first time next is called and then returns them one-by-one.
+    if (!m_searched)
+    {
+        search();
+        m_searched = true;
+    }
+
+    if (m_count < m_current_neighbors.size())
+    {
+        return m_current_neighbors[m_count++];
+    }
+
+    m_finished = true;
+    return ITERATOR_TERMINATOR;
+}
+
+void AABBQueryIterator::pushNode(unsigned int node, unsigned int image, const vec3<float>& query_image)
+{
+    // Squared distance from the query point image to the closest point of the node's bounding box.
+    const AABB& aabb = m_aabb_query->m_aabb_tree.getNodeAABB(node);
+    const vec3<float> lower = aabb.getLower();
+    const vec3<float> upper = aabb.getUpper();
+    const vec3<float> delta(std::max(std::max(lower.x - query_image.x, query_image.x - upper.x), float(0)),
+                            std::max(std::max(lower.y - query_image.y, query_image.y - upper.y), float(0)),
+                            std::max(std::max(lower.z - query_image.z, query_image.z - upper.z), float(0)));
+    const float distance_sq = dot(delta, delta);
+
+    if (distance_sq >= m_r_max * m_r_max
+        || (m_heap.full() && std::sqrt(distance_sq) > m_heap.maxDistance()))
+    {
+        return;
+    }
+
+    m_node_queue.push_back({distance_sq, node, image});
+    std::push_heap(m_node_queue.begin(), m_node_queue.end(),
+                   [](const NodeImage& a, const NodeImage& b) { return a.distance_sq > b.distance_sq; });
+}
+
+void AABBQueryIterator::search()
+{
+    const AABBTree& tree = m_aabb_query->m_aabb_tree;
+    const box::Box& box = m_neighbor_query->getBox();
+    const float r_max_sq = m_r_max * m_r_max;
+    const float r_min_sq = m_r_min * m_r_min;
+
+    // A point can only be found through two different images if one of them
+    // is at least half of the nearest plane distance of a periodic axis away.
+    const vec3<float> plane_distance = box.getNearestPlaneDistance();
+    const vec3<bool> periodic = box.getPeriodic();
+    float min_plane_distance = std::numeric_limits<float>::infinity();
+    if (periodic.x)
+    {
+        min_plane_distance = std::min(min_plane_distance, plane_distance.x);
+    }
+    if (periodic.y)
+    {
+        min_plane_distance = std::min(min_plane_distance, plane_distance.y);
+    }
+    if (!box.is2D() && periodic.z)
     {
         min_plane_distance = std::min(min_plane_distance, plane_distance.z);
-        max_plane_distance = std::max(max_plane_distance, plane_distance.z);
+    }
+    const float unique_image_distance = min_plane_distance / float(2.0);
+
+    vec3<float> pos_i(m_query_point);
+    if (box.is2D())
+    {
+        pos_i.z = 0;
     }
 
-    // This iterator is not truly lazy; because it needs to get possible
-    // neighbors and sort them to find the actual ones, it computes and caches
-    // them and then returns them one-by-one. This check ensures that we only
-    // search for new neighbors the first time next is called.
-    if (m_current_neighbors.empty())
+    m_current_neighbors.clear();
+    m_points_below_r_min.clear();
+    if (m_num_neighbors == 0 || tree.getNumNodes() == 0)
     {
-        // Continually perform ball queries until the termination conditions are met.
-        while (true)
+        return;
+    }
+
+    const auto farther = [](const NodeImage& a, const NodeImage& b) { return a.distance_sq > b.distance_sq; };
+    bool restart = true;
+    while (restart)
+    {
+        restart = false;
+        bool far_bond_kept = false;
+        m_heap.reset(m_num_neighbors);
+        m_node_queue.clear();
+        for (unsigned int image = 0; image < m_n_images; ++image)
+        {
+            pushNode(tree.getRoot(), image, pos_i + m_image_list[image]);
+        }
+
+        while (!m_node_queue.empty() && !restart)
         {
-            // Perform a ball query to get neighbors. To ensure that we allow
-            // ball queries to exceed their normal boundaries, we pass false as
-            // the _check_r_max. We also can't depend on the ball query for
-            // r_min filtering because we're querying beyond the normally safe
-            // bounds, so we have to do it in this class.
-            m_current_neighbors.clear();
-            m_all_distances.clear();
-            m_query_points_below_r_min.clear();
-            std::shared_ptr<NeighborQueryPerPointIterator> ball_it = std::make_shared<AABBQueryBallIterator>(
-                static_cast<const AABBQuery*>(m_neighbor_query), m_query_point, m_query_point_idx,
-                std::min(m_r_cur, m_r_max), 0, m_exclude_ii, false);
-            while (!ball_it->end())
+            std::pop_heap(m_node_queue.begin(), m_node_queue.end(), farther);
+            const NodeImage current = m_node_queue.back();
+            m_node_queue.pop_back();
+
+            // Every remaining node is at least as far away as this one.
+            if (m_heap.full() && std::sqrt(current.distance_sq) > m_heap.maxDistance())
+            {
+                break;
+            }
+
+            const vec3<float> pos_i_image = pos_i + m_image_list[current.image];
+            if (!tree.isNodeLeaf(current.node))
+            {
+                pushNode(tree.getNodeLeft(current.node), current.image, pos_i_image);
+                pushNode(tree.getNodeRight(current.node), current.image, pos_i_image);
+                continue;
+            }
+
+            for (unsigned int p = 0; p < tree.getNodeNumParticles(current.node); ++p)
             {
-                NeighborBond nb = ball_it->next();
-                if (nb == ITERATOR_TERMINATOR)
+                // Neighbor j, stored at position tag in the tree
+                const unsigned int tag = tree.getNodeParticleTag(current.node, p);
+                const unsigned int j = m_aabb_query->toPointIndex(tag);
+                if (m_exclude_ii && m_query_point_idx == j)
                 {
                     continue;
                 }
 
-                if (!m_exclude_ii || m_query_point_idx != nb.point_idx)
+                const vec3<float> r_ij = m_aabb_query->getTreePoint(tag) - pos_i_image;
+                const float r_sq = dot(r_ij, r_ij);
+                if (r_sq >= r_max_sq)
                 {
-                    nb.query_point_idx = m_query_point_idx;
-                    // If we've expanded our search radius beyond safe
-                    // distance, use the map instead of the vector.
-                    if (m_search_extended)
-                    {
-                        if ((m_all_distances.count(nb.point_idx) == 0)
-                            || m_all_distances[nb.point_idx] > nb.distance)
-                        {
-                            m_all_distances[nb.point_idx] = nb.distance;
-                            if (nb.distance < m_r_min)
-                            {
-                                m_query_points_below_r_min.insert(nb.point_idx);
-                            }
-                        }
-                    }
-                    else
+                    continue;
+                }
+                if (r_sq < r_min_sq)
+                {
+                    // The nearest image of this point is closer than r_min,
+                    // so the point is not a neighbor through any image. If a
+                    // farther image was already kept, nodes pruned since then
+                    // may hold the replacement, so the search starts over.
+                    m_points_below_r_min.push_back(j);
+                    const bool was_full = m_heap.full();
+                    if (m_heap.remove(j) && was_full)
                     {
-                        if (nb.distance >= m_r_min)
-                        {
-                            m_current_neighbors.emplace_back(nb);
-                        }
+                        restart = true;
+                        break;
                     }
+                    continue;
                 }
-            }
-
-            // Break if there are enough neighbors, or if we are querying beyond the limits of
-            // the periodic box.
-            m_r_cur *= m_scale;
 
-            if (m_current_neighbors.size() >= m_num_neighbors)
-            {
-                std::sort(m_current_neighbors.begin(), m_current_neighbors.end());
-                break;
-            }
+                const float distance = std::sqrt(r_sq);
+                if (!m_heap.accepts(distance, j)
+                    || std::find(m_points_below_r_min.cbegin(), m_points_below_r_min.cend(), j)
+                        != m_points_below_r_min.cend())
+                {
+                    continue;
+                }
 
-            if ((m_r_cur >= m_r_max) || (m_r_cur >= max_plane_distance)
-                || ((m_all_distances.size() - m_query_points_below_r_min.size()) >= m_num_neighbors))
-            {
-                // Once this condition is reached, either we found enough
-                // neighbors beyond the normal min_plane_distance
-                // condition or we conclude that there are not enough
-                // neighbors left in the system.
-                for (const auto& bond_distance : m_all_distances)
+                // Keep only the nearest image of each point.
+                if (far_bond_kept || distance >= unique_image_distance)
                 {
-                    if (bond_distance.second >= m_r_min)
+                    const NeighborBond* existing = m_heap.find(j);
+                    if (existing != nullptr)
                     {
-                        m_current_neighbors.emplace_back(m_query_point_idx, bond_distance.first,
-                                                         bond_distance.second);
+                        if (existing->distance <= distance)
+                        {
+                            continue;
+                        }
+                        m_heap.remove(j);
                     }
+                    far_bond_kept = far_bond_kept || distance >= unique_image_distance;
                 }
-                std::sort(m_current_neighbors.begin(), m_current_neighbors.end());
-                break;
-            }
-
-            if (m_r_cur > min_plane_distance / 2)
-            {
-                // If we have to go beyond the cutoff radius, we need to
-                // start tracking what particles are already in the set so
-                // that we can make sure that we find the closest image
-                // because we now run the risk of finding duplicates.
-                //
-                // We could make this marginally more efficient by checking
-                // whether we've exactly hit the limit, or if there's a
-                // rescaling that would let us try the exact limit once
-                // before going beyond the min plane distance.
-                m_search_extended = true;
+                m_heap.push(NeighborBond(m_query_point_idx, j, distance, 1, r_ij));
             }
         }
     }
 
-    // Now we return all the points found for the current point, stopping when
-    // any are beyond the maximum distance allowed.
-    while ((m_count < m_num_neighbors) && (m_count < m_current_neighbors.size()))
-    {
-        m_count++;
-        if (m_current_neighbors[m_count - 1].distance > m_r_max)
-        {
-            m_finished = true;
-            return ITERATOR_TERMINATOR;
-        }
-        return m_current_neighbors[m_count - 1];
-    }
-
-    m_finished = true;
-    return ITERATOR_TERMINATOR;
+    m_heap.extractSorted(m_current_neighbors);
 }
 
 }; }; // end namespace freud::locality
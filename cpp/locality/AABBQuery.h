@@ -4,14 +4,14 @@
 #ifndef AABBQUERY_H
 #define AABBQUERY_H
 
+#include <algorithm>
 #include <cmath>
-#include <map>
 #include <memory>
-#include <unordered_set>
 #include <vector>
 
 #include "AABBTree.h"
 #include "Box.h"
+#include "NearestNeighborHeap.h"
 #include "NeighborQuery.h"
 
 /*! \file AABBQuery.h
@@ -36,11 +36,27 @@ public:
     AABBQuery();
 
     //! New-style constructor.
-    AABBQuery(const box::Box& box, const vec3<float>* points, unsigned int n_points);
+    /*! If reorder is true, the tree is built from the points sorted along a
+     *  space-filling curve (see NeighborQuery::computeOrder). Query results
+     *  always refer to the original point indices.
+     */
+    AABBQuery(const box::Box& box, const vec3<float>* points, unsigned int n_points, bool reorder = false);
 
     //! Destructor
     ~AABBQuery() override;
 
+    //! Update the tree with new positions of the same points.
+    /*! The existing tree is refit to the new positions. If the quality of
+     *  the refit tree, measured by its total surface area, exceeds
+     *  \a rebuild_threshold times that of the last full build, the tree is
+     *  rebuilt from scratch instead. The box is unchanged.
+     *
+     *  \param points The new point coordinates, in the same order as before.
+     *  \param rebuild_threshold The maximum allowed ratio of refit to built tree cost.
+     *  \returns True if the tree was rebuilt, false if it was only refit.
+     */
+    bool update(const vec3<float>* points, float rebuild_threshold);
+
     //! Implementation of per-particle query for AABBQuery (see NeighborQuery.h for documentation).
     /*! \param query_point The point to find neighbors for.
      *  \param n_query_points The number of query points.
@@ -49,6 +65,29 @@ public:
     std::shared_ptr<NeighborQueryPerPointIterator>
     querySingle(const vec3<float> query_point, unsigned int query_point_idx, QueryArgs args) const override;
 
+    //! Get the position of a point as stored in the tree.
+    /*! This is the point's position with z set to 0 in 2D. After calls to
+     *  update(), it may be a periodic image of the point that lies slightly
+     *  outside the box.
+     *
+     *  \param index The index of the point in getStoragePoints.
+     */
+    const vec3<float>& getTreePoint(unsigned int index) const
+    {
+        return m_tree_points[index];
+    }
+
+    //! Get the largest point index in the subtree of a node.
+    /*! Half queries skip subtrees whose points all have smaller indices
+     *  than the query point.
+     *
+     *  \param node The index of the node in the tree.
+     */
+    unsigned int getNodeMaxPointIndex(unsigned int node) const
+    {
+        return m_node_max_point_index[node];
+    }
+
     AABBTree m_aabb_tree; //!< AABB tree of points
 
 protected:
@@ -110,7 +149,13 @@ private:
     //! Driver to build AABB trees
     void buildTree(const vec3<float>* points, unsigned int N);
 
-    std::vector<AABB> m_aabbs; //!< Flat array of AABBs of all types
+    //! Compute a point AABB for each point in the tree
+    void computeAABBs(unsigned int N);
+
+    std::vector<AABB> m_aabbs;              //!< Flat array of AABBs of all types
+    std::vector<vec3<float>> m_tree_points; //!< Positions of the points in the tree
+    double m_build_cost {0};                //!< Cost of the tree when it was last built
+    std::vector<unsigned int> m_node_max_point_index; //!< Largest point index in the subtree of each node
 };
 
 //! Parent class of AABB iterators that knows how to traverse general AABB tree structures.
@@ -119,9 +164,9 @@ class AABBIterator : public NeighborQueryPerPointIterator
 public:
     //! Constructor
     AABBIterator(const AABBQuery* neighbor_query, const vec3<float>& query_point,
-                 unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii)
+                 unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii, bool half = false)
         : NeighborQueryPerPointIterator(neighbor_query, query_point, query_point_idx, r_max, r_min,
-                                        exclude_ii),
+                                        exclude_ii, half),
           m_aabb_query(neighbor_query)
     {}
 
@@ -137,68 +182,112 @@ protected:
     unsigned int m_n_images {0};           //!< The number of image vectors to check
 };
 
-//! Iterator that gets a specified number of nearest neighbors from AABB tree structures.
-class AABBQueryIterator : public AABBIterator
+//! Iterator that gets neighbors in a ball of size r_max using AABB tree structures.
+class AABBQueryBallIterator : public AABBIterator
 {
 public:
     //! Constructor
-    AABBQueryIterator(const AABBQuery* neighbor_query, const vec3<float>& query_point,
-                      unsigned int query_point_idx, unsigned int num_neighbors, float r_guess, float r_max,
-                      float r_min, float scale, bool exclude_ii)
-        : AABBIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii), m_count(0),
-          m_num_neighbors(num_neighbors), m_search_extended(false), m_r_cur(r_guess), m_scale(scale),
-          m_all_distances(), m_query_points_below_r_min()
+    AABBQueryBallIterator(const AABBQuery* neighbor_query, const vec3<float>& query_point,
+                          unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii,
+                          bool half = false, bool _check_r_max = true)
+        : AABBIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii, half),
+          cur_image(0),
+          cur_node_idx(0), cur_ref_p(0), m_check_r_max(_check_r_max)
     {
-        updateImageVectors(0);
+        updateImageVectors(m_r_max, m_check_r_max);
     }
 
     //! Empty Destructor
-    ~AABBQueryIterator() override = default;
+    ~AABBQueryBallIterator() override = default;
 
     //! Get the next element.
     NeighborBond next() override;
 
-protected:
-    unsigned int m_count;                          //!< Number of neighbors returned for the current point.
-    unsigned int m_num_neighbors;                  //!< Number of nearest neighbors to find
-    std::vector<NeighborBond> m_current_neighbors; //!< The current set of found neighbors.
-    bool m_search_extended; //!< Flag to see whether we've gone past the safe cutoff distance and have to be
-                            //!< worried about finding duplicates.
-    float
-        m_r_cur; //!< Current search ball cutoff distance in use for the current particle (expands as needed).
-    float m_scale; //!< The amount to scale m_r by when the current ball is too small.
-    std::map<unsigned int, float> m_all_distances; //!< Hash map of minimum distances found for a given point,
-                                                   //!< used when searching beyond maximum safe AABB distance.
-    std::unordered_set<unsigned int> m_query_points_below_r_min; //!< The set of query_points that were too
-                                                                 //!< close based on the r_min threshold.
-};
+    //! Reset the iterator to find the neighbors of a different query point.
+    void reset(const vec3<float>& query_point, unsigned int query_point_idx) override
+    {
+        AABBIterator::reset(query_point, query_point_idx);
+        cur_image = 0;
+        cur_node_idx = 0;
+        cur_ref_p = 0;
+    }
 
-//! Iterator that gets neighbors in a ball of size r_max using AABB tree structures.
-class AABBQueryBallIterator : public AABBIterator
+    //! Reset the iterator to find the neighbors of a query point within a new cutoff distance.
+    void reset(const vec3<float>& query_point, unsigned int query_point_idx, float r_max)
+    {
+        m_r_max = r_max;
+        updateImageVectors(m_r_max, m_check_r_max);
+        reset(query_point, query_point_idx);
+    }
+
+private:
+    unsigned int cur_image;    //!< The current node in the tree.
+    unsigned int cur_node_idx; //!< The current node in the tree.
+    unsigned int
+        cur_ref_p;      //!< The current index into the reference particles in the current node of the tree.
+    bool m_check_r_max; //!< Whether to check that r_max is small enough for the box.
+};
+//! Iterator that gets a specified number of nearest neighbors from AABB tree structures.
+/*! Neighbors are found by a best-first traversal of the tree. Pairs of a
+ *  node and a periodic image of the query point are visited in order of
+ *  increasing distance between the image and the node's bounding box, and
+ *  the nearest candidates found so far are kept in a bounded heap. The
+ *  traversal stops as soon as the nearest unvisited node is farther than the
+ *  k-th nearest candidate. Each point is reported at most once, using its
+ *  nearest periodic image.
+ */
+class AABBQueryIterator : public AABBIterator
 {
 public:
     //! Constructor
-    AABBQueryBallIterator(const AABBQuery* neighbor_query, const vec3<float>& query_point,
-                          unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii,
-                          bool _check_r_max = true)
-        : AABBIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii), cur_image(0),
-          cur_node_idx(0), cur_ref_p(0)
+    AABBQueryIterator(const AABBQuery* neighbor_query, const vec3<float>& query_point,
+                      unsigned int query_point_idx, unsigned int num_neighbors, float r_max, float r_min,
+                      bool exclude_ii)
+        : AABBIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii), m_count(0),
+          m_num_neighbors(num_neighbors), m_searched(false)
     {
-        updateImageVectors(m_r_max, _check_r_max);
+        updateImageVectors(0);
     }
 
     //! Empty Destructor
-    ~AABBQueryBallIterator() override = default;
+    ~AABBQueryIterator() override = default;
 
     //! Get the next element.
     NeighborBond next() override;
 
-private:
-    unsigned int cur_image;    //!< The current node in the tree.
-    unsigned int cur_node_idx; //!< The current node in the tree.
-    unsigned int
-        cur_ref_p; //!< The current index into the reference particles in the current node of the tree.
+    //! Reset the iterator to find the neighbors of a different query point.
+    void reset(const vec3<float>& query_point, unsigned int query_point_idx) override
+    {
+        AABBIterator::reset(query_point, query_point_idx);
+        m_count = 0;
+        m_searched = false;
+        m_current_neighbors.clear();
+    }
+
+protected:
+    //! A node of the tree paired with a periodic image of the query point.
+    struct NodeImage
+    {
+        float distance_sq;  //!< Squared distance from the query point image to the node's bounding box
+        unsigned int node;  //!< Index of the node in the tree
+        unsigned int image; //!< Index of the image vector
+    };
+
+    //! Find the nearest neighbors of the current query point.
+    void search();
+
+    //! Push a node onto the traversal queue.
+    void pushNode(unsigned int node, unsigned int image, const vec3<float>& query_image);
+
+    unsigned int m_count;                          //!< Number of neighbors returned for the current point.
+    unsigned int m_num_neighbors;                  //!< Number of nearest neighbors to find
+    bool m_searched;                               //!< Whether the current point has been searched.
+    std::vector<NeighborBond> m_current_neighbors; //!< The current set of found neighbors.
+    NearestNeighborHeap m_heap;                    //!< The nearest candidates found during the search.
+    std::vector<NodeImage> m_node_queue;           //!< Min-heap of nodes left to visit.
+    std::vector<unsigned int> m_points_below_r_min; //!< Points with an image closer than r_min.
 };
+
 }; }; // end namespace freud::locality
 
 #endif // AABBQUERY_H
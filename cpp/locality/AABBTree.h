@@ -164,6 +164,12 @@ public:
     //! Update the AABB of a particle
     inline void update(unsigned int idx, const AABB& aabb);
 
+    //! Refit the AABBs of all nodes to a new set of particle AABBs
+    inline void refit(const AABB* aabbs);
+
+    //! Get the total surface area of all nodes in the tree
+    inline double getTreeCost() const;
+
     //! Get the height of a given particle's leaf node
     inline unsigned int height(unsigned int idx);
 
@@ -213,6 +219,20 @@ public:
         return (m_nodes[node].left);
     }
 
+    //! Get the right child of a given node
+    /*! \param node Index of the node (not the particle) to query
+     */
+    inline unsigned int getNodeRight(unsigned int node) const
+    {
+        return (m_nodes[node].right);
+    }
+
+    //! Get the index of the root node
+    inline unsigned int getRoot() const
+    {
+        return m_root;
+    }
+
     //! Get the number of particles in a given node
     /*! \param node Index of the node (not the particle) to query
      */
@@ -349,6 +369,53 @@ inline void AABBTree::update(unsigned int idx, const AABB& aabb)
     }
 }
 
+/*! \param aabbs List of AABBs for each particle, indexed by particle index
+
+    Recompute the AABB of every node in the tree from the given particle AABBs. Unlike update(), refit() can
+   shrink nodes as well as grow them. The tree topology is left unchanged, so the quality of the tree degrades
+   as particles move away from the positions used to build it. Runs in O(N) time.
+*/
+inline void AABBTree::refit(const AABB* aabbs)
+{
+    // Nodes are allocated in pre-order by buildNode(), so every child has a
+    // larger index than its parent. Iterating in reverse order therefore
+    // visits all children before their parents.
+    for (unsigned int node_idx = m_num_nodes - 1; node_idx != static_cast<unsigned int>(-1); --node_idx)
+    {
+        AABBNode& node = m_nodes[node_idx];
+        if (node.left == INVALID_NODE)
+        {
+            AABB node_aabb = aabbs[node.particles[0]];
+            for (unsigned int i = 1; i < node.num_particles; ++i)
+            {
+                node_aabb = merge(node_aabb, aabbs[node.particles[i]]);
+            }
+            node.aabb = node_aabb;
+        }
+        else
+        {
+            node.aabb = merge(m_nodes[node.left].aabb, m_nodes[node.right].aabb);
+        }
+    }
+}
+
+/*! \returns The sum of the surface areas of all node AABBs
+
+    The total surface area is the surface area heuristic (SAH) cost of traversing the tree, and is used to
+   measure how much the quality of a refit tree has degraded relative to a freshly built one. In 2D, where all
+   AABBs are flat, this reduces to the sum of the node areas.
+*/
+inline double AABBTree::getTreeCost() const
+{
+    double cost = 0;
+    for (unsigned int node_idx = 0; node_idx < m_num_nodes; ++node_idx)
+    {
+        const vec3<float> extent = m_nodes[node_idx].aabb.getUpper() - m_nodes[node_idx].aabb.getLower();
+        cost += extent.x * extent.y + extent.y * extent.z + extent.z * extent.x;
+    }
+    return cost;
+}
+
 /*! \param idx Particle to get height for
     \returns Height of the node
 */
@@ -96,14 +96,18 @@ public:
            appropriately with given qargs.
         \param qargs Query arguments
         \param cf An object with operator(NeighborBond) as input.
+
+        Computes that do not use bond vectors should set compute_vectors to
+        false (see locality::loopOverNeighbors).
     */
-    template<typename Func>
+    template<bool compute_vectors = true, typename Func>
     void accumulateGeneral(const locality::NeighborQuery* neighbor_query, const vec3<float>* query_points,
                            unsigned int n_query_points, const locality::NeighborList* nlist,
                            locality::QueryArgs qargs, Func cf)
     {
         m_box = neighbor_query->getBox();
-        locality::loopOverNeighbors(neighbor_query, query_points, n_query_points, qargs, nlist, cf);
+        locality::loopOverNeighbors<compute_vectors>(neighbor_query, query_points, n_query_points, qargs,
+                                                     nlist, cf);
         m_frame_counter++;
         m_n_points = neighbor_query->getNPoints();
         m_n_query_points = n_query_points;
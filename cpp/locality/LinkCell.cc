@@ -2,10 +2,13 @@
 // This file is from the freud project, released under the BSD 3-Clause License.
 
 #include <algorithm>
+#include <atomic>
 #include <cmath>
+#include <limits>
 #include <stdexcept>
 
 #include "LinkCell.h"
+#include "utils.h"
 
 /*! \file LinkCell.cc
     \brief Build a cell list from a set of points.
@@ -13,16 +16,37 @@
 
 namespace freud { namespace locality {
 
+namespace {
+
+//! Bin a fractional coordinate into one of n cells.
+/*! Coordinates along periodic axes are wrapped into the box. Along
+ *  non-periodic axes, points outside the box are placed in the nearest
+ *  boundary cell.
+ */
+unsigned int binFractional(float alpha, unsigned int n, bool periodic)
+{
+    const int cell = static_cast<int>(std::floor(alpha * static_cast<float>(n)));
+    const int num_cells = static_cast<int>(n);
+    if (!periodic)
+    {
+        return static_cast<unsigned int>(std::min(std::max(cell, 0), num_cells - 1));
+    }
+    const int wrapped = cell % num_cells;
+    return static_cast<unsigned int>(wrapped < 0 ? wrapped + num_cells : wrapped);
+}
+
+}; // end anonymous namespace
+
 /********************
  * IteratorLinkCell *
  ********************/
 void IteratorLinkCell::copy(const IteratorLinkCell& rhs)
 {
-    m_cell_list = rhs.m_cell_list;
-    m_Np = rhs.m_Np;
-    m_Nc = rhs.m_Nc;
+    m_cell_points = rhs.m_cell_points;
+    m_begin = rhs.m_begin;
+    m_end = rhs.m_end;
+    m_next_pos = rhs.m_next_pos;
     m_cur_idx = rhs.m_cur_idx;
-    m_cell = rhs.m_cell;
 }
 
 bool IteratorLinkCell::atEnd() const
@@ -32,15 +56,29 @@ bool IteratorLinkCell::atEnd() const
 
 unsigned int IteratorLinkCell::next()
 {
-    m_cur_idx = m_cell_list[m_cur_idx];
+    if (m_next_pos < m_end)
+    {
+        m_cur_idx = m_cell_points[m_next_pos];
+        ++m_next_pos;
+    }
+    else
+    {
+        m_cur_idx = LINK_CELL_TERMINATOR;
+    }
     return m_cur_idx;
 }
 
 unsigned int IteratorLinkCell::begin()
 {
-    m_cur_idx = m_Np + m_cell;
-    m_cur_idx = m_cell_list[m_cur_idx];
-    return m_cur_idx;
+    m_next_pos = m_begin;
+    return next();
+}
+
+void IteratorLinkCell::skipBelow(unsigned int min_idx)
+{
+    const unsigned int* cell_points = m_cell_points.get();
+    m_next_pos = static_cast<unsigned int>(
+        std::lower_bound(cell_points + m_next_pos, cell_points + m_end, min_idx) - cell_points);
 }
 
 /*********************
@@ -211,7 +249,8 @@ void IteratorCellShell::reset(unsigned int range)
 // Default constructor
 LinkCell::LinkCell() : NeighborQuery() {}
 
-LinkCell::LinkCell(const box::Box& box, const vec3<float>* points, unsigned int n_points, float cell_width)
+LinkCell::LinkCell(const box::Box& box, const vec3<float>* points, unsigned int n_points, float cell_width,
+                   bool reorder)
     : NeighborQuery(box, points, n_points), m_cell_width(cell_width)
 {
     // If no cell width is provided, we calculate the system density and
@@ -229,10 +268,13 @@ LinkCell::LinkCell(const box::Box& box, const vec3<float>* points, unsigned int
 
     m_celldim = computeDimensions(box, m_cell_width);
 
-    // Check if box is too small!
+    // Check if box is too small! Cells along non-periodic axes are never
+    // reached through more than one image, so only periodic axes matter.
     vec3<float> nearest_plane_distance = box.getNearestPlaneDistance();
-    if ((m_cell_width * 2.0 > nearest_plane_distance.x) || (m_cell_width * 2.0 > nearest_plane_distance.y)
-        || (!box.is2D() && m_cell_width * 2.0 > nearest_plane_distance.z))
+    vec3<bool> periodic = box.getPeriodic();
+    if ((periodic.x && m_cell_width * 2.0 > nearest_plane_distance.x)
+        || (periodic.y && m_cell_width * 2.0 > nearest_plane_distance.y)
+        || (!box.is2D() && periodic.z && m_cell_width * 2.0 > nearest_plane_distance.z))
     {
         throw std::runtime_error("Cannot generate a cell list where cell_width is larger than half the box.");
     }
@@ -248,7 +290,11 @@ LinkCell::LinkCell(const box::Box& box, const vec3<float>* points, unsigned int
         throw std::runtime_error("At least one cell must be present.");
     }
 
-    computeCellList(points, n_points);
+    if (reorder)
+    {
+        computeOrder();
+    }
+    computeCellList(getStoragePoints(), n_points);
 }
 
 unsigned int LinkCell::getCellIndex(const vec3<int> cellCoord) const
@@ -257,6 +303,15 @@ unsigned int LinkCell::getCellIndex(const vec3<int> cellCoord) const
     int h = static_cast<int>(m_celldim.y);
     int d = static_cast<int>(m_celldim.z);
 
+    // Cells beyond the box along non-periodic axes do not exist.
+    vec3<bool> periodic = m_box.getPeriodic();
+    if ((!periodic.x && (cellCoord.x < 0 || cellCoord.x >= w))
+        || (!periodic.y && (cellCoord.y < 0 || cellCoord.y >= h))
+        || (!periodic.z && (cellCoord.z < 0 || cellCoord.z >= d)))
+    {
+        return LINK_CELL_TERMINATOR;
+    }
+
     int x = cellCoord.x % w;
     x += (x < 0 ? w : 0);
     int y = cellCoord.y % h;
@@ -308,23 +363,58 @@ vec3<unsigned int> LinkCell::computeDimensions(const box::Box& box, float cell_w
 void LinkCell::computeCellList(const vec3<float>* points, unsigned int n_points)
 {
     // determine the number of cells and allocate memory
-    unsigned int Nc = getNumCells();
-    m_cell_list.prepare(n_points + Nc);
+    const unsigned int Nc = getNumCells();
+    m_cell_offsets.prepare(Nc + 1);
+    m_cell_points.prepare(n_points);
     m_n_points = n_points;
 
-    // initialize memory
-    for (unsigned int cell = 0; cell < Nc; cell++)
-    {
-        m_cell_list[n_points + cell] = LINK_CELL_TERMINATOR;
-    }
+    // The cell list is built with a parallel counting sort. First, compute
+    // the cell of every point and count the number of points in each cell.
+    std::vector<unsigned int> point_cells(n_points);
+    std::vector<std::atomic<unsigned int>> cell_counts(Nc);
+    util::forLoopWrapper(0, Nc, [&](size_t begin, size_t end) {
+        for (size_t cell = begin; cell < end; ++cell)
+        {
+            cell_counts[cell].store(0, std::memory_order_relaxed);
+        }
+    });
+    util::forLoopWrapper(0, n_points, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
+        {
+            const unsigned int cell = getCell(points[i]);
+            point_cells[i] = cell;
+            cell_counts[cell].fetch_add(1, std::memory_order_relaxed);
+        }
+    });
 
-    // Generate the cell list.
-    for (unsigned int i = n_points - 1; i != static_cast<unsigned int>(-1); --i)
+    // An exclusive prefix sum of the counts gives the start of each cell.
+    // The counts are reused as per-cell insertion cursors below.
+    unsigned int offset = 0;
+    for (unsigned int cell = 0; cell < Nc; ++cell)
     {
-        unsigned int cell = getCell(points[i]);
-        m_cell_list[i] = m_cell_list[n_points + cell];
-        m_cell_list[n_points + cell] = i;
+        m_cell_offsets[cell] = offset;
+        offset += cell_counts[cell].load(std::memory_order_relaxed);
+        cell_counts[cell].store(m_cell_offsets[cell], std::memory_order_relaxed);
     }
+    m_cell_offsets[Nc] = offset;
+
+    // Scatter the point indices into their cells.
+    util::forLoopWrapper(0, n_points, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i)
+        {
+            m_cell_points[cell_counts[point_cells[i]].fetch_add(1, std::memory_order_relaxed)] = i;
+        }
+    });
+
+    // The parallel scatter does not preserve the order of points within a
+    // cell, so sort each cell to make the traversal order deterministic.
+    unsigned int* cell_points = m_cell_points.get();
+    util::forLoopWrapper(0, Nc, [&](size_t begin, size_t end) {
+        for (size_t cell = begin; cell < end; ++cell)
+        {
+            std::sort(cell_points + m_cell_offsets[cell], cell_points + m_cell_offsets[cell + 1]);
+        }
+    });
 }
 
 vec3<unsigned int> LinkCell::indexToCoord(unsigned int x) const
@@ -339,25 +429,20 @@ vec3<unsigned int> LinkCell::indexToCoord(unsigned int x) const
 
 unsigned int LinkCell::coordToIndex(unsigned int x, unsigned int y, unsigned int z) const
 {
-    // For backwards compatibility with the Index1D layout, the indices and
-    // the dimensions are passed in reverse to the indexer. Changing this would
-    // also require updating the logic in IteratorCellShell.
-    return util::ManagedArray<unsigned int>::getIndex(
-        {m_celldim.z, m_celldim.y, m_celldim.x},
-        {static_cast<unsigned int>(z), static_cast<unsigned int>(y), static_cast<unsigned int>(x)});
+    // For backwards compatibility with the Index1D layout, x varies fastest.
+    // Changing this would also require updating the logic in
+    // IteratorCellShell. The index is computed directly rather than through
+    // ManagedArray::getIndex because queries call this for every searched
+    // cell, and building the index vectors allocates.
+    return (z * m_celldim.y + y) * m_celldim.x + x;
 }
 
 vec3<unsigned int> LinkCell::getCellCoord(const vec3<float>& p) const
 {
     vec3<float> alpha = m_box.makeFractional(p);
-    vec3<unsigned int> c;
-    c.x = (unsigned int) std::floor(alpha.x * float(m_celldim.x));
-    c.x %= m_celldim.x;
-    c.y = (unsigned int) std::floor(alpha.y * float(m_celldim.y));
-    c.y %= m_celldim.y;
-    c.z = (unsigned int) std::floor(alpha.z * float(m_celldim.z));
-    c.z %= m_celldim.z;
-    return c;
+    vec3<bool> periodic = m_box.getPeriodic();
+    return {binFractional(alpha.x, m_celldim.x, periodic.x), binFractional(alpha.y, m_celldim.y, periodic.y),
+            binFractional(alpha.z, m_celldim.z, periodic.z)};
 }
 
 const std::vector<unsigned int>& LinkCell::getCellNeighbors(unsigned int cell) const
@@ -441,6 +526,7 @@ const std::vector<unsigned int>& LinkCell::computeCellNeighbors(unsigned int cur
     {
         startk = endk = k;
     }
+    vec3<bool> periodic = m_box.getPeriodic();
 
     for (int neighk = startk; neighk <= endk; neighk++)
     {
@@ -448,6 +534,14 @@ const std::vector<unsigned int>& LinkCell::computeCellNeighbors(unsigned int cur
         {
             for (int neighi = starti; neighi <= endi; neighi++)
             {
+                // skip cells outside of non-periodic boundaries
+                if ((!periodic.x && (neighi < 0 || neighi >= static_cast<int>(m_celldim.x)))
+                    || (!periodic.y && (neighj < 0 || neighj >= static_cast<int>(m_celldim.y)))
+                    || (!periodic.z && (neighk < 0 || neighk >= static_cast<int>(m_celldim.z))))
+                {
+                    continue;
+                }
+
                 // wrap back into the box
                 unsigned int wrapi = (m_celldim.x + neighi) % m_celldim.x;
                 unsigned int wrapj = (m_celldim.y + neighj) % m_celldim.y;
@@ -477,7 +571,7 @@ LinkCell::querySingle(const vec3<float> query_point, unsigned int query_point_id
     if (args.mode == QueryType::ball)
     {
         return std::make_shared<LinkCellQueryBallIterator>(this, query_point, query_point_idx, args.r_max,
-                                                           args.r_min, args.exclude_ii);
+                                                           args.r_min, args.exclude_ii, args.half);
     }
     if (args.mode == QueryType::nearest)
     {
@@ -495,7 +589,17 @@ NeighborBond LinkCellQueryBallIterator::next()
     vec3<unsigned int> point_cell(m_linkcell->getCellCoord(m_query_point));
     const unsigned int point_cell_index = m_linkcell->getCellIndex(
         vec3<int>(point_cell.x, point_cell.y, point_cell.z) + (*m_neigh_cell_iter));
-    m_searched_cells.insert(point_cell_index);
+    markCellSearched(point_cell_index);
+
+    // Half queries skip the points in each cell that are found from the
+    // other point of each pair. Unless the points are reordered, the points
+    // in each cell are sorted by index, so they can be skipped without
+    // computing their distances.
+    const bool skip_lower(m_half && !m_linkcell->isReordered());
+    if (skip_lower)
+    {
+        m_cell_iter.skipBelow(m_query_point_idx);
+    }
 
     // Loop over cell list neighbor shells relative to this point's cell.
     while (true)
@@ -503,20 +607,22 @@ NeighborBond LinkCellQueryBallIterator::next()
         // Iterate over the particles in that cell. Using a local counter
         // variable is safe, because the IteratorLinkCell object is keeping
         // track between calls to next.
-        for (unsigned int j = m_cell_iter.next(); !m_cell_iter.atEnd(); j = m_cell_iter.next())
+        for (unsigned int k = m_cell_iter.next(); !m_cell_iter.atEnd(); k = m_cell_iter.next())
         {
-            // Skip ii matches immediately if requested.
-            if (m_exclude_ii && m_query_point_idx == j)
+            const unsigned int j = m_linkcell->toPointIndex(k);
+            // Skip ii matches immediately if requested, and for half queries
+            // skip pairs that are found from the other point.
+            if ((m_exclude_ii && m_query_point_idx == j) || (m_half && j < m_query_point_idx))
             {
                 continue;
             }
 
-            const vec3<float> r_ij(m_neighbor_query->getBox().wrap((*m_linkcell)[j] - m_query_point));
+            const vec3<float> r_ij(bondVector(m_linkcell->getStoragePoints()[k]));
             const float r_sq(dot(r_ij, r_ij));
 
             if (r_sq < r_max_sq && r_sq >= r_min_sq)
             {
-                return NeighborBond(m_query_point_idx, j, std::sqrt(r_sq));
+                return NeighborBond(m_query_point_idx, j, std::sqrt(r_sq), 1, r_ij);
             }
         }
 
@@ -530,8 +636,9 @@ NeighborBond LinkCellQueryBallIterator::next()
             ++m_neigh_cell_iter;
 
             if (static_cast<float>(m_neigh_cell_iter.getRange() - m_extra_search_width)
-                    * m_linkcell->getCellWidth()
-                > m_r_max)
+                        * m_linkcell->getCellWidth()
+                    > m_r_max
+                || static_cast<unsigned int>(m_neigh_cell_iter.getRange()) > m_linkcell->getMaxCellRange())
             {
                 out_of_range = true;
                 break;
@@ -539,15 +646,19 @@ NeighborBond LinkCellQueryBallIterator::next()
 
             const unsigned int neighbor_cell_index = m_linkcell->getCellIndex(
                 vec3<int>(point_cell.x, point_cell.y, point_cell.z) + (*m_neigh_cell_iter));
-            // Insertion to an unordered set returns a pair, the second
-            // element indicates insertion success or failure (if it
-            // already exists)
-            if (m_searched_cells.insert(neighbor_cell_index).second)
+            // Cells outside of non-periodic boundaries are skipped, and
+            // marking the cell as searched fails if it has already been
+            // searched.
+            if (neighbor_cell_index != LINK_CELL_TERMINATOR && markCellSearched(neighbor_cell_index))
             {
                 // This cell has not been searched yet, so we will iterate
                 // over its contents. Otherwise, we loop back, increment
                 // the cell shell iterator, and try the next one.
                 m_cell_iter = m_linkcell->itercell(neighbor_cell_index);
+                if (skip_lower)
+                {
+                    m_cell_iter.skipBelow(m_query_point_idx);
+                }
                 break;
             }
         }
@@ -566,45 +677,71 @@ NeighborBond LinkCellQueryIterator::next()
     float r_max_sq = m_r_max * m_r_max;
     float r_min_sq = m_r_min * m_r_min;
 
-    vec3<float> plane_distance = m_neighbor_query->getBox().getNearestPlaneDistance();
-    float min_plane_distance = std::min(plane_distance.x, plane_distance.y);
-    if (!m_neighbor_query->getBox().is2D())
+    // Along periodic axes, shells farther than half of the box wrap onto
+    // cells that were already searched. Along non-periodic axes, shells
+    // extend until every cell of the box has been searched.
+    const box::Box& box = m_neighbor_query->getBox();
+    vec3<float> plane_distance = box.getNearestPlaneDistance();
+    vec3<bool> periodic = box.getPeriodic();
+    periodic.z = periodic.z && !box.is2D();
+    float min_plane_distance = std::numeric_limits<float>::infinity();
+    if (periodic.x)
+    {
+        min_plane_distance = std::min(min_plane_distance, plane_distance.x);
+    }
+    if (periodic.y)
+    {
+        min_plane_distance = std::min(min_plane_distance, plane_distance.y);
+    }
+    if (periodic.z)
     {
         min_plane_distance = std::min(min_plane_distance, plane_distance.z);
     }
-    unsigned int max_range
-        = static_cast<unsigned int>(std::ceil(min_plane_distance / (2 * m_linkcell->getCellWidth()))) + 1;
+    unsigned int max_range = 0;
+    if (std::isfinite(min_plane_distance))
+    {
+        max_range
+            = static_cast<unsigned int>(std::ceil(min_plane_distance / (2 * m_linkcell->getCellWidth()))) + 1;
+    }
+    if (!(periodic.x && periodic.y && (periodic.z || box.is2D())))
+    {
+        max_range = std::max(max_range, m_linkcell->getMaxCellRange() + 1);
+    }
 
     vec3<unsigned int> point_cell(m_linkcell->getCellCoord(m_query_point));
     const unsigned int point_cell_index = m_linkcell->getCellIndex(
         vec3<int>(point_cell.x, point_cell.y, point_cell.z) + (*m_neigh_cell_iter));
-    m_searched_cells.insert(point_cell_index);
+    markCellSearched(point_cell_index);
 
-    // Loop over cell list neighbor shells relative to this point's cell.
-    if (m_current_neighbors.empty())
+    // This iterator is not truly lazy; it finds all neighbors of the current
+    // point the first time next is called and then returns them one-by-one.
+    if (!m_searched)
     {
+        m_searched = true;
+        m_heap.reset(m_num_neighbors);
+
         // Expand search cell radius until termination conditions are met.
-        while (m_neigh_cell_iter != IteratorCellShell(max_range, m_neighbor_query->getBox().is2D()))
+        while (m_num_neighbors > 0
+               && m_neigh_cell_iter != IteratorCellShell(max_range, m_neighbor_query->getBox().is2D()))
         {
-            // Iterate over the particles in that cell. Using a local counter
-            // variable is safe, because the IteratorLinkCell object is keeping
-            // track between calls to next. However, we have to add an extra
-            // check outside to proof ourselves against returning after
-            // previous calls to next that have not yet reset the iterator.
-            if (!m_cell_iter.atEnd())
+            // Iterate over the particles in that cell, keeping only the
+            // nearest candidates found so far.
+            for (unsigned int k = m_cell_iter.next(); !m_cell_iter.atEnd(); k = m_cell_iter.next())
             {
-                for (unsigned int j = m_cell_iter.next(); !m_cell_iter.atEnd(); j = m_cell_iter.next())
+                const unsigned int j = m_linkcell->toPointIndex(k);
+                // Skip ii matches immediately if requested.
+                if (m_exclude_ii && m_query_point_idx == j)
                 {
-                    // Skip ii matches immediately if requested.
-                    if (m_exclude_ii && m_query_point_idx == j)
-                    {
-                        continue;
-                    }
-                    const vec3<float> r_ij(m_neighbor_query->getBox().wrap((*m_linkcell)[j] - m_query_point));
-                    const float r_sq(dot(r_ij, r_ij));
-                    if (r_sq < r_max_sq && r_sq >= r_min_sq)
+                    continue;
+                }
+                const vec3<float> r_ij(bondVector(m_linkcell->getStoragePoints()[k]));
+                const float r_sq(dot(r_ij, r_ij));
+                if (r_sq < r_max_sq && r_sq >= r_min_sq)
+                {
+                    const float distance = std::sqrt(r_sq);
+                    if (m_heap.accepts(distance, j))
                     {
-                        m_current_neighbors.emplace_back(m_query_point_idx, j, std::sqrt(r_sq));
+                        m_heap.push(NeighborBond(m_query_point_idx, j, distance, 1, r_ij));
                     }
                 }
             }
@@ -620,10 +757,10 @@ NeighborBond LinkCellQueryIterator::next()
 
                 const unsigned int neighbor_cell_index = m_linkcell->getCellIndex(
                     vec3<int>(point_cell.x, point_cell.y, point_cell.z) + (*m_neigh_cell_iter));
-                // Insertion to an unordered set returns a pair, the second
-                // element indicates insertion success or failure (if it
-                // already exists)
-                if (m_searched_cells.insert(neighbor_cell_index).second)
+                // Cells outside of non-periodic boundaries are skipped, and
+                // marking the cell as searched fails if it has already been
+                // searched.
+                if (neighbor_cell_index != LINK_CELL_TERMINATOR && markCellSearched(neighbor_cell_index))
                 {
                     // This cell has not been searched yet, so we will
                     // iterate over its contents. Otherwise, we loop back,
@@ -634,28 +771,23 @@ NeighborBond LinkCellQueryIterator::next()
                 }
             }
 
-            // We can terminate early if we determine when we reach a shell
-            // such that we already have k neighbors closer than the
-            // closest possible neighbor in the new shell.
-            std::sort(m_current_neighbors.begin(), m_current_neighbors.end());
-            if ((m_current_neighbors.size() >= m_num_neighbors)
-                && (m_current_neighbors[m_num_neighbors - 1].distance
-                    < static_cast<float>(m_neigh_cell_iter.getRange() - 1) * m_linkcell->getCellWidth()))
+            // We can terminate early once the closest possible point in the
+            // next cell is beyond r_max or farther than the k-th nearest
+            // neighbor found so far.
+            const float shell_distance
+                = static_cast<float>(m_neigh_cell_iter.getRange() - 1) * m_linkcell->getCellWidth();
+            if (shell_distance >= m_r_max || (m_heap.full() && m_heap.maxDistance() < shell_distance))
             {
                 break;
             }
         }
+
+        m_heap.extractSorted(m_current_neighbors);
     }
 
-    while ((m_count < m_num_neighbors) && (m_count < m_current_neighbors.size()))
+    if (m_count < m_current_neighbors.size())
     {
-        m_count++;
-        if (m_current_neighbors[m_count - 1].distance > m_r_max)
-        {
-            m_finished = true;
-            return ITERATOR_TERMINATOR;
-        }
-        return m_current_neighbors[m_count - 1];
+        return m_current_neighbors[m_count++];
     }
 
     m_finished = true;
@@ -4,12 +4,13 @@
 #ifndef LINKCELL_H
 #define LINKCELL_H
 
+#include <algorithm>
 #include <memory>
 #include <tbb/concurrent_hash_map.h>
-#include <unordered_set>
 #include <vector>
 
 #include "Box.h"
+#include "NearestNeighborHeap.h"
 #include "NeighborList.h"
 #include "NeighborQuery.h"
 
@@ -20,7 +21,7 @@
 namespace freud { namespace locality {
 
 /*! \internal
-    \brief Signifies the end of the linked list
+    \brief Signifies the end of the particles in a cell
 */
 const unsigned int LINK_CELL_TERMINATOR = 0xffffffff;
 
@@ -28,13 +29,12 @@ const unsigned int LINK_CELL_TERMINATOR = 0xffffffff;
 /*! The link-cell structure is not trivial to iterate over. This helper class
  *  makes that easier both in C++ and provides a Python compatible interface
  *  for direct usage there. An IteratorLinkCell is given the bare essentials
- *  it needs to iterate over a given cell, the cell list, the number of
- *  particles, number of cells and the cell to iterate over. Call next() to
+ *  it needs to iterate over a given cell: the array of cell-sorted particle
+ *  indices and the range of that array belonging to the cell. Call next() to
  *  get the index of the next particle in the cell, atEnd() will return true
- *  if you are at the end. In C++, next() will crash the code if you attempt
- *  to iterate past the end (no bounds checking for performance). When called
- *  from Python, a different version of next() is used that will throw
- *  StopIteration at the end.
+ *  if you are at the end. In C++, next() will return LINK_CELL_TERMINATOR if
+ *  you attempt to iterate past the end. When called from Python, a different
+ *  version of next() is used that will throw StopIteration at the end.
  *
  *  A loop over all of the particles in a cell can be accomplished with the
  *   following code in C++.
@@ -54,12 +54,13 @@ class IteratorLinkCell
 public:
     IteratorLinkCell() = default;
 
-    IteratorLinkCell(const util::ManagedArray<unsigned int>& cell_list, unsigned int Np, unsigned int Nc,
-                     unsigned int cell)
-        : m_cell_list(cell_list), m_Np(Np), m_Nc(Nc)
+    IteratorLinkCell(const util::ManagedArray<unsigned int>& cell_points, unsigned int cell_begin,
+                     unsigned int cell_end)
+        : m_cell_points(cell_points), m_begin(cell_begin), m_end(cell_end), m_next_pos(cell_begin),
+          m_cur_idx(cell_begin)
     {
-        m_cell = cell;
-        m_cur_idx = m_Np + cell;
+        // m_cur_idx only needs to differ from LINK_CELL_TERMINATOR so that
+        // atEnd() is false until next() has walked past the end of the cell.
     }
 
     //! Copy the position of rhs into this object
@@ -74,12 +75,17 @@ public:
     //! Get the first particle index in the list
     unsigned int begin();
 
+    //! Skip the remaining particles with indices smaller than min_idx
+    /*! The particles in each cell are sorted by index.
+     */
+    void skipBelow(unsigned int min_idx);
+
 private:
-    util::ManagedArray<unsigned int> m_cell_list;  //!< The cell list
-    unsigned int m_Np {0};                         //!< Number of particles in the cell list
-    unsigned int m_Nc {0};                         //!< Number of cells in the cell list
-    unsigned int m_cur_idx {LINK_CELL_TERMINATOR}; //!< Current index
-    unsigned int m_cell {0};                       //!< Cell being considered
+    util::ManagedArray<unsigned int> m_cell_points; //!< Particle indices sorted by cell
+    unsigned int m_begin {0};                       //!< First position of the cell in m_cell_points
+    unsigned int m_end {0};                         //!< One past the last position of the cell
+    unsigned int m_next_pos {0};                    //!< Position of the next particle to return
+    unsigned int m_cur_idx {LINK_CELL_TERMINATOR};  //!< Current index
 };
 
 //! Iterates over sets of shells in a cell list
@@ -165,8 +171,12 @@ private:
  *  an arbitrary point.
 
  *  <b>Data structures:</b><br>
- *  The internal data structure used in LinkCell is a linked list of particle
- *  indices. See IteratorLinkCell for information on how to iterate through these.
+ *  The internal data structure used in LinkCell is a compressed sparse row
+ *  (CSR) layout: particle indices are stored contiguously grouped by cell,
+ *  and an offsets array of length num_cells + 1 marks the range of each
+ *  cell. Within a cell, particle indices are stored in increasing order.
+ *  The structure is built in parallel with a counting sort. See
+ *  IteratorLinkCell for information on how to iterate through these.
 
  *  <b>2D:</b><br>
  *  LinkCell properly handles 2D boxes. When a 2D box is handed to LinkCell,
@@ -174,6 +184,11 @@ private:
  *  the plane. As with everything else in freud, 2D points must be passed in
  *  as 3 component vectors x,y,0. Failing to set 0 in the third component will
  *  lead to undefined behavior.
+
+ *  <b>Non-periodic boxes:</b><br>
+ *  Along non-periodic axes, cells are not wrapped and shells stop at the
+ *  boundary of the box. Points outside of the box along such an axis are
+ *  stored in the nearest boundary cell, so they are still found by queries.
  */
 class LinkCell : public NeighborQuery
 {
@@ -182,14 +197,37 @@ public:
     LinkCell();
 
     //! Constructor
-    LinkCell(const box::Box& box, const vec3<float>* points, unsigned int n_points, float cell_width = 0);
+    /*! If reorder is true, the points are sorted along a space-filling curve
+     *  (see NeighborQuery::computeOrder) before they are binned, and the
+     *  cell list stores indices into getStoragePoints. Query results always
+     *  refer to the original point indices.
+     */
+    LinkCell(const box::Box& box, const vec3<float>* points, unsigned int n_points, float cell_width = 0,
+             bool reorder = false);
 
     //! Compute LinkCell dimensions
     static vec3<unsigned int> computeDimensions(const box::Box& box, float cell_width);
 
     //! Compute cell id from cell coordinates
+    /*! Coordinates are wrapped along periodic axes. Returns
+     *  LINK_CELL_TERMINATOR if the cell lies outside the box along a
+     *  non-periodic axis.
+     */
     unsigned int getCellIndex(const vec3<int> cellCoord) const;
 
+    //! Get the largest cell shell range that contains cells of the box
+    /*! Searching shells up to this range from any cell visits every cell.
+     */
+    unsigned int getMaxCellRange() const
+    {
+        unsigned int max_dim = std::max(m_celldim.x, m_celldim.y);
+        if (!m_box.is2D())
+        {
+            max_dim = std::max(max_dim, m_celldim.z);
+        }
+        return max_dim - 1;
+    }
+
     //! Get the number of cells
     unsigned int getNumCells() const
     {
@@ -221,7 +259,7 @@ public:
     //! Iterate over particles in a cell
     IteratorLinkCell itercell(unsigned int cell) const
     {
-        return IteratorLinkCell(m_cell_list, m_n_points, getNumCells(), cell);
+        return IteratorLinkCell(m_cell_points, m_cell_offsets[cell], m_cell_offsets[cell + 1]);
     }
 
     //! Get a list of neighbors to a cell
@@ -246,7 +284,8 @@ private:
     vec3<unsigned int> m_celldim {0, 0, 0}; //!< Cell dimensions
     unsigned int m_size {0};                //!< The size of cell list.
 
-    util::ManagedArray<unsigned int> m_cell_list; //!< The cell list last computed
+    util::ManagedArray<unsigned int> m_cell_offsets; //!< Start of each cell in m_cell_points (size Nc + 1)
+    util::ManagedArray<unsigned int> m_cell_points;  //!< Indices into getStoragePoints sorted by cell
     using CellNeighbors = tbb::concurrent_hash_map<unsigned int, std::vector<unsigned int>>;
     mutable CellNeighbors m_cell_neighbors; //!< Hash map of cell neighbors for each cell
 };
@@ -260,9 +299,10 @@ public:
      *  iterate outwards from there.
      */
     LinkCellIterator(const LinkCell* neighbor_query, const vec3<float>& query_point,
-                     unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii)
+                     unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii,
+                     bool half = false)
         : NeighborQueryPerPointIterator(neighbor_query, query_point, query_point_idx, r_max, r_min,
-                                        exclude_ii),
+                                        exclude_ii, half),
           m_linkcell(neighbor_query), m_neigh_cell_iter(0, neighbor_query->getBox().is2D()),
           m_cell_iter(m_linkcell->itercell(m_linkcell->getCell(m_query_point)))
     {}
@@ -270,13 +310,102 @@ public:
     //! Empty Destructor
     ~LinkCellIterator() override = default;
 
+    //! Reset the iterator to find the neighbors of a different query point.
+    void reset(const vec3<float>& query_point, unsigned int query_point_idx) override
+    {
+        NeighborQueryPerPointIterator::reset(query_point, query_point_idx);
+        m_neigh_cell_iter = IteratorCellShell(0, m_linkcell->getBox().is2D());
+        m_cell_iter = m_linkcell->itercell(m_linkcell->getCell(m_query_point));
+        m_searched_cells.clear();
+        m_use_cell_stamps = false;
+    }
+
 protected:
+    //! Record that a cell is being searched.
+    /*! \param cell The index of the cell.
+     *  \returns True if the cell had not been searched yet.
+     */
+    bool markCellSearched(unsigned int cell)
+    {
+        // Ball queries search only a few cells, which are kept in a small
+        // sorted vector. Unlike a hash set, clearing the vector keeps its
+        // memory, so reset iterators do not allocate. Searches that visit
+        // more cells, such as nearest neighbor queries of sparse systems,
+        // switch to stamping the cells they visit with a generation number,
+        // so that each lookup is constant-time and resetting the iterator
+        // does not need to clear the stamps.
+        const size_t max_sorted_cells(64);
+        if (!m_use_cell_stamps)
+        {
+            auto it = std::lower_bound(m_searched_cells.begin(), m_searched_cells.end(), cell);
+            if (it != m_searched_cells.end() && *it == cell)
+            {
+                return false;
+            }
+            if (m_searched_cells.size() < max_sorted_cells)
+            {
+                m_searched_cells.insert(it, cell);
+                return true;
+            }
+
+            if (m_cell_stamps.empty())
+            {
+                m_cell_stamps.assign(m_linkcell->getNumCells(), 0);
+            }
+            if (++m_cell_stamp == 0)
+            {
+                std::fill(m_cell_stamps.begin(), m_cell_stamps.end(), 0);
+                m_cell_stamp = 1;
+            }
+            for (const unsigned int searched_cell : m_searched_cells)
+            {
+                m_cell_stamps[searched_cell] = m_cell_stamp;
+            }
+            m_use_cell_stamps = true;
+        }
+        if (m_cell_stamps[cell] == m_cell_stamp)
+        {
+            return false;
+        }
+        m_cell_stamps[cell] = m_cell_stamp;
+        return true;
+    }
+
+    //! Compute the vector from the query point to a point.
+    /*! Like AABBQuery, the vector is measured from the periodic image of the
+     *  query point that is closest to the point, rather than by wrapping the
+     *  difference of the two points. Both structures therefore round bond
+     *  vectors identically, and they find the same bonds even at distances
+     *  within floating point precision of r_max.
+     *
+     *  \param point The position of the point.
+     */
+    vec3<float> bondVector(const vec3<float>& point) const
+    {
+        const box::Box& box = m_linkcell->getBox();
+        const vec3<bool> periodic = box.getPeriodic();
+        vec3<int> image;
+        box.getImage(point - m_query_point, image);
+        vec3<float> latt_c(0, 0, 0);
+        if (!box.is2D())
+        {
+            latt_c = box.getLatticeVector(2);
+        }
+        const vec3<float> image_vector = float(periodic.x ? image.x : 0) * box.getLatticeVector(0)
+            + float(periodic.y ? image.y : 0) * box.getLatticeVector(1)
+            + float(periodic.z ? image.z : 0) * latt_c;
+        return point - (m_query_point + image_vector);
+    }
+
     const LinkCell* m_linkcell; //!< Link to the LinkCell object
     IteratorCellShell
         m_neigh_cell_iter;        //!< The shell iterator indicating how far out we're currently searching.
     IteratorLinkCell m_cell_iter; //!< The cell iterator indicating which cell we're currently searching.
-    std::unordered_set<unsigned int>
-        m_searched_cells; //!< Set of cells that have already been searched by the cell shell iterator.
+    std::vector<unsigned int> m_searched_cells; //!< Sorted indices of cells that have already been searched
+                                                //!< by the cell shell iterator.
+    std::vector<unsigned int> m_cell_stamps; //!< Generation in which each cell was last searched.
+    unsigned int m_cell_stamp {0};           //!< Generation of the current search.
+    bool m_use_cell_stamps {false};          //!< Whether m_cell_stamps records the searched cells.
 };
 
 //! Iterator that gets specified numbers of nearest neighbors from LinkCell tree structures.
@@ -288,7 +417,7 @@ public:
                           unsigned int query_point_idx, unsigned int num_neighbors, float r_max, float r_min,
                           bool exclude_ii)
         : LinkCellIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii),
-          m_count(0), m_num_neighbors(num_neighbors)
+          m_count(0), m_num_neighbors(num_neighbors), m_searched(false)
     {}
 
     //! Empty Destructor
@@ -297,10 +426,21 @@ public:
     //! Get the next element.
     NeighborBond next() override;
 
+    //! Reset the iterator to find the neighbors of a different query point.
+    void reset(const vec3<float>& query_point, unsigned int query_point_idx) override
+    {
+        LinkCellIterator::reset(query_point, query_point_idx);
+        m_count = 0;
+        m_searched = false;
+        m_current_neighbors.clear();
+    }
+
 protected:
     unsigned int m_count;                          //!< Number of neighbors returned for the current point.
     unsigned int m_num_neighbors;                  //!< Number of nearest neighbors to find
+    bool m_searched;                               //!< Whether the current point has been searched.
     std::vector<NeighborBond> m_current_neighbors; //!< The current set of found neighbors.
+    NearestNeighborHeap m_heap;                    //!< The nearest candidates found during the search.
 };
 
 //! Iterator that gets neighbors in a ball of size r using LinkCell tree structures.
@@ -309,8 +449,9 @@ class LinkCellQueryBallIterator : public LinkCellIterator
 public:
     //! Constructor
     LinkCellQueryBallIterator(const LinkCell* neighbor_query, const vec3<float>& query_point,
-                              unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii)
-        : LinkCellIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii)
+                              unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii,
+                              bool half = false)
+        : LinkCellIterator(neighbor_query, query_point, query_point_idx, r_max, r_min, exclude_ii, half)
     {
         // Upon querying, if the search radius is equal to the cell width, we
         // can guarantee that we don't need to search the cell shell past the
@@ -0,0 +1,123 @@
+// Copyright (c) 2010-2020 The Regents of the University of Michigan
+// This file is from the freud project, released under the BSD 3-Clause License.
+
+#ifndef NEAREST_NEIGHBOR_HEAP_H
+#define NEAREST_NEIGHBOR_HEAP_H
+
+#include <algorithm>
+#include <vector>
+
+#include "NeighborBond.h"
+
+/*! \file NearestNeighborHeap.h
+    \brief Keeps the nearest bonds among a stream of candidates.
+*/
+
+namespace freud { namespace locality {
+
+//! Bounded max-heap of the k nearest bonds found so far.
+/*! Nearest neighbor queries use this container to keep only the best k
+ *  candidates while searching, so that candidates farther than the current
+ *  k-th nearest bond can be discarded without sorting all candidates. Bonds
+ *  at equal distances are ordered by point index, making the selected set
+ *  independent of the order in which candidates are found.
+ */
+class NearestNeighborHeap
+{
+public:
+    //! Remove all bonds and set the number of bonds to keep.
+    void reset(unsigned int num_neighbors)
+    {
+        m_num_neighbors = num_neighbors;
+        m_bonds.clear();
+    }
+
+    //! Return whether the heap holds the requested number of bonds.
+    bool full() const
+    {
+        return m_bonds.size() >= m_num_neighbors;
+    }
+
+    //! Return the distance of the farthest bond kept. The heap must not be empty.
+    float maxDistance() const
+    {
+        return m_bonds.front().distance;
+    }
+
+    //! Return whether a bond with the given distance and point index would be kept.
+    bool accepts(float distance, unsigned int point_idx) const
+    {
+        return m_num_neighbors > 0
+            && (!full() || closer(distance, point_idx, m_bonds.front().distance, m_bonds.front().point_idx));
+    }
+
+    //! Add a bond, dropping the farthest bond if the heap is full.
+    /*! The caller must check accepts() first.
+     */
+    void push(const NeighborBond& bond)
+    {
+        if (full())
+        {
+            std::pop_heap(m_bonds.begin(), m_bonds.end(), compare);
+            m_bonds.back() = bond;
+        }
+        else
+        {
+            m_bonds.push_back(bond);
+        }
+        std::push_heap(m_bonds.begin(), m_bonds.end(), compare);
+    }
+
+    //! Return the bond kept for a point, or nullptr if there is none.
+    const NeighborBond* find(unsigned int point_idx) const
+    {
+        const auto bond = std::find_if(m_bonds.cbegin(), m_bonds.cend(), [point_idx](const NeighborBond& b) {
+            return b.point_idx == point_idx;
+        });
+        return bond == m_bonds.cend() ? nullptr : &(*bond);
+    }
+
+    //! Remove the bond kept for a point, if any. Returns whether a bond was removed.
+    bool remove(unsigned int point_idx)
+    {
+        const auto bond = std::find_if(m_bonds.begin(), m_bonds.end(), [point_idx](const NeighborBond& b) {
+            return b.point_idx == point_idx;
+        });
+        if (bond == m_bonds.end())
+        {
+            return false;
+        }
+        m_bonds.erase(bond);
+        std::make_heap(m_bonds.begin(), m_bonds.end(), compare);
+        return true;
+    }
+
+    //! Sort the kept bonds from nearest to farthest and move them into bonds.
+    void extractSorted(std::vector<NeighborBond>& bonds)
+    {
+        std::sort_heap(m_bonds.begin(), m_bonds.end(), compare);
+        bonds.swap(m_bonds);
+        m_bonds.clear();
+    }
+
+private:
+    //! Order bonds by distance, then by point index.
+    static bool closer(float distance, unsigned int point_idx, float other_distance,
+                       unsigned int other_point_idx)
+    {
+        return distance < other_distance || (distance == other_distance && point_idx < other_point_idx);
+    }
+
+    //! Heap comparator placing the farthest bond at the front.
+    static bool compare(const NeighborBond& a, const NeighborBond& b)
+    {
+        return closer(a.distance, a.point_idx, b.distance, b.point_idx);
+    }
+
+    unsigned int m_num_neighbors {0};  //!< Number of bonds to keep
+    std::vector<NeighborBond> m_bonds; //!< Kept bonds, stored as a max-heap
+};
+
+}; }; // end namespace freud::locality
+
+#endif // NEAREST_NEIGHBOR_HEAP_H
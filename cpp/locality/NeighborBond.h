@@ -1,6 +1,8 @@
 #ifndef NEIGHBOR_BOND_H
 #define NEIGHBOR_BOND_H
 
+#include "VectorMath.h"
+
 namespace freud { namespace locality {
 
 //! Simple data structure encoding neighboring points.
@@ -14,8 +16,9 @@ struct NeighborBond
     // For now, id = query_point_idx and ref_id = point_idx (into the NeighborQuery).
     constexpr NeighborBond() = default;
 
-    constexpr NeighborBond(unsigned int query_point_idx, unsigned int point_idx, float d = 0, float w = 1)
-        : query_point_idx(query_point_idx), point_idx(point_idx), distance(d), weight(w)
+    constexpr NeighborBond(unsigned int query_point_idx, unsigned int point_idx, float d = 0, float w = 1,
+                           const vec3<float>& v = vec3<float>(0, 0, 0))
+        : query_point_idx(query_point_idx), point_idx(point_idx), distance(d), weight(w), vector(v)
     {}
 
     //! Equality checks both query_point_idx and distance.
@@ -91,6 +94,7 @@ struct NeighborBond
     unsigned int point_idx {0};       //! The reference point index.
     float distance {0};               //! The distance between the points.
     float weight {0};                 //! The weight of this bond.
+    vec3<float> vector {0, 0, 0};     //! The vector from the query point to the point, wrapped into the box.
 };
 
 }; }; // end namespace freud::locality
@@ -24,10 +24,46 @@ NeighborList makeDefaultNlist(const NeighborQuery* nq, const NeighborList* nlist
                               const vec3<float>* query_points, unsigned int num_query_points,
                               locality::QueryArgs qargs);
 
+//! Enable half queries for a symmetric self-query if possible.
+/*! Computes whose per-bond work is symmetric in the two points can visit each
+ * unordered pair once instead of twice. The iterators skip points with smaller
+ * indices than the query point without computing their distances where the
+ * data structure allows it, and discard the remaining pairs found from the
+ * other point. This is only possible when no NeighborList is provided, the
+ * query points are the points of the NeighborQuery, self-neighbors are
+ * excluded, and the query is a ball query.
+ *
+ * \param nq NeighborQuery object that will be queried.
+ * \param nlist NeighborList that will be iterated over, or NULL.
+ * \param query_points Query points of the compute.
+ * \param n_query_points Number of query_points.
+ * \param qargs Query arguments, updated in place if half queries are enabled.
+ * \return Whether half queries were enabled.
+ */
+inline bool enableHalfQuery(const NeighborQuery* nq, const NeighborList* nlist,
+                            const vec3<float>* query_points, unsigned int n_query_points, QueryArgs& qargs)
+{
+    const bool is_ball = qargs.mode == QueryType::ball
+        || (qargs.mode == QueryType::none && qargs.num_neighbors == DEFAULT_NUM_NEIGHBORS
+            && qargs.r_max != DEFAULT_R_MAX);
+    if (nlist != nullptr || query_points != nq->getPoints() || n_query_points != nq->getNPoints()
+        || !qargs.exclude_ii || !is_ball)
+    {
+        return false;
+    }
+    qargs.mode = QueryType::ball;
+    qargs.half = true;
+    return true;
+}
+
 //! Compute the vector corresponding to a NeighborBond.
 /*! The primary purpose of this function is to standardize the directionality
  * of the delta vector, which is defined as pointing from the query_point to
  * the point (point - query_point), wrapped into the box.
+ *
+ * Bonds passed to compute functions by loopOverNeighbors and
+ * loopOverNeighborsIterator already carry this vector, so this function is
+ * only needed for bonds constructed from indices.
  */
 inline vec3<float> bondVector(const NeighborBond& nb, const NeighborQuery* nq,
                               const vec3<float>* query_points)
@@ -35,6 +71,20 @@ inline vec3<float> bondVector(const NeighborBond& nb, const NeighborQuery* nq,
     return nq->getBox().wrap((*nq)[nb.point_idx] - query_points[nb.query_point_idx]);
 }
 
+//! Get the vector of a bond in a NeighborList.
+/*! The vector stored in the NeighborList is returned if there is one,
+ *  otherwise it is computed from the points.
+ */
+inline vec3<float> bondVector(const NeighborList* nlist, size_t bond, unsigned int query_point_idx,
+                              const NeighborQuery* nq, const vec3<float>* query_points)
+{
+    if (nlist->hasVectors())
+    {
+        return nlist->getVectors()[bond];
+    }
+    return nq->getBox().wrap((*nq)[nlist->getPointIndices()[bond]] - query_points[query_point_idx]);
+}
+
 //! Implementation of per-point finding logic for NeighborList objects.
 /*! This class provides a concrete implementation of the per-point neighbor
  *  finding interface specified by the NeighborPerPointIterator. In particular,
@@ -45,30 +95,48 @@ inline vec3<float> bondVector(const NeighborBond& nb, const NeighborQuery* nq,
 class NeighborListPerPointIterator : public NeighborPerPointIterator
 {
 public:
-    NeighborListPerPointIterator(const NeighborList* nlist, size_t point_index)
-        : NeighborPerPointIterator(point_index), m_nlist(nlist)
+    NeighborListPerPointIterator(const NeighborList* nlist, size_t point_index, const NeighborQuery* nq,
+                                 const vec3<float>* query_points, bool compute_vectors = true)
+        : NeighborPerPointIterator(point_index), m_nlist(nlist), m_neighbor_query(nq),
+          m_query_points(query_points), m_compute_vectors(compute_vectors)
+    {
+        reset(point_index);
+    }
+
+    ~NeighborListPerPointIterator() override = default;
+
+    //! Reset the iterator to find the neighbors of a different query point.
+    void reset(size_t point_index)
     {
+        m_query_point_idx = point_index;
         m_current_index = m_nlist->find_first_index(point_index);
-        m_finished = m_current_index == m_nlist->getNumBonds();
+        // Compressed lists give the end of each query point's bonds directly,
+        // otherwise iteration stops when the query point index changes.
+        m_end_index = m_nlist->isCompressed() ? m_nlist->find_first_index(point_index + 1)
+                                              : m_nlist->getNumBonds();
+        m_finished = m_current_index == m_end_index;
+        m_returned_point_index = 0xffffffff;
         if (!m_finished)
         {
-            m_returned_point_index = m_nlist->getNeighbors()(m_current_index, 0);
+            m_returned_point_index = queryPointIndex(m_current_index);
         }
     }
 
-    ~NeighborListPerPointIterator() override = default;
-
     NeighborBond next() override
     {
-        if (m_current_index == m_nlist->getNumBonds())
+        if (m_current_index == m_end_index)
         {
             m_finished = true;
             return ITERATOR_TERMINATOR;
         }
 
+        const unsigned int query_point_idx = queryPointIndex(m_current_index);
         NeighborBond nb = NeighborBond(
-            m_nlist->getNeighbors()(m_current_index, 0), m_nlist->getNeighbors()(m_current_index, 1),
-            m_nlist->getDistances()[m_current_index], m_nlist->getWeights()[m_current_index]);
+            query_point_idx, m_nlist->getPointIndices()[m_current_index],
+            m_nlist->getDistances()[m_current_index], m_nlist->getWeight(m_current_index),
+            m_compute_vectors
+                ? bondVector(m_nlist, m_current_index, query_point_idx, m_neighbor_query, m_query_points)
+                : vec3<float>());
         ++m_current_index;
         m_returned_point_index = nb.query_point_idx;
         return nb;
@@ -80,12 +148,23 @@ public:
     }
 
 private:
-    const NeighborList* m_nlist; //! The NeighborList being iterated over.
+    //! Return the query point index of a bond without materializing the column of a compressed list.
+    unsigned int queryPointIndex(size_t bond) const
+    {
+        return m_nlist->isCompressed() ? m_query_point_idx : m_nlist->getQueryPointIndices()[bond];
+    }
+
+    const NeighborList* m_nlist;           //! The NeighborList being iterated over.
+    const NeighborQuery* m_neighbor_query; //! The points of the NeighborList, used to compute bond vectors.
+    const vec3<float>* m_query_points;     //! The query points of the NeighborList.
+    bool m_compute_vectors;                //! Whether to set the vectors of the returned bonds.
     size_t m_current_index;      //! The row of m_nlist where the iterator is currently located.
+    size_t m_end_index;          //! One past the last row of m_nlist that may belong to the query point.
     size_t m_returned_point_index {
         0xffffffff}; //! The index of the last returned point (i.e. the value of
-                     //! m_nlist.getNeighbors()(m_current_index, 0)). Initialized to an arbitrary sentinel in
-                     //! case the user ever tries to access this for an iterator built from an empty nlist.
+                     //! m_nlist.getQueryPointIndices()[m_current_index]). Initialized to an arbitrary
+                     //! sentinel in case the user ever tries to access this for an iterator built from an
+                     //! empty nlist.
     bool m_finished; //! Flag to indicate that the iterator has been exhausted.
 };
 
@@ -105,6 +184,12 @@ private:
  *  both a query_point index and a NeighborPerPointIterator that provides the
  *  neighbors of that query_point.
  *
+ *  Bonds found by a query always carry their vectors. Bonds read from a
+ *  NeighborList only do if compute_vectors is true, since computing the
+ *  vectors of lists that do not store them requires wrapping the difference
+ *  of the points of every bond. Computes that do not use the vectors should
+ *  set compute_vectors to false, and the vectors of their bonds are zero.
+ *
  *  \param neighbor_query NeighborQuery object to iterate over.
  *  \param query_points Query points to perform computation on.
  *  \param n_query_points Number of query_points.
@@ -113,7 +198,7 @@ private:
  * given qargs. \param cf An object with operator(size_t point_index, std::shared_ptr<NeighborIterator>) as
  * input. It should implement iteration logic over the iterator.
  */
-template<typename ComputePairType>
+template<bool compute_vectors = true, typename ComputePairType>
 void loopOverNeighborsIterator(const NeighborQuery* neighbor_query, const vec3<float>* query_points,
                                unsigned int n_query_points, QueryArgs qargs, const NeighborList* nlist,
                                const ComputePairType& cf, bool parallel = true)
@@ -124,10 +209,14 @@ void loopOverNeighborsIterator(const NeighborQuery* neighbor_query, const vec3<f
         util::forLoopWrapper(
             0, n_query_points,
             [=](size_t begin, size_t end) {
+                // A single iterator is reused for all points in the range to
+                // avoid a heap allocation per point.
+                std::shared_ptr<NeighborListPerPointIterator> niter
+                    = std::make_shared<NeighborListPerPointIterator>(nlist, begin, neighbor_query,
+                                                                     query_points, compute_vectors);
                 for (size_t i = begin; i != end; ++i)
                 {
-                    std::shared_ptr<NeighborListPerPointIterator> niter
-                        = std::make_shared<NeighborListPerPointIterator>(nlist, i);
+                    niter->reset(i);
                     cf(i, niter);
                 }
             },
@@ -142,9 +231,13 @@ void loopOverNeighborsIterator(const NeighborQuery* neighbor_query, const vec3<f
         util::forLoopWrapper(
             0, n_query_points,
             [=](size_t begin, size_t end) {
-                for (size_t i = begin; i != end; ++i)
+                // A single iterator is reused for all points in the range to
+                // avoid a heap allocation per point.
+                std::shared_ptr<NeighborQueryPerPointIterator> it;
+                for (size_t k = begin; k != end; ++k)
                 {
-                    std::shared_ptr<NeighborQueryPerPointIterator> it = iter->query(i);
+                    const size_t i = iter->getQueryPointIndex(k);
+                    iter->query(i, it);
                     cf(i, it);
                 }
             },
@@ -166,6 +259,9 @@ void loopOverNeighborsIterator(const NeighborQuery* neighbor_query, const vec3<f
  *  for the NeighborList vs NeighborQuery code paths are handled in helper
  *  functions.
  *
+ *  As in loopOverNeighborsIterator, bonds read from a NeighborList only
+ *  carry their vectors if compute_vectors is true.
+ *
  *  \param neighbor_query NeighborQuery object to iterate over.
  *  \param query_points Query points to perform computation on.
  *  \param n_query_points Number of query_points.
@@ -173,21 +269,47 @@ void loopOverNeighborsIterator(const NeighborQuery* neighbor_query, const vec3<f
  *  \param nlist Neighbor List. If not NULL, loop over it. Otherwise, use neighbor_query appropriately with
  * given qargs. \param cf An object with operator(NeighborBond) as input.
  */
-template<typename ComputePairType>
+template<bool compute_vectors = true, typename ComputePairType>
 void loopOverNeighbors(const NeighborQuery* neighbor_query, const vec3<float>* query_points,
                        unsigned int n_query_points, QueryArgs qargs, const NeighborList* nlist,
                        const ComputePairType& cf, bool parallel = true)
 {
     // check if nlist exists
-    if (nlist != nullptr)
+    if (nlist != nullptr && nlist->isCompressed())
+    {
+        // Compressed lists are iterated row by row using their offsets.
+        util::forLoopWrapper(
+            0, nlist->getNumQueryPoints(),
+            [=](size_t begin, size_t end) {
+                const auto& offsets = nlist->getOffsets();
+                for (size_t i = begin; i != end; ++i)
+                {
+                    for (size_t bond = offsets[i]; bond != offsets[i + 1]; ++bond)
+                    {
+                        const NeighborBond nb(
+                            i, nlist->getPointIndices()[bond], nlist->getDistances()[bond],
+                            nlist->getWeight(bond),
+                            compute_vectors ? bondVector(nlist, bond, i, neighbor_query, query_points)
+                                            : vec3<float>());
+                        cf(nb);
+                    }
+                }
+            },
+            parallel);
+    }
+    else if (nlist != nullptr)
     {
         util::forLoopWrapper(
             0, nlist->getNumBonds(),
             [=](size_t begin, size_t end) {
                 for (size_t bond = begin; bond != end; ++bond)
                 {
-                    const NeighborBond nb(nlist->getNeighbors()(bond, 0), nlist->getNeighbors()(bond, 1),
-                                          nlist->getDistances()[bond], nlist->getWeights()[bond]);
+                    const unsigned int i = nlist->getQueryPointIndices()[bond];
+                    const NeighborBond nb(
+                        i, nlist->getPointIndices()[bond], nlist->getDistances()[bond],
+                        nlist->getWeight(bond),
+                        compute_vectors ? bondVector(nlist, bond, i, neighbor_query, query_points)
+                                        : vec3<float>());
                     cf(nb);
                 }
             },
@@ -203,9 +325,12 @@ void loopOverNeighbors(const NeighborQuery* neighbor_query, const vec3<float>* q
             0, n_query_points,
             [&iter, &cf](size_t begin, size_t end) {
                 NeighborBond nb;
-                for (size_t i = begin; i != end; ++i)
+                // A single iterator is reused for all points in the range to
+                // avoid a heap allocation per point.
+                std::shared_ptr<NeighborQueryPerPointIterator> it;
+                for (size_t k = begin; k != end; ++k)
                 {
-                    std::shared_ptr<NeighborQueryPerPointIterator> it = iter->query(i);
+                    iter->query(iter->getQueryPointIndex(k), it);
                     nb = it->next();
                     while (!it->end())
                     {
@@ -2,36 +2,212 @@
 // This file is from the freud project, released under the BSD 3-Clause License.
 
 #include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <atomic>
+#include <ios>
+#include <limits>
+#include <stdexcept>
+
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
 
 #include "NeighborList.h"
 
 namespace freud { namespace locality {
 
+namespace {
+
+// Layout of the file header written by NeighborList::save. See the
+// documentation of NeighborList.save in locality.pyx for the full format.
+const char NLIST_FILE_MAGIC[8] = {'F', 'R', 'E', 'U', 'D', 'N', 'L', '\0'};
+const uint32_t NLIST_FILE_VERSION = 1;
+const uint32_t NLIST_FILE_BYTE_ORDER = 0x01020304;
+const uint32_t NLIST_FILE_HAS_WEIGHTS = 1;
+const uint32_t NLIST_FILE_HAS_VECTORS = 2;
+const size_t NLIST_FILE_ALIGNMENT = 64;
+
+struct NeighborListFileHeader
+{
+    char magic[8];
+    uint32_t version;
+    uint32_t byte_order;
+    uint32_t flags;
+    uint32_t num_query_points;
+    uint32_t num_points;
+    uint32_t reserved;
+    uint64_t num_bonds;
+    uint8_t padding[24];
+};
+
+static_assert(sizeof(NeighborListFileHeader) == NLIST_FILE_ALIGNMENT,
+              "The NeighborList file header must fill one aligned block.");
+static_assert(sizeof(size_t) == sizeof(uint64_t), "NeighborList files store offsets as 64-bit integers.");
+static_assert(sizeof(vec3<float>) == 3 * sizeof(float), "NeighborList files store vectors as 3 floats.");
+
+size_t alignSection(size_t offset)
+{
+    if (offset > std::numeric_limits<size_t>::max() - (NLIST_FILE_ALIGNMENT - 1))
+    {
+        throw std::invalid_argument("The NeighborList file header is invalid.");
+    }
+    return (offset + NLIST_FILE_ALIGNMENT - 1) / NLIST_FILE_ALIGNMENT * NLIST_FILE_ALIGNMENT;
+}
+
+//! Return the end of a section of count elements starting at begin.
+/*! The header of a corrupt file may give sizes whose sections would extend
+ *  past the largest representable offset, so the arithmetic is checked
+ *  rather than allowed to wrap around to an offset inside of the file.
+ */
+size_t sectionEnd(size_t begin, size_t element_size, uint64_t count)
+{
+    if (count > (std::numeric_limits<size_t>::max() - begin) / element_size)
+    {
+        throw std::invalid_argument("The NeighborList file header is invalid.");
+    }
+    return begin + element_size * static_cast<size_t>(count);
+}
+
+//! Byte offsets of the sections of a NeighborList file.
+struct NeighborListFileLayout
+{
+    explicit NeighborListFileLayout(const NeighborListFileHeader& header)
+    {
+        const uint64_t num_bonds = header.num_bonds;
+        offsets = sizeof(NeighborListFileHeader);
+        point_indices
+            = alignSection(sectionEnd(offsets, sizeof(uint64_t), uint64_t(header.num_query_points) + 1));
+        distances = alignSection(sectionEnd(point_indices, sizeof(uint32_t), num_bonds));
+        weights = alignSection(sectionEnd(distances, sizeof(float), num_bonds));
+        const bool has_weights = (header.flags & NLIST_FILE_HAS_WEIGHTS) != 0;
+        vectors = has_weights ? alignSection(sectionEnd(weights, sizeof(float), num_bonds)) : weights;
+        const bool has_vectors = (header.flags & NLIST_FILE_HAS_VECTORS) != 0;
+        end = has_vectors ? sectionEnd(vectors, 3 * sizeof(float), num_bonds) : vectors;
+    }
+
+    size_t offsets;
+    size_t point_indices;
+    size_t distances;
+    size_t weights;
+    size_t vectors;
+    size_t end;
+};
+
+void validateHeader(const NeighborListFileHeader& header, size_t file_size)
+{
+    if (std::memcmp(header.magic, NLIST_FILE_MAGIC, sizeof(NLIST_FILE_MAGIC)) != 0)
+    {
+        throw std::invalid_argument("The file does not contain a NeighborList.");
+    }
+    if (header.byte_order != NLIST_FILE_BYTE_ORDER)
+    {
+        throw std::invalid_argument("The NeighborList file was written with a different byte order.");
+    }
+    if (header.version != NLIST_FILE_VERSION)
+    {
+        throw std::invalid_argument("Unsupported NeighborList file version.");
+    }
+    if (NeighborListFileLayout(header).end > file_size)
+    {
+        throw std::invalid_argument("The NeighborList file is truncated.");
+    }
+}
+
+//! Memory map a whole file copy-on-write, returning its address and size.
+/*! The returned pointer unmaps the file when the last reference is released.
+ *  Pages are only read from disk when they are accessed, and writes to the
+ *  mapping are never written back to the file.
+ */
+std::shared_ptr<void> mapFile(const std::string& filename, size_t& file_size)
+{
+#ifdef _WIN32
+    throw std::runtime_error("Memory mapped NeighborList files are not supported on this platform.");
+#else
+    const int fd = open(filename.c_str(), O_RDONLY);
+    if (fd == -1)
+    {
+        throw std::ios_base::failure("Unable to open NeighborList file " + filename + ".");
+    }
+    struct stat file_stat;
+    if (fstat(fd, &file_stat) == -1)
+    {
+        close(fd);
+        throw std::ios_base::failure("Unable to read NeighborList file " + filename + ".");
+    }
+    file_size = file_stat.st_size;
+    if (file_size < sizeof(NeighborListFileHeader))
+    {
+        close(fd);
+        throw std::invalid_argument("The file does not contain a NeighborList.");
+    }
+    void* data = mmap(nullptr, file_size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+    // The mapping remains valid after the file descriptor is closed.
+    close(fd);
+    if (data == MAP_FAILED)
+    {
+        throw std::ios_base::failure("Unable to memory map NeighborList file " + filename + ".");
+    }
+    const size_t mapped_size = file_size;
+    return std::shared_ptr<void>(data, [mapped_size](void* ptr) { munmap(ptr, mapped_size); });
+#endif
+}
+
+template<typename T> void readSection(std::ifstream& file, size_t offset, util::ManagedArray<T>& array)
+{
+    file.seekg(offset);
+    file.read(reinterpret_cast<char*>(array.get()), sizeof(T) * array.size());
+}
+
+template<typename T> void writeSection(std::ofstream& file, const T* data, size_t count)
+{
+    const size_t position = file.tellp();
+    const std::vector<char> padding(alignSection(position) - position, 0);
+    file.write(padding.data(), padding.size());
+    file.write(reinterpret_cast<const char*>(data), sizeof(T) * count);
+}
+
+} // end anonymous namespace
+
 NeighborList::NeighborList()
-    : m_num_query_points(0), m_num_points(0), m_neighbors({0, 2}), m_distances(0), m_weights(0),
-      m_segments_counts_updated(false)
+    : m_num_query_points(0), m_num_points(0), m_compressed(false), m_offsets(0),
+      m_query_point_indices_updated(true), m_query_point_indices(0), m_point_indices(0), m_distances(0),
+      m_has_weights(true), m_weights(0), m_has_vectors(false), m_vectors(0), m_segments_counts_updated(false)
 {}
 
-NeighborList::NeighborList(unsigned int num_bonds)
-    : m_num_query_points(0), m_num_points(0), m_neighbors({num_bonds, 2}), m_distances(num_bonds),
-      m_weights(num_bonds), m_segments_counts_updated(false)
+NeighborList::NeighborList(size_t num_bonds, bool has_weights)
+    : m_num_query_points(0), m_num_points(0), m_compressed(false), m_offsets(0),
+      m_query_point_indices_updated(true), m_query_point_indices(num_bonds), m_point_indices(num_bonds),
+      m_distances(num_bonds), m_has_weights(has_weights), m_weights(has_weights ? num_bonds : 0),
+      m_has_vectors(false), m_vectors(0), m_segments_counts_updated(false)
 {}
 
 NeighborList::NeighborList(const NeighborList& other)
     : m_num_query_points(other.m_num_query_points), m_num_points(other.m_num_points),
+      m_compressed(other.m_compressed),
+      m_query_point_indices_updated(other.m_query_point_indices_updated.load()),
+      m_has_weights(other.m_has_weights.load()), m_has_vectors(other.m_has_vectors),
       m_segments_counts_updated(false)
 {
     copy(other);
 }
 
-NeighborList::NeighborList(unsigned int num_bonds, const unsigned int* query_point_index,
+NeighborList::NeighborList(size_t num_bonds, const unsigned int* query_point_index,
                            unsigned int num_query_points, const unsigned int* point_index,
-                           unsigned int num_points, const float* distances, const float* weights)
-    : m_num_query_points(num_query_points), m_num_points(num_points), m_neighbors({num_bonds, 2}),
-      m_distances(num_bonds), m_weights(num_bonds), m_segments_counts_updated(false)
+                           unsigned int num_points, const float* distances, const float* weights,
+                           const vec3<float>* vectors)
+    : m_num_query_points(num_query_points), m_num_points(num_points), m_compressed(false), m_offsets(0),
+      m_query_point_indices_updated(true), m_query_point_indices(num_bonds), m_point_indices(num_bonds),
+      m_distances(num_bonds), m_has_weights(weights != nullptr),
+      m_weights(weights != nullptr ? num_bonds : 0), m_has_vectors(vectors != nullptr),
+      m_vectors(vectors != nullptr ? num_bonds : 0), m_segments_counts_updated(false)
 {
     unsigned int last_index(0);
-    for (unsigned int i = 0; i < num_bonds; i++)
+    for (size_t i = 0; i < num_bonds; i++)
     {
         unsigned int index = query_point_index[i];
         if (index < last_index)
@@ -47,17 +223,47 @@ NeighborList::NeighborList(unsigned int num_bonds, const unsigned int* query_poi
         {
             throw std::invalid_argument("NeighborList point_index values must be less than num_points.");
         }
-        m_neighbors(i, 0) = index;
-        m_neighbors(i, 1) = point_index[i];
-        m_weights[i] = weights[i];
+        m_query_point_indices[i] = index;
+        m_point_indices[i] = point_index[i];
+        if (m_has_weights)
+        {
+            m_weights[i] = weights[i];
+        }
+        if (m_has_vectors)
+        {
+            m_vectors[i] = vectors[i];
+        }
         m_distances[i] = distances[i];
         last_index = index;
     }
 }
 
-unsigned int NeighborList::getNumBonds() const
+NeighborList& NeighborList::operator=(const NeighborList& other)
 {
-    return m_neighbors.shape()[0];
+    if (this != &other)
+    {
+        m_num_query_points = other.m_num_query_points;
+        m_num_points = other.m_num_points;
+        m_compressed = other.m_compressed;
+        m_offsets = other.m_offsets;
+        m_query_point_indices_updated = other.m_query_point_indices_updated.load();
+        m_query_point_indices = other.m_query_point_indices;
+        m_point_indices = other.m_point_indices;
+        m_distances = other.m_distances;
+        m_has_weights = other.m_has_weights.load();
+        m_weights = other.m_weights;
+        m_has_vectors = other.m_has_vectors;
+        m_vectors = other.m_vectors;
+        m_segments_counts_updated = other.m_segments_counts_updated;
+        m_counts = other.m_counts;
+        m_segments = other.m_segments;
+    }
+    return *this;
+}
+
+size_t NeighborList::getNumBonds() const
+{
+    return m_point_indices.size();
 }
 
 unsigned int NeighborList::getNumQueryPoints() const
@@ -70,26 +276,138 @@ unsigned int NeighborList::getNumPoints() const
     return m_num_points;
 }
 
-void NeighborList::setNumBonds(unsigned int num_bonds, unsigned int num_query_points, unsigned int num_points)
+void NeighborList::setNumBonds(size_t num_bonds, unsigned int num_query_points, unsigned int num_points,
+                               bool has_weights, bool compressed, bool has_vectors)
 {
+    // Resizing a compressed list works on the query point index column, so
+    // any existing list is decompressed before it is resized.
+    decompress();
+    if (!has_weights)
+    {
+        m_has_weights = false;
+        m_weights = util::ManagedArray<float>(0);
+    }
+    else
+    {
+        materializeWeights();
+    }
+    // Existing vectors are discarded since the caller fills any new ones.
+    m_has_vectors = false;
+    m_vectors = util::ManagedArray<vec3<float>>(0);
     resize(num_bonds);
+    if (has_vectors)
+    {
+        m_has_vectors = true;
+        m_vectors = util::ManagedArray<vec3<float>>(num_bonds);
+    }
     m_num_query_points = num_query_points;
     m_num_points = num_points;
+    if (compressed)
+    {
+        m_compressed = true;
+        m_offsets = util::ManagedArray<size_t>(static_cast<size_t>(num_query_points) + 1);
+        m_query_point_indices = util::ManagedArray<unsigned int>(0);
+        m_query_point_indices_updated = false;
+    }
     m_segments_counts_updated = false;
 }
 
+void NeighborList::compress()
+{
+    if (m_compressed)
+    {
+        return;
+    }
+    auto offsets = util::ManagedArray<size_t>(static_cast<size_t>(m_num_query_points) + 1);
+    size_t bond(0);
+    for (unsigned int i = 0; i < m_num_query_points; ++i)
+    {
+        offsets[i] = bond;
+        while (bond < getNumBonds() && m_query_point_indices[bond] == i)
+        {
+            ++bond;
+        }
+    }
+    offsets[m_num_query_points] = bond;
+
+    m_offsets = offsets;
+    m_compressed = true;
+    m_query_point_indices = util::ManagedArray<unsigned int>(0);
+    m_query_point_indices_updated = false;
+}
+
+void NeighborList::decompress()
+{
+    if (m_compressed)
+    {
+        materializeQueryPointIndices();
+        m_compressed = false;
+        m_offsets = util::ManagedArray<size_t>(0);
+    }
+}
+
+void NeighborList::materializeQueryPointIndices() const
+{
+    if (m_query_point_indices_updated)
+    {
+        return;
+    }
+    // Const accessors may be called concurrently, so the column is built by
+    // the first thread to take the lock and published through the flag.
+    std::lock_guard<std::mutex> lock(m_materialize_mutex);
+    if (!m_query_point_indices_updated)
+    {
+        auto query_point_indices = util::ManagedArray<unsigned int>(getNumBonds());
+        for (unsigned int i = 0; i < m_num_query_points; ++i)
+        {
+            std::fill(query_point_indices.get() + m_offsets[i], query_point_indices.get() + m_offsets[i + 1],
+                      i);
+        }
+        m_query_point_indices = query_point_indices;
+        m_query_point_indices_updated = true;
+    }
+}
+
+void NeighborList::materializeWeights() const
+{
+    if (m_has_weights)
+    {
+        return;
+    }
+    std::lock_guard<std::mutex> lock(m_materialize_mutex);
+    if (!m_has_weights)
+    {
+        auto weights = util::ManagedArray<float>(getNumBonds());
+        std::fill(weights.get(), weights.get() + weights.size(), float(1.0));
+        m_weights = weights;
+        m_has_weights = true;
+    }
+}
+
 void NeighborList::updateSegmentCounts() const
 {
     if (!m_segments_counts_updated)
     {
         m_counts.prepare(m_num_query_points);
         m_segments.prepare(m_num_query_points);
+        if (m_compressed)
+        {
+            // Like uncompressed lists, query points without bonds have a
+            // segment of 0.
+            for (unsigned int i = 0; i < m_num_query_points; ++i)
+            {
+                m_counts[i] = m_offsets[i + 1] - m_offsets[i];
+                m_segments[i] = (m_counts[i] != 0) ? m_offsets[i] : 0;
+            }
+            m_segments_counts_updated = true;
+            return;
+        }
         const unsigned int INDEX_TERMINATOR(0xffffffff);
         unsigned int last_index(INDEX_TERMINATOR);
         unsigned int counter(0);
-        for (unsigned int i = 0; i < getNumBonds(); i++)
+        for (size_t i = 0; i < getNumBonds(); i++)
         {
-            const unsigned int index(m_neighbors(i, 0));
+            const unsigned int index(m_query_point_indices[i]);
             if (index != last_index)
             {
                 m_segments[index] = i;
@@ -118,97 +436,84 @@ void NeighborList::updateSegmentCounts() const
 // (pre-iterator syntax), so we'll accept that level of type-safety for now. In
 // the future, if we expose a more appropriate iterator API then we'll need to
 // accept an "end" parameter as well.
-template<typename Iterator> unsigned int NeighborList::filter(Iterator begin)
+template<typename Iterator> size_t NeighborList::filter(Iterator begin)
 {
-    const unsigned int old_size(getNumBonds());
-    const auto end = begin + old_size;
-
-    // new_size is the number of good (unfiltered-out) elements
-    const unsigned int new_size(std::count(begin, end, true));
-
-    // Arrays to hold filtered data - we use new arrays instead of writing over
-    // existing data to avoid requiring a second pass in resize().
-    auto new_neighbors = util::ManagedArray<unsigned int>({new_size, 2});
-    auto new_distances = util::ManagedArray<float>(new_size);
-    auto new_weights = util::ManagedArray<float>(new_size);
-
-    auto current_element = begin;
-    unsigned int num_good(0);
-    for (unsigned int i(0); i < old_size; ++i)
-    {
-        if (*current_element)
-        {
-            new_neighbors(num_good, 0) = m_neighbors(i, 0);
-            new_neighbors(num_good, 1) = m_neighbors(i, 1);
-            new_weights[num_good] = m_weights[i];
-            new_distances[num_good] = m_distances[i];
-            ++num_good;
-        }
-        ++current_element;
-    }
-
-    m_neighbors = new_neighbors;
-    m_distances = new_distances;
-    m_weights = new_weights;
-    m_segments_counts_updated = false;
-    return old_size - new_size;
+    return filterIf([begin](size_t bond) { return static_cast<bool>(begin[bond]); });
 }
 
 // Explicit template instantiation required for usage in dynamically linked
 // Cython code.
-template unsigned int NeighborList::filter(std::vector<bool>::const_iterator);
-template unsigned int NeighborList::filter(std::vector<bool>::iterator);
-template unsigned int NeighborList::filter(const bool*);
-template unsigned int NeighborList::filter(bool*);
+template size_t NeighborList::filter(std::vector<bool>::const_iterator);
+template size_t NeighborList::filter(std::vector<bool>::iterator);
+template size_t NeighborList::filter(const bool*);
+template size_t NeighborList::filter(bool*);
 
-unsigned int NeighborList::filter_r(float r_max, float r_min)
+size_t NeighborList::filter_r(float r_max, float r_min)
 {
-    std::vector<bool> dist_filter(getNumBonds());
-    for (unsigned int i(0); i < getNumBonds(); ++i)
-    {
-        dist_filter[i] = (m_distances[i] >= r_min && m_distances[i] < r_max);
-    }
-    return filter(dist_filter.cbegin());
+    const float* distances = m_distances.get();
+    return filterIf([distances, r_min, r_max](size_t bond) {
+        return distances[bond] >= r_min && distances[bond] < r_max;
+    });
 }
 
-unsigned int NeighborList::find_first_index(unsigned int i) const
+size_t NeighborList::find_first_index_uncompressed(unsigned int i) const
 {
     if (getNumBonds() != 0)
     {
-        return bisection_search(i, 0, getNumBonds()) + (i > m_neighbors(0, 0) ? 1 : 0);
+        return bisection_search(i, 0, getNumBonds()) + (i > m_query_point_indices[0] ? 1 : 0);
     }
     return 0;
 }
 
-void NeighborList::resize(unsigned int num_bonds)
+void NeighborList::resize(size_t num_bonds)
 {
-    auto new_neighbors = util::ManagedArray<unsigned int>({num_bonds, 2});
+    decompress();
+    auto new_query_point_indices = util::ManagedArray<unsigned int>(num_bonds);
+    auto new_point_indices = util::ManagedArray<unsigned int>(num_bonds);
     auto new_distances = util::ManagedArray<float>(num_bonds);
-    auto new_weights = util::ManagedArray<float>(num_bonds);
+    auto new_weights = util::ManagedArray<float>(m_has_weights ? num_bonds : 0);
+    auto new_vectors = util::ManagedArray<vec3<float>>(m_has_vectors ? num_bonds : 0);
 
     // On shrinking resizes, keep existing data.
     if (num_bonds <= getNumBonds())
     {
-        for (unsigned int i = 0; i < num_bonds; i++)
+        for (size_t i = 0; i < num_bonds; i++)
         {
-            new_neighbors(i, 0) = m_neighbors(i, 0);
-            new_neighbors(i, 1) = m_neighbors(i, 1);
+            new_query_point_indices[i] = m_query_point_indices[i];
+            new_point_indices[i] = m_point_indices[i];
             new_distances[i] = m_distances[i];
-            new_weights[i] = m_weights[i];
+            if (m_has_weights)
+            {
+                new_weights[i] = m_weights[i];
+            }
+            if (m_has_vectors)
+            {
+                new_vectors[i] = m_vectors[i];
+            }
         }
     }
 
-    m_neighbors = new_neighbors;
+    m_query_point_indices = new_query_point_indices;
+    m_point_indices = new_point_indices;
     m_distances = new_distances;
     m_weights = new_weights;
+    m_vectors = new_vectors;
     m_segments_counts_updated = false;
 }
 
 void NeighborList::copy(const NeighborList& other)
 {
-    setNumBonds(other.getNumBonds(), other.getNumQueryPoints(), other.getNumPoints());
-    m_neighbors = other.m_neighbors.copy();
+    m_num_query_points = other.getNumQueryPoints();
+    m_num_points = other.getNumPoints();
+    m_compressed = other.m_compressed;
+    m_offsets = other.m_offsets.copy();
+    m_query_point_indices_updated = other.m_query_point_indices_updated.load();
+    m_query_point_indices = other.m_query_point_indices.copy();
+    m_point_indices = other.m_point_indices.copy();
+    m_has_weights = other.m_has_weights.load();
     m_weights = other.m_weights.copy();
+    m_has_vectors = other.m_has_vectors;
+    m_vectors = other.m_vectors.copy();
     m_distances = other.m_distances.copy();
     m_segments_counts_updated = false;
 }
@@ -225,16 +530,206 @@ void NeighborList::validate(unsigned int num_query_points, unsigned int num_poin
     }
 }
 
-unsigned int NeighborList::bisection_search(unsigned int val, unsigned int left, unsigned int right) const
+void NeighborList::save(const std::string& filename) const
+{
+    const size_t num_bonds = getNumBonds();
+    util::ManagedArray<size_t> offsets = m_offsets;
+    if (!m_compressed)
+    {
+        // Uncompressed lists are sorted by query point, so they are
+        // converted to offsets the same way compress does.
+        offsets = util::ManagedArray<size_t>(static_cast<size_t>(m_num_query_points) + 1);
+        size_t bond(0);
+        for (unsigned int i = 0; i < m_num_query_points; ++i)
+        {
+            offsets[i] = bond;
+            while (bond < num_bonds && m_query_point_indices[bond] == i)
+            {
+                ++bond;
+            }
+        }
+        offsets[m_num_query_points] = bond;
+        if (bond != num_bonds)
+        {
+            throw std::invalid_argument("NeighborList bonds must be sorted by query point index "
+                                        "to be saved.");
+        }
+    }
+
+    NeighborListFileHeader header {};
+    std::memcpy(header.magic, NLIST_FILE_MAGIC, sizeof(NLIST_FILE_MAGIC));
+    header.version = NLIST_FILE_VERSION;
+    header.byte_order = NLIST_FILE_BYTE_ORDER;
+    header.flags
+        = (m_has_weights ? NLIST_FILE_HAS_WEIGHTS : 0) | (m_has_vectors ? NLIST_FILE_HAS_VECTORS : 0);
+    header.num_query_points = m_num_query_points;
+    header.num_points = m_num_points;
+    header.num_bonds = num_bonds;
+
+    std::ofstream file(filename, std::ios::binary | std::ios::trunc);
+    if (!file)
+    {
+        throw std::ios_base::failure("Unable to open NeighborList file " + filename + " for writing.");
+    }
+    file.write(reinterpret_cast<const char*>(&header), sizeof(header));
+    writeSection(file, offsets.get(), offsets.size());
+    writeSection(file, m_point_indices.get(), num_bonds);
+    writeSection(file, m_distances.get(), num_bonds);
+    if (m_has_weights)
+    {
+        writeSection(file, m_weights.get(), num_bonds);
+    }
+    if (m_has_vectors)
+    {
+        writeSection(file, m_vectors.get(), num_bonds);
+    }
+    if (!file)
+    {
+        throw std::ios_base::failure("Unable to write NeighborList file " + filename + ".");
+    }
+}
+
+void NeighborList::load(const std::string& filename, bool mmap)
+{
+    NeighborListFileHeader header {};
+    size_t num_query_points(0);
+    size_t num_bonds(0);
+    util::ManagedArray<size_t> offsets;
+    util::ManagedArray<unsigned int> point_indices;
+    util::ManagedArray<float> distances;
+    util::ManagedArray<float> weights;
+    util::ManagedArray<vec3<float>> vectors;
+
+#ifdef _WIN32
+    // Memory mapping is only implemented for POSIX systems.
+    mmap = false;
+#endif
+    if (mmap)
+    {
+        size_t file_size(0);
+        std::shared_ptr<void> mapping = mapFile(filename, file_size);
+        char* data = static_cast<char*>(mapping.get());
+        std::memcpy(&header, data, sizeof(header));
+        validateHeader(header, file_size);
+        const NeighborListFileLayout layout(header);
+        num_query_points = header.num_query_points;
+        num_bonds = header.num_bonds;
+
+        // Each array refers directly to its section of the mapped file and
+        // keeps the mapping alive.
+        offsets = util::ManagedArray<size_t>(reinterpret_cast<size_t*>(data + layout.offsets),
+                                             {num_query_points + 1}, mapping);
+        point_indices = util::ManagedArray<unsigned int>(
+            reinterpret_cast<unsigned int*>(data + layout.point_indices), {num_bonds}, mapping);
+        distances = util::ManagedArray<float>(reinterpret_cast<float*>(data + layout.distances),
+                                              {num_bonds}, mapping);
+        if ((header.flags & NLIST_FILE_HAS_WEIGHTS) != 0)
+        {
+            weights = util::ManagedArray<float>(reinterpret_cast<float*>(data + layout.weights),
+                                                {num_bonds}, mapping);
+        }
+        if ((header.flags & NLIST_FILE_HAS_VECTORS) != 0)
+        {
+            vectors = util::ManagedArray<vec3<float>>(reinterpret_cast<vec3<float>*>(data + layout.vectors),
+                                                      {num_bonds}, mapping);
+        }
+    }
+    else
+    {
+        std::ifstream file(filename, std::ios::binary | std::ios::ate);
+        if (!file)
+        {
+            throw std::ios_base::failure("Unable to open NeighborList file " + filename + ".");
+        }
+        const size_t file_size = file.tellg();
+        file.seekg(0);
+        if (file_size < sizeof(header) || !file.read(reinterpret_cast<char*>(&header), sizeof(header)))
+        {
+            throw std::invalid_argument("The file does not contain a NeighborList.");
+        }
+        validateHeader(header, file_size);
+        const NeighborListFileLayout layout(header);
+        num_query_points = header.num_query_points;
+        num_bonds = header.num_bonds;
+
+        offsets = util::ManagedArray<size_t>(num_query_points + 1);
+        readSection(file, layout.offsets, offsets);
+        point_indices = util::ManagedArray<unsigned int>(num_bonds);
+        readSection(file, layout.point_indices, point_indices);
+        distances = util::ManagedArray<float>(num_bonds);
+        readSection(file, layout.distances, distances);
+        if ((header.flags & NLIST_FILE_HAS_WEIGHTS) != 0)
+        {
+            weights = util::ManagedArray<float>(num_bonds);
+            readSection(file, layout.weights, weights);
+        }
+        if ((header.flags & NLIST_FILE_HAS_VECTORS) != 0)
+        {
+            vectors = util::ManagedArray<vec3<float>>(num_bonds);
+            readSection(file, layout.vectors, vectors);
+        }
+        if (!file)
+        {
+            throw std::ios_base::failure("Unable to read NeighborList file " + filename + ".");
+        }
+
+        // The point indices have been read into memory anyways, so they are
+        // checked here. Mapped files are not scanned, so that their pages are
+        // only read when they are used.
+        const unsigned int num_points = header.num_points;
+        std::atomic<bool> valid_point_indices(true);
+        util::forLoopWrapper(0, num_bonds, [&](size_t begin, size_t end) {
+            for (size_t bond = begin; bond < end; ++bond)
+            {
+                if (point_indices[bond] >= num_points)
+                {
+                    valid_point_indices.store(false, std::memory_order_relaxed);
+                    return;
+                }
+            }
+        });
+        if (!valid_point_indices)
+        {
+            throw std::invalid_argument("The NeighborList file contains point indices that are not less "
+                                        "than the number of points.");
+        }
+    }
+
+    // Checking the offsets is cheap and ensures that every bond lookup stays
+    // in bounds. Since the query point index of each bond is given by the
+    // offsets, this also ensures that every query point index is less than
+    // the number of query points.
+    if (offsets[0] != 0 || offsets[num_query_points] != num_bonds
+        || !std::is_sorted(offsets.get(), offsets.get() + offsets.size()))
+    {
+        throw std::invalid_argument("The NeighborList file contains invalid offsets.");
+    }
+
+    m_num_query_points = header.num_query_points;
+    m_num_points = header.num_points;
+    m_compressed = true;
+    m_offsets = offsets;
+    m_query_point_indices = util::ManagedArray<unsigned int>(0);
+    m_query_point_indices_updated = false;
+    m_point_indices = point_indices;
+    m_distances = distances;
+    m_has_weights = (header.flags & NLIST_FILE_HAS_WEIGHTS) != 0;
+    m_weights = weights;
+    m_has_vectors = (header.flags & NLIST_FILE_HAS_VECTORS) != 0;
+    m_vectors = vectors;
+    m_segments_counts_updated = false;
+}
+
+size_t NeighborList::bisection_search(unsigned int val, size_t left, size_t right) const
 {
     if (left + 1 >= right)
     {
         return left;
     }
 
-    unsigned int middle((left + right) / 2);
+    size_t middle((left + right) / 2);
 
-    if (m_neighbors(middle, 0) < val)
+    if (m_query_point_indices[middle] < val)
     {
         return bisection_search(val, middle, right);
     }
@@ -4,12 +4,18 @@
 #ifndef NEIGHBOR_LIST_H
 #define NEIGHBOR_LIST_H
 
+#include <algorithm>
+#include <atomic>
+#include <mutex>
+#include <numeric>
+#include <string>
 #include <vector>
 
 #include "Box.h"
 #include "ManagedArray.h"
 #include "NeighborBond.h"
 #include "VectorMath.h"
+#include "utils.h"
 
 namespace freud { namespace locality {
 
@@ -21,8 +27,33 @@ namespace freud { namespace locality {
 
     <b>Data structures:</b>
 
-    Query point and point indices are stored in a 2D array m_neighbors of shape
-    (n_bonds, 2). The distances and weights arrays are flat per-bond arrays.
+    Query point indices, point indices, distances, and weights are stored in
+    separate flat per-bond arrays. Bond counts and bond indices are stored as
+    size_t so that lists may hold more than 2^32 bonds.
+
+    Lists in which every bond has unit weight (such as those generated by
+    neighbor queries) may omit the weights array entirely, in which case
+    getWeight returns 1 for every bond. Calling getWeights on such a list
+    allocates and fills the weights array.
+
+    Lists may also store the vector of each bond, pointing from the query
+    point to the point and wrapped into the box. Lists generated by neighbor
+    queries store the vectors computed by the query if the vectors query
+    argument is set. Computes recompute the vectors of lists without them
+    from the points.
+
+    <b>Compressed mode:</b>
+
+    A compressed NeighborList stores bonds in compressed sparse row (CSR)
+    form: an array of m_num_query_points + 1 offsets such that the bonds of
+    query point i occupy the range [offsets[i], offsets[i + 1]), together with
+    the per-bond point indices, distances, and weights. The per-bond query
+    point index column is only materialized when getQueryPointIndices is
+    called, and find_first_index is a constant-time lookup. Like the segments
+    and counts arrays, the query point index column of a compressed list is
+    built lazily. Building it (or the weights array of a list without
+    weights) is guarded by a mutex, so the first access may happen
+    concurrently from parallel code.
  */
 class NeighborList
 {
@@ -30,30 +61,80 @@ public:
     //! Default constructor
     NeighborList();
     //! Create a NeighborList that can hold up to the given number of bonds
-    explicit NeighborList(unsigned int num_bonds);
+    explicit NeighborList(size_t num_bonds, bool has_weights = true);
     //! Copy constructor (makes a deep copy)
     NeighborList(const NeighborList& other);
     //! Construct from arrays
-    NeighborList(unsigned int num_bonds, const unsigned int* query_point_index, unsigned int num_query_points,
+    /*! If weights is a null pointer, all bonds are given unit weight and no
+     *  weights array is stored. If vectors is a null pointer, no vectors are
+     *  stored.
+     */
+    NeighborList(size_t num_bonds, const unsigned int* query_point_index, unsigned int num_query_points,
                  const unsigned int* point_index, unsigned int num_points, const float* distances,
-                 const float* weights);
+                 const float* weights, const vec3<float>* vectors = nullptr);
+    //! Assignment operator (shares the arrays of other, like ManagedArray assignment)
+    NeighborList& operator=(const NeighborList& other);
 
     //! Return the number of bonds stored in this NeighborList
-    unsigned int getNumBonds() const;
+    size_t getNumBonds() const;
     //! Return the number of query points this NeighborList was built with
     unsigned int getNumQueryPoints() const;
     //! Return the number of points this NeighborList was built with
     unsigned int getNumPoints() const;
 
     //! Set the number of bonds, query points, and points for this NeighborList object
-    void setNumBonds(unsigned int num_bonds, unsigned int num_query_points, unsigned int num_points);
+    /*! If compressed is true, the list is put in compressed mode and the
+     *  offsets array returned by getOffsets must be filled instead of the
+     *  query point indices array. If has_vectors is true, the vectors array
+     *  returned by getVectors must be filled as well.
+     */
+    void setNumBonds(size_t num_bonds, unsigned int num_query_points, unsigned int num_points,
+                     bool has_weights = true, bool compressed = false, bool has_vectors = false);
     //! Update the arrays of neighbor counts and segments
     void updateSegmentCounts() const;
 
-    //! Access the neighbors array for reading and writing
-    util::ManagedArray<unsigned int>& getNeighbors()
+    //! Return whether this NeighborList is stored in compressed (CSR) form
+    bool isCompressed() const
+    {
+        return m_compressed;
+    }
+
+    //! Convert this NeighborList to compressed form, discarding the query point index column
+    void compress();
+
+    //! Return whether this NeighborList stores per-bond weights
+    bool hasWeights() const
+    {
+        return m_has_weights;
+    }
+
+    //! Return the weight of a bond
+    float getWeight(size_t bond) const
     {
-        return m_neighbors;
+        return m_has_weights ? m_weights[bond] : float(1.0);
+    }
+
+    //! Return whether this NeighborList stores per-bond vectors
+    bool hasVectors() const
+    {
+        return m_has_vectors;
+    }
+
+    //! Access the query point indices array for reading and writing
+    util::ManagedArray<unsigned int>& getQueryPointIndices()
+    {
+        materializeQueryPointIndices();
+        return m_query_point_indices;
+    }
+    //! Access the query point offsets array of a compressed list for reading and writing
+    util::ManagedArray<size_t>& getOffsets()
+    {
+        return m_offsets;
+    }
+    //! Access the point indices array for reading and writing
+    util::ManagedArray<unsigned int>& getPointIndices()
+    {
+        return m_point_indices;
     }
     //! Access the distances array for reading and writing
     util::ManagedArray<float>& getDistances()
@@ -63,8 +144,14 @@ public:
     //! Access the weights array for reading and writing
     util::ManagedArray<float>& getWeights()
     {
+        materializeWeights();
         return m_weights;
     }
+    //! Access the vectors array for reading and writing
+    util::ManagedArray<vec3<float>>& getVectors()
+    {
+        return m_vectors;
+    }
     //! Access the counts array for reading
     util::ManagedArray<unsigned int>& getCounts()
     {
@@ -72,16 +159,27 @@ public:
         return m_counts;
     }
     //! Access the segments array for reading
-    util::ManagedArray<unsigned int>& getSegments()
+    util::ManagedArray<size_t>& getSegments()
     {
         updateSegmentCounts();
         return m_segments;
     }
 
-    //! Access the neighbors array for reading
-    const util::ManagedArray<unsigned int>& getNeighbors() const
+    //! Access the query point indices array for reading
+    const util::ManagedArray<unsigned int>& getQueryPointIndices() const
     {
-        return m_neighbors;
+        materializeQueryPointIndices();
+        return m_query_point_indices;
+    }
+    //! Access the query point offsets array of a compressed list for reading
+    const util::ManagedArray<size_t>& getOffsets() const
+    {
+        return m_offsets;
+    }
+    //! Access the point indices array for reading
+    const util::ManagedArray<unsigned int>& getPointIndices() const
+    {
+        return m_point_indices;
     }
     //! Access the distances array for reading
     const util::ManagedArray<float>& getDistances() const
@@ -91,8 +189,14 @@ public:
     //! Access the weights array for reading
     const util::ManagedArray<float>& getWeights() const
     {
+        materializeWeights();
         return m_weights;
     }
+    //! Access the vectors array for reading
+    const util::ManagedArray<vec3<float>>& getVectors() const
+    {
+        return m_vectors;
+    }
     //! Access the counts array for reading
     const util::ManagedArray<unsigned int>& getCounts() const
     {
@@ -100,7 +204,7 @@ public:
         return m_counts;
     }
     //! Access the segments array for reading
-    const util::ManagedArray<unsigned int>& getSegments() const
+    const util::ManagedArray<size_t>& getSegments() const
     {
         updateSegmentCounts();
         return m_segments;
@@ -109,46 +213,198 @@ public:
     //! Remove bonds in this object based on an array of boolean values. The
     //  array must be at least as long as the number of neighbor bonds.
     //  Returns the number of bonds removed.
-    template<typename Iterator> unsigned int filter(Iterator begin);
+    template<typename Iterator> size_t filter(Iterator begin);
+    //! Remove bonds for which keep(bond) returns false. Returns the number
+    //  of bonds removed.
+    /*! The bonds are compacted in parallel, so keep is called concurrently
+     *  and must be safe to call from multiple threads.
+     */
+    template<typename Predicate> size_t filterIf(const Predicate& keep);
     //! Remove bonds in this object based on minimum and maximum distance
     //  constraints. Returns the number of bonds removed.
-    unsigned int filter_r(float r_max, float r_min = 0);
+    size_t filter_r(float r_max, float r_min = 0);
 
     //! Return the first bond index corresponding to point i
-    unsigned int find_first_index(unsigned int i) const;
+    size_t find_first_index(unsigned int i) const
+    {
+        if (m_compressed)
+        {
+            return m_offsets[std::min(i, m_num_query_points)];
+        }
+        return find_first_index_uncompressed(i);
+    }
 
     //! Resize member arrays to a different size
-    void resize(unsigned int num_bonds);
+    void resize(size_t num_bonds);
 
     //! Copy the bonds from another NeighborList object
     void copy(const NeighborList& other);
+    //! Write the bonds to a binary file
+    /*! The file stores the bonds in compressed (CSR) form, so the bonds of an
+     *  uncompressed list must be sorted by query point index.
+     */
+    void save(const std::string& filename) const;
+    //! Replace the bonds with those stored in a file written by save
+    /*! The loaded list is compressed. If mmap is true, the file is memory
+     *  mapped copy-on-write and the arrays refer to the mapped memory without
+     *  copying it; otherwise the file is read into newly allocated arrays.
+     */
+    void load(const std::string& filename, bool mmap = true);
     //! Throw a runtime_error if num_points and num_query_points do not match
     //  the stored value
     void validate(unsigned int num_query_points, unsigned int num_points) const;
 
 private:
     //! Helper method for bisection search of the neighbor list, used in find_first_index
-    unsigned int bisection_search(unsigned int val, unsigned int left, unsigned int right) const;
+    size_t bisection_search(unsigned int val, size_t left, size_t right) const;
+
+    //! Find the first bond index of point i by searching the query point index column
+    size_t find_first_index_uncompressed(unsigned int i) const;
+
+    //! Fill the query point index column of a compressed list if it has not been built
+    void materializeQueryPointIndices() const;
+
+    //! Convert a compressed list back to storing the query point index column
+    void decompress();
+
+    //! Allocate a weights array of ones if this list does not store weights
+    void materializeWeights() const;
 
     //! Number of query points
     unsigned int m_num_query_points;
     //! Number of points
     unsigned int m_num_points;
-    //! Neighbor list indices array
-    util::ManagedArray<unsigned int> m_neighbors;
+    //! Track whether this list is stored in compressed (CSR) form
+    bool m_compressed;
+    //! Query point offsets array of a compressed list, empty otherwise
+    util::ManagedArray<size_t> m_offsets;
+    //! Track whether m_query_point_indices has been built for a compressed list
+    mutable std::atomic<bool> m_query_point_indices_updated;
+    //! Neighbor list per-bond query point index array, built lazily for compressed lists
+    mutable util::ManagedArray<unsigned int> m_query_point_indices;
+    //! Neighbor list per-bond point index array
+    util::ManagedArray<unsigned int> m_point_indices;
     //! Neighbor list per-bond distance array
     util::ManagedArray<float> m_distances;
-    //! Neighbor list per-bond weight array
-    util::ManagedArray<float> m_weights;
+    //! Track whether m_weights holds per-bond weights
+    mutable std::atomic<bool> m_has_weights;
+    //! Neighbor list per-bond weight array, empty if m_has_weights is false
+    mutable util::ManagedArray<float> m_weights;
+    //! Track whether m_vectors holds per-bond vectors
+    bool m_has_vectors;
+    //! Neighbor list per-bond vector array, empty if m_has_vectors is false
+    util::ManagedArray<vec3<float>> m_vectors;
+
+    //! Serializes the lazy construction of the query point index column and the weights
+    mutable std::mutex m_materialize_mutex;
 
     //! Track whether segments and counts are up to date
     mutable bool m_segments_counts_updated;
     //! Neighbor counts for each query point
     mutable util::ManagedArray<unsigned int> m_counts;
     //! Neighbor segments for each query point
-    mutable util::ManagedArray<unsigned int> m_segments;
+    mutable util::ManagedArray<size_t> m_segments;
 };
 
+template<typename Predicate> size_t NeighborList::filterIf(const Predicate& keep)
+{
+    // Bonds are compacted with a parallel prefix sum: the kept bonds of each
+    // block are counted, the counts are scanned to find where each block
+    // writes its bonds, and the blocks are then copied independently.
+    const size_t old_size(getNumBonds());
+    const size_t block_size(16384);
+    const size_t num_blocks((old_size + block_size - 1) / block_size);
+
+    std::vector<size_t> block_offsets(num_blocks + 1, 0);
+    util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+        for (size_t block = begin; block < end; ++block)
+        {
+            const size_t bond_end(std::min(old_size, (block + 1) * block_size));
+            size_t num_kept(0);
+            for (size_t bond = block * block_size; bond < bond_end; ++bond)
+            {
+                num_kept += keep(bond) ? 1 : 0;
+            }
+            block_offsets[block + 1] = num_kept;
+        }
+    });
+    std::partial_sum(block_offsets.begin(), block_offsets.end(), block_offsets.begin());
+    const size_t new_size(block_offsets[num_blocks]);
+
+    // Arrays to hold filtered data - we use new arrays instead of writing over
+    // existing data to avoid requiring a second pass in resize().
+    auto new_query_point_indices = util::ManagedArray<unsigned int>(m_compressed ? 0 : new_size);
+    auto new_point_indices = util::ManagedArray<unsigned int>(new_size);
+    auto new_distances = util::ManagedArray<float>(new_size);
+    auto new_weights = util::ManagedArray<float>(m_has_weights ? new_size : 0);
+    auto new_vectors = util::ManagedArray<vec3<float>>(m_has_vectors ? new_size : 0);
+
+    // Compressed lists only track the new offset of each query point, which
+    // is the number of kept bonds before its old offset.
+    auto new_offsets = util::ManagedArray<size_t>(m_compressed ? m_offsets.size() : 0);
+    const size_t* offsets = m_offsets.get();
+    const size_t* offsets_end = offsets + m_offsets.size();
+
+    util::forLoopWrapper(0, num_blocks, [&](size_t begin, size_t end) {
+        for (size_t block = begin; block < end; ++block)
+        {
+            const size_t bond_begin(block * block_size);
+            const size_t bond_end(std::min(old_size, bond_begin + block_size));
+            size_t num_good(block_offsets[block]);
+            const size_t* offset
+                = m_compressed ? std::lower_bound(offsets, offsets_end, bond_begin) : nullptr;
+            for (size_t bond = bond_begin; bond < bond_end; ++bond)
+            {
+                if (m_compressed)
+                {
+                    for (; offset != offsets_end && *offset == bond; ++offset)
+                    {
+                        new_offsets.get()[offset - offsets] = num_good;
+                    }
+                }
+                if (keep(bond))
+                {
+                    if (!m_compressed)
+                    {
+                        new_query_point_indices.get()[num_good] = m_query_point_indices.get()[bond];
+                    }
+                    new_point_indices.get()[num_good] = m_point_indices.get()[bond];
+                    new_distances.get()[num_good] = m_distances.get()[bond];
+                    if (m_has_weights)
+                    {
+                        new_weights.get()[num_good] = m_weights.get()[bond];
+                    }
+                    if (m_has_vectors)
+                    {
+                        new_vectors.get()[num_good] = m_vectors.get()[bond];
+                    }
+                    ++num_good;
+                }
+            }
+        }
+    });
+
+    if (m_compressed)
+    {
+        // Query points without bonds at the end of the list start after all
+        // kept bonds.
+        for (const size_t* offset = std::lower_bound(offsets, offsets_end, old_size); offset != offsets_end;
+             ++offset)
+        {
+            new_offsets.get()[offset - offsets] = new_size;
+        }
+        m_offsets = new_offsets;
+        m_query_point_indices_updated = false;
+    }
+    m_query_point_indices = new_query_point_indices;
+    m_point_indices = new_point_indices;
+    m_distances = new_distances;
+    m_weights = new_weights;
+    m_vectors = new_vectors;
+    m_segments_counts_updated = false;
+    return old_size - new_size;
+}
+
 bool compareNeighborBond(const NeighborBond& left, const NeighborBond& right);
 bool compareNeighborDistance(const NeighborBond& left, const NeighborBond& right);
 bool compareFirstNeighborPairs(const std::vector<NeighborBond>& left, const std::vector<NeighborBond>& right);
@@ -4,11 +4,16 @@
 #ifndef NEIGHBOR_QUERY_H
 #define NEIGHBOR_QUERY_H
 
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+#include <cstdint>
 #include <memory>
 #include <stdexcept>
 #include <tbb/enumerable_thread_specific.h>
 #include <tbb/parallel_sort.h>
 #include <utility>
+#include <vector>
 
 #include "Box.h"
 #include "NeighborBond.h"
@@ -38,6 +43,8 @@ constexpr float DEFAULT_R_MIN(0);                         //!< Default minimum q
 constexpr float DEFAULT_R_GUESS(-1.0);                    //!< Default guess query distance.
 constexpr float DEFAULT_SCALE(-1.0);      //!< Default scaling parameter for AABB nearest neighbor queries.
 constexpr bool DEFAULT_EXCLUDE_II(false); //!< Default for whether or not to include self-neighbors.
+constexpr bool DEFAULT_HALF(false);       //!< Default for whether or not to find each pair only once.
+constexpr bool DEFAULT_VECTORS(false);    //!< Default for whether or not to store bond vectors in lists.
 constexpr auto ITERATOR_TERMINATOR
     = NeighborBond(-1, -1, 0); //!< The object returned when iteration is complete.
 
@@ -60,6 +67,11 @@ struct QueryArgs
     float scale {DEFAULT_SCALE};          //! The scale factor to use when performing repeated ball queries
                                           //! to find a specified number of nearest neighbors.
     bool exclude_ii {DEFAULT_EXCLUDE_II}; //! If true, exclude self-neighbors.
+    bool half {DEFAULT_HALF}; //! If true, skip neighbors with point index less than the query point index,
+                              //! so that each pair of a self-query is found once. Where possible, the
+                              //! search skips these neighbors without computing their distances.
+    bool vectors {DEFAULT_VECTORS}; //! If true, NeighborLists built from the query store the vector of each
+                                    //! bond.
 };
 
 // Forward declare the iterators
@@ -89,17 +101,7 @@ public:
             throw std::invalid_argument("Cannot create a NeighborQuery with 0 particles.");
         }
 
-        // For 2D systems, check if any z-coordinates are outside some tolerance of z=0
-        if (m_box.is2D())
-        {
-            for (unsigned int i(0); i < n_points; i++)
-            {
-                if (std::abs(m_points[i].z) > 1e-6)
-                {
-                    throw std::invalid_argument("A point with z != 0 was provided in a 2D box.");
-                }
-            }
-        }
+        validatePoints(m_points);
     }
 
     //! Empty Destructor
@@ -120,13 +122,6 @@ public:
     virtual std::shared_ptr<NeighborQueryIterator>
     query(const vec3<float>* query_points, unsigned int n_query_points, QueryArgs query_args) const
     {
-        // pair calculations using non-periodic boxes should fail
-        vec3<bool> periodic = m_box.getPeriodic();
-        if (!(periodic.x && periodic.y && periodic.z))
-        {
-            throw std::domain_error("Pair queries in a non-periodic box are not implemented.");
-        }
-
         this->validateQueryArgs(query_args);
         return std::make_shared<NeighborQueryIterator>(this, query_points, n_query_points, query_args);
     }
@@ -174,7 +169,129 @@ public:
         return m_points[index];
     }
 
+    //! Return whether the points are stored internally in spatially sorted order
+    bool isReordered() const
+    {
+        return !m_order.empty();
+    }
+
+    //! Get the spatial order of the points
+    /*! Element k is the index of the k-th point along a Morton (Z-order)
+     *  curve through the box. The array is empty if the points are not
+     *  reordered.
+     */
+    const std::vector<unsigned int>& getOrder() const
+    {
+        return m_order;
+    }
+
+    //! Get the points in the order used to build the data structure
+    /*! These are the points sorted by getOrder if the points are reordered,
+     *  and the points themselves otherwise.
+     */
+    const vec3<float>* getStoragePoints() const
+    {
+        return m_order.empty() ? m_points : m_ordered_points.data();
+    }
+
+    //! Convert the index of a point in getStoragePoints to its index in getPoints
+    unsigned int toPointIndex(unsigned int storage_idx) const
+    {
+        return m_order.empty() ? storage_idx : m_order[storage_idx];
+    }
+
 protected:
+    //! Sort the points along a Morton (Z-order) curve.
+    /*! Data structures that store points in this order place points that are
+     *  close in space close in memory, which makes neighbor traversal more
+     *  cache friendly for inputs in arbitrary order. This computes the
+     *  permutation returned by getOrder and the sorted copy of the points
+     *  returned by getStoragePoints.
+     */
+    void computeOrder()
+    {
+        std::vector<std::pair<uint64_t, unsigned int>> codes(m_n_points);
+        util::forLoopWrapper(0, m_n_points, [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i)
+            {
+                codes[i] = {mortonCode(m_box.makeFractional(m_points[i])), static_cast<unsigned int>(i)};
+            }
+        });
+        tbb::parallel_sort(codes.begin(), codes.end());
+
+        m_order.resize(m_n_points);
+        m_ordered_points.resize(m_n_points);
+        util::forLoopWrapper(0, m_n_points, [&](size_t begin, size_t end) {
+            for (size_t k = begin; k < end; ++k)
+            {
+                m_order[k] = codes[k].second;
+            }
+        });
+        updateOrderedPoints();
+    }
+
+    //! Copy the points into m_ordered_points in the order given by m_order.
+    void updateOrderedPoints()
+    {
+        util::forLoopWrapper(0, m_order.size(), [&](size_t begin, size_t end) {
+            for (size_t k = begin; k < end; ++k)
+            {
+                m_ordered_points[k] = m_points[m_order[k]];
+            }
+        });
+    }
+
+    //! Compute the 63-bit Morton code of a fractional position.
+    /*! Each fractional coordinate is wrapped into [0, 1) and quantized to 21
+     *  bits, and the bits of the three coordinates are interleaved.
+     */
+    static uint64_t mortonCode(const vec3<float>& frac)
+    {
+        constexpr uint64_t bits_per_dim(21);
+        constexpr float scale(static_cast<float>(uint64_t(1) << bits_per_dim));
+        const auto quantize = [&](float x) {
+            x -= std::floor(x);
+            return std::min(static_cast<uint64_t>(x * scale), (uint64_t(1) << bits_per_dim) - 1);
+        };
+        // Spread the 21 bits of v so that there are two zero bits between each.
+        const auto spread = [](uint64_t v) {
+            v = (v | (v << 32)) & 0x1f00000000ffffULL;
+            v = (v | (v << 16)) & 0x1f0000ff0000ffULL;
+            v = (v | (v << 8)) & 0x100f00f00f00f00fULL;
+            v = (v | (v << 4)) & 0x10c30c30c30c30c3ULL;
+            v = (v | (v << 2)) & 0x1249249249249249ULL;
+            return v;
+        };
+        return spread(quantize(frac.x)) | (spread(quantize(frac.y)) << 1) | (spread(quantize(frac.z)) << 2);
+    }
+
+    //! Validate a set of m_n_points points for this NeighborQuery.
+    /*! For 2D systems, this checks that no z-coordinates are outside some
+     *  tolerance of z=0.
+     *
+     *  \param points The points to validate.
+     */
+    void validatePoints(const vec3<float>* points) const
+    {
+        if (m_box.is2D())
+        {
+            std::atomic<bool> nonzero_z(false);
+            util::forLoopWrapper(0, m_n_points, [&](size_t begin, size_t end) {
+                for (size_t i = begin; i < end && !nonzero_z.load(std::memory_order_relaxed); ++i)
+                {
+                    if (std::abs(points[i].z) > 1e-6)
+                    {
+                        nonzero_z.store(true, std::memory_order_relaxed);
+                    }
+                }
+            });
+            if (nonzero_z)
+            {
+                throw std::invalid_argument("A point with z != 0 was provided in a 2D box.");
+            }
+        }
+    }
+
     //! Validate the combination of specified arguments.
     /*! Before checking if the combination of parameters currently set is
      *  valid, this function first attempts to infer a mode if one is not set in
@@ -201,6 +318,10 @@ protected:
         }
         else if (args.mode == QueryType::nearest)
         {
+            if (args.half)
+            {
+                throw std::runtime_error("Half queries are only supported for ball queries.");
+            }
             if (args.num_neighbors == DEFAULT_NUM_NEIGHBORS)
             {
                 throw std::runtime_error("You must set num_neighbors in the query arguments when performing "
@@ -242,6 +363,8 @@ protected:
     const box::Box m_box;        //!< Simulation box where the particles belong.
     const vec3<float>* m_points; //!< Point coordinates.
     unsigned int m_n_points;     //!< Number of points.
+    std::vector<unsigned int> m_order;        //!< Spatial order of the points, empty if not reordered.
+    std::vector<vec3<float>> m_ordered_points; //!< Copy of the points in spatial order.
 };
 
 //! Implementation of per-point finding logic for NeighborQuery objects.
@@ -261,10 +384,11 @@ public:
 
     //! Constructor
     NeighborQueryPerPointIterator(const NeighborQuery* neighbor_query, const vec3<float>& query_point,
-                                  unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii)
+                                  unsigned int query_point_idx, float r_max, float r_min, bool exclude_ii,
+                                  bool half = false)
         : NeighborPerPointIterator(query_point_idx), m_neighbor_query(neighbor_query),
           m_query_point(query_point), m_finished(false), m_r_max(r_max), m_r_min(r_min),
-          m_exclude_ii(exclude_ii)
+          m_exclude_ii(exclude_ii), m_half(half)
     {}
 
     //! Empty Destructor
@@ -279,13 +403,30 @@ public:
     //! Get the next element.
     NeighborBond next() override = 0;
 
+    //! Reset the iterator to find the neighbors of a different query point.
+    /*! Resetting an existing iterator reuses any memory it has already
+     *  allocated, so a single iterator can be used for many query points
+     *  without per-point heap allocations. Subclasses with additional state
+     *  must override this method and call the parent implementation.
+     *
+     *  \param query_point The new point to find neighbors for.
+     *  \param query_point_idx The index of the new query point.
+     */
+    virtual void reset(const vec3<float>& query_point, unsigned int query_point_idx)
+    {
+        m_query_point = query_point;
+        m_query_point_idx = query_point_idx;
+        m_finished = false;
+    }
+
 protected:
-    const NeighborQuery* m_neighbor_query;       //!< Link to the NeighborQuery object.
-    const vec3<float> m_query_point = {0, 0, 0}; //!< Coordinates of the query point.
+    const NeighborQuery* m_neighbor_query; //!< Link to the NeighborQuery object.
+    vec3<float> m_query_point = {0, 0, 0}; //!< Coordinates of the query point.
     bool m_finished; //!< Flag to indicate that iteration is complete (must be set by next() on termination).
     float m_r_max;   //!< Cutoff distance for neighbors.
     float m_r_min;   //!< Minimum distance for neighbors.
     bool m_exclude_ii; //!< Flag to indicate whether or not to include self bonds.
+    bool m_half;       //!< Flag to indicate whether to skip points with smaller indices.
 };
 
 //! The iterator class for neighbor queries on NeighborQuery objects.
@@ -309,24 +450,75 @@ public:
         : m_neighbor_query(neighbor_query), m_query_points(query_points),
           m_num_query_points(num_query_points), m_qargs(qargs), m_finished(false), m_cur_p(0)
     {
+        // Self-queries of reordered points are processed in spatial order.
+        if (neighbor_query->isReordered() && query_points == neighbor_query->getPoints()
+            && num_query_points == neighbor_query->getNPoints())
+        {
+            m_query_order = neighbor_query->getOrder().data();
+        }
         m_iter = this->query(m_cur_p);
     }
 
     //! Empty Destructor
     ~NeighborQueryIterator() = default;
 
+    //! Keep the queried NeighborQuery alive for the lifetime of this iterator.
+    /*! NeighborQuery objects that build their underlying data structure on
+     *  demand, such as RawPoints, may replace it between queries. They pass
+     *  the structure to the iterators it creates with this function.
+     *
+     *  \param owner Shared pointer to the NeighborQuery object being queried.
+     */
+    void keepAlive(std::shared_ptr<const NeighborQuery> owner)
+    {
+        m_owner = std::move(owner);
+    }
+
     //! Indicate when done.
     bool end() const
     {
         return m_finished;
     }
 
+    //! Get the index of the k-th query point in the order in which query points should be processed.
+    /*! When the points of a reordered NeighborQuery are queried against
+     *  themselves, the query points are processed along the same
+     *  space-filling curve, so that consecutive queries traverse nearby parts
+     *  of the data structure. Otherwise this returns k.
+     */
+    unsigned int getQueryPointIndex(size_t k) const
+    {
+        return m_query_order == nullptr ? k : m_query_order[k];
+    }
+
     //! Get an iterator for a specific query point by index.
     std::shared_ptr<NeighborQueryPerPointIterator> query(unsigned int i)
     {
         return m_neighbor_query->querySingle(m_query_points[i], i, m_qargs);
     }
 
+    //! Reuse an iterator for a specific query point by index.
+    /*! If \a it is empty, a new iterator is created as in query(i).
+     *  Otherwise, \a it must have been created by this object, and it is
+     *  reset to find the neighbors of query point \a i. Looping over many
+     *  query points with the same iterator avoids a heap allocation per
+     *  query point.
+     *
+     *  \param i The index of the query point.
+     *  \param it The iterator to reuse, which is updated in place.
+     */
+    void query(unsigned int i, std::shared_ptr<NeighborQueryPerPointIterator>& it)
+    {
+        if (it)
+        {
+            it->reset(m_query_points[i], i);
+        }
+        else
+        {
+            it = query(i);
+        }
+    }
+
     //! Get the next element.
     NeighborBond next()
     {
@@ -351,7 +543,7 @@ public:
             {
                 break;
             }
-            m_iter = this->query(m_cur_p);
+            this->query(m_cur_p, m_iter);
         }
         m_finished = true;
         return ITERATOR_TERMINATOR;
@@ -365,28 +557,44 @@ public:
      *  because the kn query is not symmetric, so even if we reverse the
      *  output order here the actual neighbors found will be different.
      *
+     *  If count_first is true, the query is instead performed twice: the
+     *  first pass only counts the neighbors of each query point, and the
+     *  second pass writes bonds directly into the final NeighborList
+     *  arrays at offsets given by the prefix sum of those counts. Since the
+     *  output is grouped by query point, only the bonds of each individual
+     *  query point need to be sorted. This avoids holding a second copy of
+     *  all bonds in memory and the global sort, at the cost of running the
+     *  query twice. The resulting NeighborList is in compressed (CSR) form,
+     *  with the offsets taken directly from the counting pass.
+     *
      *  This function returns a pointer, not a shared pointer, so the
      *  caller is responsible for deleting it. The reason for this is that
      *  the primary use-case is to have this object be managed by instances
      *  of the Cython NeighborList class.
      */
-    NeighborList* toNeighborList(bool sort_by_distance = false)
+    NeighborList* toNeighborList(bool sort_by_distance = false, bool count_first = false)
     {
+        if (count_first)
+        {
+            return toNeighborListCountFirst(sort_by_distance);
+        }
+
         using BondVector = tbb::enumerable_thread_specific<std::vector<NeighborBond>>;
         BondVector bonds;
         util::forLoopWrapper(0, m_num_query_points, [&](size_t begin, size_t end) {
             BondVector::reference local_bonds(bonds.local());
             NeighborBond nb;
-            for (size_t i = begin; i < end; ++i)
+            std::shared_ptr<NeighborQueryPerPointIterator> it;
+            for (size_t k = begin; k < end; ++k)
             {
-                std::shared_ptr<NeighborQueryPerPointIterator> it = this->query(i);
+                this->query(getQueryPointIndex(k), it);
                 while (!it->end())
                 {
                     nb = it->next();
                     // If we're excluding ii bonds, we have to check before adding.
                     if (nb != ITERATOR_TERMINATOR)
                     {
-                        local_bonds.emplace_back(nb.query_point_idx, nb.point_idx, nb.distance);
+                        local_bonds.emplace_back(nb);
                     }
                 }
             }
@@ -403,30 +611,167 @@ public:
             tbb::parallel_sort(linear_bonds.begin(), linear_bonds.end(), compareNeighborBond);
         }
 
-        unsigned int num_bonds = linear_bonds.size();
+        const size_t num_bonds = linear_bonds.size();
 
+        // Query results always have unit weights, so no weights are stored.
+        // Bond vectors are only stored if they were requested.
         auto* nl = new NeighborList();
-        nl->setNumBonds(num_bonds, m_num_query_points, m_neighbor_query->getNPoints());
+        nl->setNumBonds(num_bonds, m_num_query_points, m_neighbor_query->getNPoints(), false, false,
+                        m_qargs.vectors);
 
         util::forLoopWrapper(0, num_bonds, [&](size_t begin, size_t end) {
             for (size_t bond = begin; bond < end; ++bond)
             {
-                nl->getNeighbors()(bond, 0) = linear_bonds[bond].query_point_idx;
-                nl->getNeighbors()(bond, 1) = linear_bonds[bond].point_idx;
+                nl->getQueryPointIndices()[bond] = linear_bonds[bond].query_point_idx;
+                nl->getPointIndices()[bond] = linear_bonds[bond].point_idx;
                 nl->getDistances()[bond] = linear_bonds[bond].distance;
-                nl->getWeights()[bond] = float(1.0);
+                if (m_qargs.vectors)
+                {
+                    nl->getVectors()[bond] = linear_bonds[bond].vector;
+                }
             }
         });
 
         return nl;
     }
 
+    //! Count the neighbors of each query point.
+    /*! \param offsets Output array of length num_query_points + 1. On return,
+     *         offsets[i] is the index of the first bond of query point i in
+     *         arrays filled by fillNeighbors, and offsets[num_query_points]
+     *         is the total number of bonds.
+     */
+    void countNeighbors(size_t* offsets)
+    {
+        offsets[0] = 0;
+        util::forLoopWrapper(0, m_num_query_points, [&](size_t begin, size_t end) {
+            std::shared_ptr<NeighborQueryPerPointIterator> it;
+            for (size_t k = begin; k < end; ++k)
+            {
+                const unsigned int i = getQueryPointIndex(k);
+                this->query(i, it);
+                size_t count(0);
+                while (!it->end())
+                {
+                    if (it->next() != ITERATOR_TERMINATOR)
+                    {
+                        ++count;
+                    }
+                }
+                offsets[i + 1] = count;
+            }
+        });
+
+        for (size_t i = 0; i < m_num_query_points; ++i)
+        {
+            offsets[i + 1] += offsets[i];
+        }
+    }
+
+    //! Write the neighbors of each query point into preallocated arrays.
+    /*! The bonds of query point i are written to rows offsets[i] to
+     *  offsets[i + 1] of each output array, sorted by point index or by
+     *  distance. Any of the output arrays may be NULL, in which case that
+     *  quantity is not written.
+     *
+     *  \param offsets Bond offsets of each query point, as computed by countNeighbors.
+     *  \param query_point_indices Output array of query point indices.
+     *  \param point_indices Output array of point indices.
+     *  \param distances Output array of bond distances.
+     *  \param vectors Output array of bond vectors, pointing from the query point to the point.
+     *  \param sort_by_distance If true, sort the bonds of each query point by distance.
+     */
+    void fillNeighbors(const size_t* offsets, unsigned int* query_point_indices, unsigned int* point_indices,
+                       float* distances, vec3<float>* vectors, bool sort_by_distance = false)
+    {
+        util::forLoopWrapper(0, m_num_query_points, [&](size_t begin, size_t end) {
+            std::shared_ptr<NeighborQueryPerPointIterator> it;
+            std::vector<NeighborBond> point_bonds;
+            for (size_t k = begin; k < end; ++k)
+            {
+                const unsigned int i = getQueryPointIndex(k);
+                point_bonds.clear();
+                this->query(i, it);
+                while (!it->end())
+                {
+                    const NeighborBond nb = it->next();
+                    if (nb != ITERATOR_TERMINATOR)
+                    {
+                        point_bonds.push_back(nb);
+                    }
+                }
+
+                if (point_bonds.size() != offsets[i + 1] - offsets[i])
+                {
+                    throw std::runtime_error(
+                        "The number of neighbors found changed between the counting and filling passes.");
+                }
+
+                if (sort_by_distance)
+                {
+                    std::sort(point_bonds.begin(), point_bonds.end(), compareNeighborDistance);
+                }
+                else
+                {
+                    std::sort(point_bonds.begin(), point_bonds.end(), compareNeighborBond);
+                }
+
+                size_t bond = offsets[i];
+                for (const auto& nb : point_bonds)
+                {
+                    if (query_point_indices != nullptr)
+                    {
+                        query_point_indices[bond] = nb.query_point_idx;
+                    }
+                    if (point_indices != nullptr)
+                    {
+                        point_indices[bond] = nb.point_idx;
+                    }
+                    if (distances != nullptr)
+                    {
+                        distances[bond] = nb.distance;
+                    }
+                    if (vectors != nullptr)
+                    {
+                        vectors[bond] = nb.vector;
+                    }
+                    ++bond;
+                }
+            }
+        });
+    }
+
 protected:
+    //! Generate a NeighborList by counting neighbors before filling bonds.
+    NeighborList* toNeighborListCountFirst(bool sort_by_distance)
+    {
+        // First pass: count the neighbors of each query point.
+        std::vector<size_t> offsets(m_num_query_points + 1);
+        countNeighbors(offsets.data());
+        const size_t num_bonds = offsets[m_num_query_points];
+
+        // The list is owned here until it is complete so that it is not
+        // leaked if the fill pass throws.
+        std::unique_ptr<NeighborList> nl(new NeighborList());
+        nl->setNumBonds(num_bonds, m_num_query_points, m_neighbor_query->getNPoints(), false, true,
+                        m_qargs.vectors);
+        std::copy(offsets.begin(), offsets.end(), nl->getOffsets().get());
+
+        // Second pass: write the sorted bonds of each query point into its
+        // slice of the output arrays.
+        fillNeighbors(offsets.data(), nullptr, nl->getPointIndices().get(), nl->getDistances().get(),
+                      m_qargs.vectors ? nl->getVectors().get() : nullptr, sort_by_distance);
+
+        return nl.release();
+    }
+
     const NeighborQuery* m_neighbor_query;                 //!< Link to the NeighborQuery object.
     const vec3<float>* m_query_points;                     //!< Coordinates of the query points.
     unsigned int m_num_query_points;                       //!< The number of query points.
     const QueryArgs m_qargs;                               //!< The query arguments
     std::shared_ptr<NeighborQueryPerPointIterator> m_iter; //!< The per-point iterator being used.
+    const unsigned int* m_query_order {nullptr}; //!< Processing order of the query points, if not sequential.
+    std::shared_ptr<const NeighborQuery> m_owner; //!< Owner of m_neighbor_query, if it must be kept alive.
 
     bool m_finished; //!< Flag to indicate that iteration is complete (must be set by next on termination).
     unsigned int m_cur_p; //!< The current particle under consideration.
@@ -1,9 +1,12 @@
 // Copyright (c) 2010-2020 The Regents of the University of Michigan
 // This file is from the freud project, released under the BSD 3-Clause License.
 
+#include <numeric>
 #include <stdexcept>
+#include <vector>
 
 #include "PeriodicBuffer.h"
+#include "utils.h"
 
 /*! \file PeriodicBuffer.cc
     \brief Replicates points across periodic boundaries.
@@ -12,7 +15,7 @@
 namespace freud { namespace locality {
 
 void PeriodicBuffer::compute(const freud::locality::NeighborQuery* neighbor_query, const vec3<float>& buff,
-                             const bool use_images)
+                             const bool use_images, const bool include_points)
 {
     m_box = neighbor_query->getBox();
     if (buff.x < 0)
@@ -55,12 +58,15 @@ void PeriodicBuffer::compute(const freud::locality::NeighborQuery* neighbor_quer
         images.z = 0;
     }
 
-    m_buffer_points.clear();
-    m_buffer_ids.clear();
+    const vec3<float>* points = neighbor_query->getPoints();
+    const unsigned int n_points = neighbor_query->getNPoints();
+    const vec3<float> latt_a(m_box.getLatticeVector(0));
+    const vec3<float> latt_b(m_box.getLatticeVector(1));
+    const vec3<float> latt_c(is2D ? vec3<float>(0, 0, 0) : m_box.getLatticeVector(2));
 
-    // for each point
-    for (unsigned int point_id = 0; point_id < neighbor_query->getNPoints(); point_id++)
-    {
+    // Call visit(image, point_image) for each image of a point that belongs
+    // in the buffer, in a fixed order.
+    const auto for_each_image = [&](unsigned int point_id, const auto& visit) {
         for (int i = use_images ? 0 : -images.x; i <= images.x; i++)
         {
             for (int j = use_images ? 0 : -images.y; j <= images.y; j++)
@@ -75,13 +81,8 @@ void PeriodicBuffer::compute(const freud::locality::NeighborQuery* neighbor_quer
 
                     // Compute the new position for the buffer point,
                     // shifted by images.
-                    vec3<float> point_image = (*neighbor_query)[point_id];
-                    point_image += float(i) * m_box.getLatticeVector(0);
-                    point_image += float(j) * m_box.getLatticeVector(1);
-                    if (!is2D)
-                    {
-                        point_image += float(k) * m_box.getLatticeVector(2);
-                    }
+                    const vec3<float> point_image
+                        = points[point_id] + float(i) * latt_a + float(j) * latt_b + float(k) * latt_c;
 
                     if (use_images)
                     {
@@ -91,8 +92,7 @@ void PeriodicBuffer::compute(const freud::locality::NeighborQuery* neighbor_quer
                         // have the correct number of points instead of
                         // relying on the floating point precision of the
                         // fractional check below.
-                        m_buffer_points.push_back(m_buffer_box.wrap(point_image));
-                        m_buffer_ids.push_back(point_id);
+                        visit(vec3<int>(i, j, k), m_buffer_box.wrap(point_image));
                     }
                     else
                     {
@@ -104,14 +104,50 @@ void PeriodicBuffer::compute(const freud::locality::NeighborQuery* neighbor_quer
                         if (0 <= buff_frac.x && buff_frac.x < 1 && 0 <= buff_frac.y && buff_frac.y < 1
                             && (is2D || (0 <= buff_frac.z && buff_frac.z < 1)))
                         {
-                            m_buffer_points.push_back(point_image);
-                            m_buffer_ids.push_back(point_id);
+                            visit(vec3<int>(i, j, k), point_image);
                         }
                     }
                 }
             }
         }
-    }
+    };
+
+    // Count the buffer points of each point, so that the output can be
+    // allocated once and each point's images written to a known offset.
+    std::vector<size_t> offsets(n_points + 1, 0);
+    util::forLoopWrapper(0, n_points, [&](size_t begin, size_t end) {
+        for (size_t point_id = begin; point_id < end; ++point_id)
+        {
+            size_t count = 0;
+            for_each_image(point_id, [&](const vec3<int>& /*image*/, const vec3<float>& /*point_image*/) {
+                ++count;
+            });
+            offsets[point_id + 1] = count;
+        }
+    });
+    std::partial_sum(offsets.begin(), offsets.end(), offsets.begin());
+    const size_t n_buffer = offsets[n_points];
+
+    m_include_points = include_points;
+    m_buffer_ids.prepare(n_buffer);
+    m_buffer_images.prepare(n_buffer);
+    m_buffer_points.prepare(include_points ? n_buffer : 0);
+
+    util::forLoopWrapper(0, n_points, [&](size_t begin, size_t end) {
+        for (size_t point_id = begin; point_id < end; ++point_id)
+        {
+            size_t buffer_idx = offsets[point_id];
+            for_each_image(point_id, [&](const vec3<int>& image, const vec3<float>& point_image) {
+                m_buffer_ids[buffer_idx] = point_id;
+                m_buffer_images[buffer_idx] = image;
+                if (include_points)
+                {
+                    m_buffer_points[buffer_idx] = point_image;
+                }
+                ++buffer_idx;
+            });
+        }
+    });
 }
 
 }; }; // end namespace freud::locality
@@ -4,9 +4,8 @@
 #ifndef PERIODIC_BUFFER_H
 #define PERIODIC_BUFFER_H
 
-#include <vector>
-
 #include "Box.h"
+#include "ManagedArray.h"
 #include "NeighborQuery.h"
 #include "VectorMath.h"
 
@@ -16,6 +15,14 @@
 
 namespace freud { namespace locality {
 
+//! Replicates points across periodic boundaries.
+/*! Each buffer point is a periodic image of an original point, identified
+ *  by the original point's index and the integer image (in units of the box
+ *  lattice vectors) by which it is shifted. The buffer points are counted
+ *  first and then written in parallel, ordered by original point index and
+ *  then by image. Storing the buffer point positions is optional, since they
+ *  can be reconstructed from the ids and images.
+ */
 class PeriodicBuffer
 {
 public:
@@ -35,26 +42,47 @@ public:
     }
 
     //! Compute the periodic buffer
+    /*! \param neighbor_query The points to replicate.
+     *  \param buff The buffer distance, or number of images if use_images is true.
+     *  \param use_images Whether buff is a number of images instead of a distance.
+     *  \param include_points Whether to store the buffer point positions.
+     */
     void compute(const freud::locality::NeighborQuery* neighbor_query, const vec3<float>& buff,
-                 const bool use_images);
+                 const bool use_images, const bool include_points = true);
 
     //! Return the buffer points
-    std::vector<vec3<float>> getBufferPoints() const
+    /*! This array is empty if the last compute did not include points.
+     */
+    const util::ManagedArray<vec3<float>>& getBufferPoints() const
     {
         return m_buffer_points;
     }
 
     //! Return the buffer ids
-    std::vector<unsigned int> getBufferIds() const
+    const util::ManagedArray<unsigned int>& getBufferIds() const
     {
         return m_buffer_ids;
     }
 
+    //! Return the images by which the buffer points are shifted
+    const util::ManagedArray<vec3<int>>& getBufferImages() const
+    {
+        return m_buffer_images;
+    }
+
+    //! Return whether the last compute stored the buffer point positions
+    bool getIncludePoints() const
+    {
+        return m_include_points;
+    }
+
 private:
-    freud::box::Box m_box;                    //!< Simulation box of the original points
-    freud::box::Box m_buffer_box;             //!< Simulation box of the replicated points
-    std::vector<vec3<float>> m_buffer_points; //!< The replicated points
-    std::vector<unsigned int> m_buffer_ids;   //!< The replicated points' original point ids
+    freud::box::Box m_box;                           //!< Simulation box of the original points
+    freud::box::Box m_buffer_box;                    //!< Simulation box of the replicated points
+    util::ManagedArray<vec3<float>> m_buffer_points; //!< The replicated points
+    util::ManagedArray<unsigned int> m_buffer_ids;   //!< The replicated points' original point ids
+    util::ManagedArray<vec3<int>> m_buffer_images;   //!< The replicated points' images
+    bool m_include_points {true};                    //!< Whether the replicated points were stored
 };
 
 }; }; // end namespace freud::locality
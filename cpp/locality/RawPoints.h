@@ -4,19 +4,27 @@
 #ifndef RAW_POINTS_H
 #define RAW_POINTS_H
 
+#include <chrono>
+#include <cmath>
 #include <memory>
+#include <mutex>
 #include <stdexcept>
+#include <string>
 
 #include "AABBQuery.h"
+#include "LinkCell.h"
 #include "NeighborQuery.h"
 
 /*! \file RawPoints.h
     \brief Defines a simplest NeighborQuery object that actually farms out
-           querying logic to an AABBQuery.
+           querying logic to an AABBQuery or LinkCell.
 */
 
 namespace freud { namespace locality {
 
+//! Minimum expected number of points per cell of width r_max for which RawPoints uses a LinkCell.
+const float LINK_CELL_MIN_POINTS_PER_CELL(2);
+
 //! Dummy class to just contain minimal information and not actually query.
 /*! The purpose of this class is to support dynamic NeighborQuery object
  *  resolution. Users may pass instances of this class instead of providing a
@@ -37,9 +45,11 @@ public:
     ~RawPoints() override = default;
 
     //! Perform a query based on a set of query parameters.
-    /*! Shadow parent function to ensure that the underlying AABBQuery is
-     * only constructed when this object is actually queried. Note that unlike
-     * the parent function it is not const since it does modify the object.
+    /*! Shadow parent function to ensure that the underlying spatial data
+     *  structure is only constructed when this object is actually queried.
+     *  The structure is chosen based on the query arguments (see
+     *  useLinkCell) and cached for subsequent queries, and the query is then
+     *  delegated to it.
      *
      *  \param query_points The points to find neighbors for.
      *  \param n_query_points The number of query points.
@@ -48,30 +58,126 @@ public:
     std::shared_ptr<NeighborQueryIterator> query(const vec3<float>* query_points, unsigned int n_query_points,
                                                  QueryArgs query_args) const override
     {
-        if (!aq)
-        {
-            aq = std::make_unique<AABBQuery>(m_box, m_points, m_n_points);
-        }
-
-        this->validateQueryArgs(query_args);
-        return std::make_shared<NeighborQueryIterator>(this, query_points, n_query_points, query_args);
+        QueryArgs inferred_args(query_args);
+        inferMode(inferred_args);
+        std::shared_ptr<const NeighborQuery> structure = getStructure(inferred_args);
+        std::shared_ptr<NeighborQueryIterator> iter
+            = structure->query(query_points, n_query_points, query_args);
+        // A later query may replace the structure, so the iterator keeps it alive.
+        iter->keepAlive(structure);
+        return iter;
     }
 
     // dummy implementation for pure virtual function in the parent class
     std::shared_ptr<NeighborQueryPerPointIterator>
     querySingle(const vec3<float> query_point, unsigned int query_point_idx, QueryArgs qargs) const override
     {
-        if (!aq)
+        std::shared_ptr<const NeighborQuery> structure;
+        {
+            std::lock_guard<std::mutex> lock(m_structure_mutex);
+            structure = m_structure;
+        }
+        if (structure == nullptr)
+        {
+            throw std::runtime_error("The underlying NeighborQuery object has not yet been initialized. "
+                                     "Please report this error.");
+        }
+
+        return structure->querySingle(query_point, query_point_idx, qargs);
+    }
+
+    //! Return whether a LinkCell is expected to answer a query faster than an AABBQuery.
+    /*! Cell lists excel at ball queries in dense, uniform systems, where a
+     *  cell of width r_max holds at least a few points and every visited cell
+     *  contributes candidate neighbors. Trees adapt better to sparse or
+     *  clustered systems and to nearest neighbor queries, which LinkCell
+     *  answers by repeatedly expanding its search shell.
+     *
+     *  \param args The query arguments with the query mode already inferred.
+     */
+    bool useLinkCell(const QueryArgs& args) const
+    {
+        if (args.mode != QueryType::ball || !std::isfinite(args.r_max) || args.r_max <= 0)
+        {
+            return false;
+        }
+
+        // With fewer than three cells of width r_max across the box, the
+        // neighboring cells of every cell span the whole box.
+        const vec3<float> nearest_plane_distance = m_box.getNearestPlaneDistance();
+        if (args.r_max * 3 > nearest_plane_distance.x || args.r_max * 3 > nearest_plane_distance.y
+            || (!m_box.is2D() && args.r_max * 3 > nearest_plane_distance.z))
         {
-            throw std::runtime_error("The underlying AABBQuery object has not yet been initialized. Please "
-                                     "report this error.");
+            return false;
         }
 
-        return aq->querySingle(query_point, query_point_idx, qargs);
+        const float cell_volume = m_box.is2D() ? args.r_max * args.r_max
+                                               : args.r_max * args.r_max * args.r_max;
+        const float points_per_cell = static_cast<float>(m_n_points) * cell_volume / m_box.getVolume();
+        return points_per_cell >= LINK_CELL_MIN_POINTS_PER_CELL;
+    }
+
+    //! Return the name of the structure used for the most recent query, or an empty string.
+    std::string getStructureName() const
+    {
+        std::lock_guard<std::mutex> lock(m_structure_mutex);
+        if (m_structure == nullptr)
+        {
+            return "";
+        }
+        return m_structure == aq ? "AABBQuery" : "LinkCell";
+    }
+
+    //! Return the time in seconds taken to build the structure used for the most recent query.
+    double getBuildTime() const
+    {
+        std::lock_guard<std::mutex> lock(m_structure_mutex);
+        if (m_structure == nullptr)
+        {
+            return 0;
+        }
+        return m_structure == aq ? m_aq_build_time : m_lc_build_time;
     }
 
 private:
-    mutable std::unique_ptr<AABBQuery> aq; //!< The AABBQuery object that will be used to perform queries.
+    //! Return the structure to use for a query, building it if necessary.
+    /*! Queries may run concurrently without the GIL, so the cached
+     *  structures are built and replaced while holding a lock.
+     */
+    std::shared_ptr<const NeighborQuery> getStructure(const QueryArgs& args) const
+    {
+        std::lock_guard<std::mutex> lock(m_structure_mutex);
+        const auto start = std::chrono::steady_clock::now();
+        if (useLinkCell(args))
+        {
+            // Only the cell list of the most recent cell width is cached, so
+            // that querying with many different r_max does not keep a cell
+            // list for each of them.
+            if (!lc || lc->getCellWidth() != args.r_max)
+            {
+                lc = std::make_shared<LinkCell>(m_box, m_points, m_n_points, args.r_max);
+                m_lc_build_time
+                    = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+            }
+            m_structure = lc;
+            return lc;
+        }
+        if (!aq)
+        {
+            aq = std::make_shared<AABBQuery>(m_box, m_points, m_n_points);
+            m_aq_build_time
+                = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+        }
+        m_structure = aq;
+        return aq;
+    }
+
+    mutable std::shared_ptr<AABBQuery> aq;                    //!< AABBQuery used for tree-based queries.
+    mutable std::shared_ptr<LinkCell> lc;                     //!< LinkCell used for cell-based ball queries.
+    mutable std::shared_ptr<const NeighborQuery> m_structure; //!< Structure used by the most recent query.
+    mutable double m_aq_build_time {0};                       //!< Time in seconds taken to build aq.
+    mutable double m_lc_build_time {0};                       //!< Time in seconds taken to build lc.
+    mutable std::mutex m_structure_mutex;                     //!< Guards the cached structures.
 };
 
 }; }; // end namespace freud::locality
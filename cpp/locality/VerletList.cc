@@ -0,0 +1,146 @@
+// Copyright (c) 2010-2020 The Regents of the University of Michigan
+// This file is from the freud project, released under the BSD 3-Clause License.
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <tbb/enumerable_thread_specific.h>
+
+#include "VerletList.h"
+#include "utils.h"
+
+/*! \file VerletList.cc
+    \brief Caches a neighbor list across frames using a Verlet skin.
+*/
+
+namespace freud { namespace locality {
+
+namespace {
+
+//! Return the largest wrapped distance between positions and their references.
+float maxDisplacement(const box::Box& box, const vec3<float>* positions, const vec3<float>* references,
+                      unsigned int n)
+{
+    tbb::enumerable_thread_specific<float> local_max_rsq(0);
+    util::forLoopWrapper(0, n, [&](size_t begin, size_t end) {
+        float& max_rsq = local_max_rsq.local();
+        for (size_t i = begin; i < end; ++i)
+        {
+            const vec3<float> delta = box.wrap(positions[i] - references[i]);
+            max_rsq = std::max(max_rsq, dot(delta, delta));
+        }
+    });
+    float max_rsq(0);
+    for (const auto& rsq : local_max_rsq)
+    {
+        max_rsq = std::max(max_rsq, rsq);
+    }
+    return std::sqrt(max_rsq);
+}
+
+}; // end anonymous namespace
+
+VerletList::VerletList(float r_max, float skin)
+    : m_r_max(r_max), m_skin(skin), m_self_query(false), m_exclude_ii(false), m_rebuilt(false),
+      m_num_builds(0), m_neighbor_list(std::make_shared<NeighborList>())
+{
+    if (r_max <= 0)
+    {
+        throw std::invalid_argument("VerletList requires r_max to be positive.");
+    }
+    if (skin < 0)
+    {
+        throw std::invalid_argument("VerletList requires skin to be non-negative.");
+    }
+}
+
+void VerletList::compute(const NeighborQuery* nq, const vec3<float>* query_points,
+                         unsigned int n_query_points, bool exclude_ii)
+{
+    const bool self_query = query_points == nq->getPoints() && n_query_points == nq->getNPoints();
+    m_rebuilt = needsRebuild(nq, query_points, n_query_points, self_query, exclude_ii);
+    if (m_rebuilt)
+    {
+        build(nq, query_points, n_query_points, self_query, exclude_ii);
+    }
+    else
+    {
+        refresh(nq, query_points);
+    }
+
+    m_neighbor_list->copy(m_cached_nlist);
+    m_neighbor_list->filter_r(m_r_max);
+}
+
+bool VerletList::needsRebuild(const NeighborQuery* nq, const vec3<float>* query_points,
+                              unsigned int n_query_points, bool self_query, bool exclude_ii) const
+{
+    if (m_num_builds == 0 || nq->getBox() != m_box || nq->getNPoints() != m_ref_points.size()
+        || self_query != m_self_query || exclude_ii != m_exclude_ii)
+    {
+        return true;
+    }
+    if (!self_query && n_query_points != m_ref_query_points.size())
+    {
+        return true;
+    }
+
+    // A pair can only move from beyond r_max + skin to within r_max if the
+    // two points together moved more than skin.
+    const float max_displacement
+        = maxDisplacement(m_box, nq->getPoints(), m_ref_points.data(), nq->getNPoints());
+    const float max_query_displacement = self_query
+        ? max_displacement
+        : maxDisplacement(m_box, query_points, m_ref_query_points.data(), n_query_points);
+    return max_displacement + max_query_displacement > m_skin;
+}
+
+void VerletList::build(const NeighborQuery* nq, const vec3<float>* query_points, unsigned int n_query_points,
+                       bool self_query, bool exclude_ii)
+{
+    QueryArgs qargs;
+    qargs.mode = QueryType::ball;
+    qargs.r_max = m_r_max + m_skin;
+    qargs.exclude_ii = exclude_ii;
+
+    std::unique_ptr<NeighborList> nlist(nq->query(query_points, n_query_points, qargs)->toNeighborList());
+    m_cached_nlist.copy(*nlist);
+
+    m_box = nq->getBox();
+    m_self_query = self_query;
+    m_exclude_ii = exclude_ii;
+    m_ref_points.assign(nq->getPoints(), nq->getPoints() + nq->getNPoints());
+    if (self_query)
+    {
+        m_ref_query_points.clear();
+    }
+    else
+    {
+        m_ref_query_points.assign(query_points, query_points + n_query_points);
+    }
+    ++m_num_builds;
+}
+
+void VerletList::refresh(const NeighborQuery* nq, const vec3<float>* query_points)
+{
+    const vec3<float>* points = nq->getPoints();
+    const unsigned int* query_point_indices = m_cached_nlist.getQueryPointIndices().get();
+    const unsigned int* point_indices = m_cached_nlist.getPointIndices().get();
+    float* distances = m_cached_nlist.getDistances().get();
+    vec3<float>* vectors = m_cached_nlist.hasVectors() ? m_cached_nlist.getVectors().get() : nullptr;
+
+    util::forLoopWrapper(0, m_cached_nlist.getNumBonds(), [&](size_t begin, size_t end) {
+        for (size_t bond = begin; bond < end; ++bond)
+        {
+            const vec3<float> r_ij
+                = m_box.wrap(points[point_indices[bond]] - query_points[query_point_indices[bond]]);
+            distances[bond] = std::sqrt(dot(r_ij, r_ij));
+            if (vectors != nullptr)
+            {
+                vectors[bond] = r_ij;
+            }
+        }
+    });
+}
+
+}; }; // end namespace freud::locality
@@ -0,0 +1,102 @@
+// Copyright (c) 2010-2020 The Regents of the University of Michigan
+// This file is from the freud project, released under the BSD 3-Clause License.
+
+#ifndef VERLET_LIST_H
+#define VERLET_LIST_H
+
+#include <memory>
+#include <vector>
+
+#include "Box.h"
+#include "NeighborList.h"
+#include "NeighborQuery.h"
+#include "VectorMath.h"
+
+/*! \file VerletList.h
+    \brief Caches a neighbor list across frames using a Verlet skin.
+*/
+
+namespace freud { namespace locality {
+
+//! Reuse a neighbor list across frames until particles move too far.
+/*! A VerletList finds all bonds within r_max + skin and stores them along
+ *  with the positions of the points and query points at the time of the
+ *  build. As long as the largest displacement of any point plus the largest
+ *  displacement of any query point since the build is at most skin, every
+ *  pair within r_max is guaranteed to be among the stored bonds, so later
+ *  frames only recompute the distances and vectors of the stored bonds and
+ *  keep those within r_max. For self-queries this is the familiar criterion
+ *  that no particle has moved more than skin / 2.
+ *
+ *  A full rebuild is also performed when the box, the number of points or
+ *  query points, or the exclude_ii setting change.
+ */
+class VerletList
+{
+public:
+    //! Constructor
+    VerletList(float r_max, float skin);
+
+    //! Update the neighbor list for the current positions
+    void compute(const NeighborQuery* nq, const vec3<float>* query_points, unsigned int n_query_points,
+                 bool exclude_ii);
+
+    //! Get the neighbor list of bonds within r_max
+    std::shared_ptr<NeighborList> getNeighborList() const
+    {
+        return m_neighbor_list;
+    }
+
+    //! Get the cutoff distance
+    float getRMax() const
+    {
+        return m_r_max;
+    }
+
+    //! Get the skin distance
+    float getSkin() const
+    {
+        return m_skin;
+    }
+
+    //! Return whether the last call to compute rebuilt the cached bonds
+    bool getRebuilt() const
+    {
+        return m_rebuilt;
+    }
+
+    //! Get the number of times the cached bonds have been built
+    unsigned int getNumBuilds() const
+    {
+        return m_num_builds;
+    }
+
+private:
+    //! Return whether the cached bonds may miss a pair within r_max
+    bool needsRebuild(const NeighborQuery* nq, const vec3<float>* query_points, unsigned int n_query_points,
+                      bool self_query, bool exclude_ii) const;
+
+    //! Find all bonds within r_max + skin and store the reference positions
+    void build(const NeighborQuery* nq, const vec3<float>* query_points, unsigned int n_query_points,
+               bool self_query, bool exclude_ii);
+
+    //! Recompute the distances and vectors of the cached bonds
+    void refresh(const NeighborQuery* nq, const vec3<float>* query_points);
+
+    float m_r_max;       //!< Cutoff distance of the output neighbor list
+    float m_skin;        //!< Extra distance searched when building the cached bonds
+    box::Box m_box;      //!< Box of the last build
+    bool m_self_query;   //!< Whether the last build was a self-query
+    bool m_exclude_ii;   //!< Whether the last build excluded bonds with equal indices
+    bool m_rebuilt;      //!< Whether the last call to compute rebuilt the cached bonds
+    unsigned int m_num_builds; //!< Number of times the cached bonds have been built
+
+    std::vector<vec3<float>> m_ref_points;       //!< Point positions at the last build
+    std::vector<vec3<float>> m_ref_query_points; //!< Query point positions at the last build
+    NeighborList m_cached_nlist;                 //!< Bonds within r_max + skin
+    std::shared_ptr<NeighborList> m_neighbor_list; //!< Bonds within r_max
+};
+
+}; }; // end namespace freud::locality
+
+#endif // VERLET_LIST_H
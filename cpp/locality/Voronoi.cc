@@ -3,11 +3,15 @@
 
 #include <cmath>
 #include <iterator>
+#include <memory>
+#include <tbb/enumerable_thread_specific.h>
 #include <tbb/parallel_sort.h>
+#include <utility>
 #include <vector>
 
 #include "NeighborBond.h"
 #include "Voronoi.h"
+#include "utils.h"
 
 /*! \file Voronoi.cc
     \brief Computes Voronoi neighbors for a set of points.
@@ -21,7 +25,14 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
     const auto box = nq->getBox();
     const auto n_points = nq->getNPoints();
 
-    m_polytopes.resize(n_points);
+    if (m_compute_polytopes)
+    {
+        m_polytopes.resize(n_points);
+    }
+    else
+    {
+        std::vector<std::vector<vec3<double>>>().swap(m_polytopes);
+    }
     m_volumes.prepare(n_points);
 
     const vec3<float> v1 = box.getLatticeVector(0);
@@ -48,76 +59,126 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
         container.put(query_point_id, query_point.x, query_point.y, query_point.z);
     }
 
-    voro::voronoicell_neighbor cell;
-    voro::c_loop_all_periodic voronoi_loop(container);
-    std::vector<double> face_areas;
-    std::vector<int> face_vertices;
-    std::vector<int> neighbors;
-    std::vector<double> normals;
-    std::vector<double> vertices;
-    std::vector<NeighborBond> bonds;
+    // Computing a cell lazily creates the periodic images of the blocks it
+    // searches, which modifies the container. Creating all images up front
+    // leaves the container unchanged during the parallel computation below.
+    container.create_all_images();
+
+    // Find the block and position within the block of every point in the
+    // primary domain, so that cells can be computed in parallel by point.
+    std::vector<std::pair<int, int>> point_blocks(n_points);
+    for (int k = container.ez; k < container.wz; ++k)
+    {
+        for (int j = container.ey; j < container.wy; ++j)
+        {
+            for (int i = 0; i < container.nx; ++i)
+            {
+                const int ijk = i + container.nx * (j + container.oy * k);
+                for (int q = 0; q < container.co[ijk]; ++q)
+                {
+                    point_blocks[container.id[ijk][q]] = {ijk, q};
+                }
+            }
+        }
+    }
 
-    if (voronoi_loop.start())
+    // Each thread computes cells with its own voro_compute object, since
+    // its search state cannot be shared, and collects its own bonds.
+    struct ThreadData
     {
-        do
+        explicit ThreadData(voro::container_periodic& container)
+            : compute(container, 2 * container.nx + 1, 2 * container.ey + 1, 2 * container.ez + 1)
+        {}
+
+        voro::voro_compute<voro::container_periodic> compute;
+        voro::voronoicell_neighbor cell;
+        std::vector<double> face_areas;
+        std::vector<int> neighbors;
+        std::vector<double> normals;
+        std::vector<double> vertices;
+        std::vector<NeighborBond> bonds;
+    };
+    tbb::enumerable_thread_specific<std::unique_ptr<ThreadData>> thread_data;
+
+    util::forLoopWrapper(0, n_points, [&](size_t begin, size_t end) {
+        std::unique_ptr<ThreadData>& local_data = thread_data.local();
+        if (!local_data)
+        {
+            local_data = std::make_unique<ThreadData>(container);
+        }
+        voro::voronoicell_neighbor& cell = local_data->cell;
+        std::vector<double>& face_areas = local_data->face_areas;
+        std::vector<int>& neighbors = local_data->neighbors;
+        std::vector<double>& normals = local_data->normals;
+        std::vector<double>& vertices = local_data->vertices;
+        std::vector<NeighborBond>& bonds = local_data->bonds;
+
+        for (size_t query_point_id = begin; query_point_id < end; ++query_point_id)
         {
-            container.compute_cell(cell, voronoi_loop);
+            const int ijk = point_blocks[query_point_id].first;
+            const int q = point_blocks[query_point_id].second;
+            const int block_k = ijk / (container.nx * container.oy);
+            const int block_j = (ijk - container.nx * container.oy * block_k) / container.nx;
+            const int block_i = ijk - container.nx * (block_j + container.oy * block_k);
+            local_data->compute.compute_cell(cell, ijk, q, block_i, block_j, block_k);
 
-            // Get id and position of current particle
-            const int query_point_id(voronoi_loop.pid());
-            vec3<double> query_point(voronoi_loop.x(), voronoi_loop.y(), voronoi_loop.z());
+            // Get position of current particle
+            const double* position = container.p[ijk] + 3 * q;
+            vec3<double> query_point(position[0], position[1], position[2]);
 
             // Get Voronoi cell properties
             cell.face_areas(face_areas);
-            cell.face_vertices(face_vertices);
             cell.neighbors(neighbors);
             cell.normals(normals);
-            cell.vertices(query_point.x, query_point.y, query_point.z, vertices);
+            const vec3<double>& query_point_system_coords((*nq)[query_point_id]);
 
-            // Compute polytope vertices in relative coordinates
-            std::vector<vec3<double>> relative_vertices;
-            auto vertex_iterator = vertices.begin();
-            while (vertex_iterator != vertices.end())
+            if (m_compute_polytopes)
             {
-                double vert_x = *vertex_iterator;
-                vertex_iterator++;
-                double vert_y = *vertex_iterator;
-                vertex_iterator++;
-                double vert_z = *vertex_iterator;
-                vertex_iterator++;
-
-                // In 2D systems, only use vertices from the upper plane
-                // to prevent double-counting, and set z=0 manually
-                if (box.is2D())
+                cell.vertices(query_point.x, query_point.y, query_point.z, vertices);
+
+                // Compute polytope vertices in relative coordinates
+                std::vector<vec3<double>> relative_vertices;
+                auto vertex_iterator = vertices.begin();
+                while (vertex_iterator != vertices.end())
                 {
-                    if (vert_z < 0)
+                    double vert_x = *vertex_iterator;
+                    vertex_iterator++;
+                    double vert_y = *vertex_iterator;
+                    vertex_iterator++;
+                    double vert_z = *vertex_iterator;
+                    vertex_iterator++;
+
+                    // In 2D systems, only use vertices from the upper plane
+                    // to prevent double-counting, and set z=0 manually
+                    if (box.is2D())
                     {
-                        continue;
+                        if (vert_z < 0)
+                        {
+                            continue;
+                        }
+                        vert_z = 0;
                     }
-                    vert_z = 0;
+                    vec3<double> delta = vec3<double>(vert_x, vert_y, vert_z) - query_point;
+                    relative_vertices.push_back(delta);
                 }
-                vec3<double> delta = vec3<double>(vert_x, vert_y, vert_z) - query_point;
-                relative_vertices.push_back(delta);
-            }
 
-            // Sort relative vertices by their angle in 2D systems
-            if (box.is2D())
-            {
-                std::sort(relative_vertices.begin(), relative_vertices.end(),
-                          [](const vec3<double>& a, const vec3<double>& b) {
-                              return std::atan2(a.y, a.x) < std::atan2(b.y, b.x);
-                          });
-            }
-
-            // Save polytope vertices in system coordinates
-            const vec3<double>& query_point_system_coords((*nq)[query_point_id]);
+                // Sort relative vertices by their angle in 2D systems
+                if (box.is2D())
+                {
+                    std::sort(relative_vertices.begin(), relative_vertices.end(),
+                              [](const vec3<double>& a, const vec3<double>& b) {
+                                  return std::atan2(a.y, a.x) < std::atan2(b.y, b.x);
+                              });
+                }
 
-            std::vector<vec3<double>> system_vertices;
-            system_vertices.reserve(relative_vertices.size());
-            std::transform(
-                relative_vertices.begin(), relative_vertices.end(), std::back_inserter(system_vertices),
-                [&](const auto& relative_vertex) { return relative_vertex + query_point_system_coords; });
-            m_polytopes[query_point_id] = system_vertices;
+                // Save polytope vertices in system coordinates
+                std::vector<vec3<double>> system_vertices;
+                system_vertices.reserve(relative_vertices.size());
+                std::transform(
+                    relative_vertices.begin(), relative_vertices.end(), std::back_inserter(system_vertices),
+                    [&](const auto& relative_vertex) { return relative_vertex + query_point_system_coords; });
+                m_polytopes[query_point_id] = std::move(system_vertices);
+            }
 
             // Save cell volume
             m_volumes[query_point_id] = cell.volume();
@@ -154,26 +215,32 @@ void Voronoi::compute(const freud::locality::NeighborQuery* nq)
                 const vec3<float> rij = box.wrap(point_system_coords - query_point_system_coords);
                 const float distance(std::sqrt(dot(rij, rij)));
 
-                bonds.emplace_back(query_point_id, point_id, distance, weight);
+                bonds.emplace_back(query_point_id, point_id, distance, weight, rij);
             }
+        }
+    });
 
-        } while (voronoi_loop.inc());
+    // Merge the bonds found by each thread.
+    std::vector<NeighborBond> bonds;
+    for (const auto& local_data : thread_data)
+    {
+        bonds.insert(bonds.end(), local_data->bonds.begin(), local_data->bonds.end());
     }
 
     tbb::parallel_sort(bonds.begin(), bonds.end(), [](const NeighborBond& n1, const NeighborBond& n2) {
         return n1.less_id_ref_weight(n2);
     });
 
-    unsigned int num_bonds = bonds.size();
+    const size_t num_bonds = bonds.size();
 
     m_neighbor_list->resize(num_bonds);
-    m_neighbor_list->setNumBonds(num_bonds, n_points, n_points);
+    m_neighbor_list->setNumBonds(num_bonds, n_points, n_points, true, false, false);
 
-    util::forLoopWrapper(0, num_bonds, [=](size_t begin, size_t end) {
+    util::forLoopWrapper(0, num_bonds, [&](size_t begin, size_t end) {
         for (size_t bond = begin; bond != end; ++bond)
         {
-            m_neighbor_list->getNeighbors()(bond, 0) = bonds[bond].query_point_idx;
-            m_neighbor_list->getNeighbors()(bond, 1) = bonds[bond].point_idx;
+            m_neighbor_list->getQueryPointIndices()[bond] = bonds[bond].query_point_idx;
+            m_neighbor_list->getPointIndices()[bond] = bonds[bond].point_idx;
             m_neighbor_list->getDistances()[bond] = bonds[bond].distance;
             m_neighbor_list->getWeights()[bond] = bonds[bond].weight;
         }
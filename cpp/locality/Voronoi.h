@@ -16,11 +16,23 @@ namespace freud { namespace locality {
 class Voronoi
 {
 public:
-    // default constructor
-    Voronoi() : m_neighbor_list(std::make_shared<NeighborList>()) {}
+    //! Constructor
+    /*! \param compute_polytopes Whether to compute and store the vertices of
+     *         each Voronoi polytope. If false, only the neighbor list and the
+     *         cell volumes are computed.
+     */
+    explicit Voronoi(bool compute_polytopes = true)
+        : m_compute_polytopes(compute_polytopes), m_neighbor_list(std::make_shared<NeighborList>())
+    {}
 
     void compute(const freud::locality::NeighborQuery* nq);
 
+    //! Return whether polytope vertices are computed
+    bool getComputePolytopes() const
+    {
+        return m_compute_polytopes;
+    }
+
     std::shared_ptr<NeighborList> getNeighborList() const
     {
         return m_neighbor_list;
@@ -38,6 +50,7 @@ public:
 
 private:
     box::Box m_box;
+    bool m_compute_polytopes;                           //!< Whether to compute polytope vertices
     std::shared_ptr<NeighborList> m_neighbor_list;      //!< Stored neighbor list
     std::vector<std::vector<vec3<double>>> m_polytopes; //!< Voronoi polytopes
     util::ManagedArray<double> m_volumes;               //!< Voronoi cell volumes
@@ -12,8 +12,7 @@ void HexaticTranslational<T>::computeGeneral(Func func, const freud::locality::N
                                              const freud::locality::NeighborQuery* points,
                                              freud::locality::QueryArgs qargs, bool normalize_by_k)
 {
-    const auto box = points->getBox();
-    box.enforce2D();
+    points->getBox().enforce2D();
 
     const unsigned int Np = points->getNPoints();
 
@@ -23,12 +22,10 @@ void HexaticTranslational<T>::computeGeneral(Func func, const freud::locality::N
         points, points->getPoints(), Np, qargs, nlist,
         [=](size_t i, const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
             float total_weight(0);
-            const vec3<float> ref((*points)[i]);
 
             for (freud::locality::NeighborBond nb = ppiter->next(); !ppiter->end(); nb = ppiter->next())
             {
-                // Compute vector from query_point to point
-                const vec3<float> delta = box.wrap((*points)[nb.point_idx] - ref);
+                const vec3<float>& delta = nb.vector;
                 const float weight(m_weighted ? nb.weight : 1.0);
 
                 // Compute psi for this vector
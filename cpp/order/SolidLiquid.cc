@@ -35,18 +35,21 @@ void SolidLiquid::compute(const freud::locality::NeighborList* nlist,
 
     // Compute (normalized) dot products for each bond in the neighbor list
     const auto normalizationfactor = float(4.0 * M_PI / m_num_ms);
-    const unsigned int num_bonds(m_nlist.getNumBonds());
+    const size_t num_bonds(m_nlist.getNumBonds());
     m_ql_ij.prepare(num_bonds);
 
+    // The query point indices of a compressed list are built on first access,
+    // so they are fetched before the parallel loop.
+    const auto& query_point_indices = m_nlist.getQueryPointIndices();
     util::forLoopWrapper(
         0, num_query_points,
         [=](size_t begin, size_t end) {
             for (unsigned int i = begin; i != end; ++i)
             {
-                unsigned int bond(m_nlist.find_first_index(i));
-                for (; bond < num_bonds && m_nlist.getNeighbors()(bond, 0) == i; ++bond)
+                size_t bond(m_nlist.find_first_index(i));
+                for (; bond < num_bonds && query_point_indices[bond] == i; ++bond)
                 {
-                    const unsigned int j(m_nlist.getNeighbors()(bond, 1));
+                    const unsigned int j(m_nlist.getPointIndices()[bond]);
 
                     // Accumulate the dot product over m of qlmi and qlmj vectors
                     std::complex<float> bond_ql_ij = 0;
@@ -68,13 +71,10 @@ void SolidLiquid::compute(const freud::locality::NeighborList* nlist,
         true);
 
     // Filter neighbors to contain only solid-like bonds
-    std::vector<bool> solid_filter(num_bonds);
-    for (unsigned int bond(0); bond < num_bonds; bond++)
-    {
-        solid_filter[bond] = (m_ql_ij[bond] > m_q_threshold);
-    }
     freud::locality::NeighborList solid_nlist(m_nlist);
-    solid_nlist.filter(solid_filter.cbegin());
+    const float* ql_ij = m_ql_ij.get();
+    const float q_threshold = m_q_threshold;
+    solid_nlist.filterIf([ql_ij, q_threshold](size_t bond) { return ql_ij[bond] > q_threshold; });
 
     // Save the neighbor counts of solid-like bonds for each query point
     m_number_of_connections.prepare(num_query_points);
@@ -84,21 +84,21 @@ void SolidLiquid::compute(const freud::locality::NeighborList* nlist,
     }
 
     // Filter nlist to only bonds between solid-like particles
-    // (particles with more than solid_threshold solid-like bonds)
-    const unsigned int num_solid_bonds(solid_nlist.getNumBonds());
-    std::vector<bool> neighbor_count_filter(num_solid_bonds);
-    for (unsigned int bond(0); bond < num_solid_bonds; bond++)
-    {
-        const unsigned int i(solid_nlist.getNeighbors()(bond, 0));
-        const unsigned int j(solid_nlist.getNeighbors()(bond, 1));
-        neighbor_count_filter[bond] = (m_number_of_connections[i] >= m_solid_threshold
-                                       && m_number_of_connections[j] >= m_solid_threshold);
-    }
-    freud::locality::NeighborList solid_neighbor_nlist(solid_nlist);
-    solid_neighbor_nlist.filter(neighbor_count_filter.cbegin());
+    // (particles with more than solid_threshold solid-like bonds). The list
+    // of solid-like bonds is not used afterwards, so it is filtered in place.
+    // The query point indices are materialized before the parallel filter
+    // since they are built lazily for compressed lists.
+    const unsigned int* solid_query_point_indices = solid_nlist.getQueryPointIndices().get();
+    const unsigned int* solid_point_indices = solid_nlist.getPointIndices().get();
+    const unsigned int* number_of_connections = m_number_of_connections.get();
+    const unsigned int solid_threshold = m_solid_threshold;
+    solid_nlist.filterIf([=](size_t bond) {
+        return number_of_connections[solid_query_point_indices[bond]] >= solid_threshold
+            && number_of_connections[solid_point_indices[bond]] >= solid_threshold;
+    });
 
     // Find clusters of solid-like particles
-    m_cluster.compute(points, &solid_neighbor_nlist, qargs);
+    m_cluster.compute(points, &solid_nlist, qargs);
 }
 
 }; }; // end namespace freud::order
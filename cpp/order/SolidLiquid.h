@@ -5,7 +5,6 @@
 #define SOLID_LIQUID_H
 
 #include <complex>
-#include <iterator>
 #include <vector>
 
 #include "Cluster.h"
@@ -91,17 +90,23 @@ public:
     //! Returns largest cluster size.
     unsigned int getLargestClusterSize() const
     {
-        return m_cluster.getClusterKeys()[0].size();
+        if (m_cluster.getNumClusters() == 0)
+        {
+            return 0;
+        }
+        const auto& offsets = m_cluster.getClusterKeyOffsets();
+        return offsets[1] - offsets[0];
     }
 
     //! Returns a vector containing the size of all clusters.
     std::vector<unsigned int> getClusterSizes() const
     {
-        auto keys = m_cluster.getClusterKeys();
-        std::vector<unsigned int> sizes;
-        sizes.reserve(keys.size());
-        std::transform(keys.begin(), keys.end(), std::back_inserter(sizes),
-                       [](auto& key) { return key.size(); });
+        const auto& offsets = m_cluster.getClusterKeyOffsets();
+        std::vector<unsigned int> sizes(m_cluster.getNumClusters());
+        for (size_t cluster = 0; cluster < sizes.size(); ++cluster)
+        {
+            sizes[cluster] = offsets[cluster + 1] - offsets[cluster];
+        }
         return sizes;
     }
 
@@ -115,7 +115,6 @@ void Steinhardt::baseCompute(const freud::locality::NeighborList* nlist,
         points, points->getPoints(), m_Np, qargs, nlist,
         [=](size_t i, const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
             float total_weight(0);
-            const vec3<float> ref((*points)[i]);
             // Construct PointSPHEvaluator outside loop since the construction is costly.
             auto max_l = *std::max_element(m_ls.begin(), m_ls.end());
             fsph::PointSPHEvaluator<float> sph_eval(max_l);
@@ -130,7 +129,7 @@ void Steinhardt::baseCompute(const freud::locality::NeighborList* nlist,
 
             for (freud::locality::NeighborBond nb = ppiter->next(); !ppiter->end(); nb = ppiter->next())
             {
-                const vec3<float> delta = points->getBox().wrap((*points)[nb.point_idx] - ref);
+                const vec3<float>& delta = nb.vector;
                 const float weight(m_weighted ? nb.weight : float(1.0));
 
                 // phi is usually in range 0..2Pi, but
@@ -214,7 +213,7 @@ void Steinhardt::computeAve(const freud::locality::NeighborList* nlist,
         normalizationfactor[l_index] = static_cast<float>(4.0 * M_PI / m_num_ms[l_index]);
     }
 
-    freud::locality::loopOverNeighborsIterator(
+    freud::locality::loopOverNeighborsIterator<false>(
         points, points->getPoints(), m_Np, qargs, nlist,
         [=](size_t i, const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
             unsigned int neighborcount(1);
@@ -71,7 +71,7 @@ void PMFTXYT::accumulate(const locality::NeighborQuery* neighbor_query, const fl
     neighbor_query->getBox().enforce2D();
     accumulateGeneral(neighbor_query, query_points, n_query_points, nlist, qargs,
                       [=](const freud::locality::NeighborBond& neighbor_bond) {
-                          vec3<float> delta(bondVector(neighbor_bond, neighbor_query, query_points));
+                          vec3<float> delta(neighbor_bond.vector);
 
                           // rotate interparticle vector
                           vec2<float> myVec(delta.x, delta.y);
@@ -119,7 +119,7 @@ void PMFTXYZ::accumulate(const locality::NeighborQuery* neighbor_query, const qu
                           // create the reference point quaternion
                           quat<float> query_orientation(query_orientations[neighbor_bond.query_point_idx]);
                           // make sure that the particles are wrapped into the box
-                          vec3<float> delta(bondVector(neighbor_bond, neighbor_query, query_points));
+                          vec3<float> delta(neighbor_bond.vector);
 
                           for (unsigned int k = 0; k < num_equiv_orientations; k++)
                           {
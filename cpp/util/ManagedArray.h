@@ -1,6 +1,7 @@
 #ifndef MANAGED_ARRAY_H
 #define MANAGED_ARRAY_H
 
+#include <algorithm>
 #include <cstring>
 #include <functional>
 #include <memory>
@@ -64,6 +65,23 @@ public:
      */
     explicit ManagedArray(size_t size) : ManagedArray(std::vector<size_t> {size}) {}
 
+    //! Constructor wrapping memory that is owned by another object.
+    /*! The data is not copied. The array holds a reference to the owner, so
+     *  the memory stays valid for as long as any ManagedArray (or numpy array
+     *  created from one) refers to it. A later call to prepare that needs to
+     *  reallocate replaces the external memory with a new allocation as usual.
+     *
+     *  \param data Pointer to the first element of the external memory.
+     *  \param shape Shape of the array stored at data.
+     *  \param owner Object keeping the external memory alive.
+     */
+    ManagedArray(T* data, const std::vector<size_t>& shape, std::shared_ptr<void> owner)
+        : m_data(std::make_shared<std::shared_ptr<T>>(std::move(owner), data)),
+          m_shape(std::make_shared<std::vector<size_t>>(shape)),
+          m_size(std::make_shared<size_t>(
+              std::accumulate(shape.begin(), shape.end(), size_t(1), std::multiplies<size_t>())))
+    {}
+
     //! Destructor (currently empty because data is managed by shared pointer).
     ~ManagedArray() = default;
 
@@ -336,10 +354,7 @@ public:
     ManagedArray copy() const
     {
         ManagedArray newarray(shape());
-        for (unsigned int i = 0; i < size(); ++i)
-        {
-            newarray[i] = get()[i];
-        }
+        std::copy(get(), get() + size(), newarray.get());
         return newarray;
     }
 
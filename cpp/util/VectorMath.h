@@ -32,13 +32,13 @@ template<class Real> struct vec3
         \param _y y-component
         \param _z z-component
     */
-    vec3(const Real& _x, const Real& _y, const Real& _z) : x(_x), y(_y), z(_z) {}
+    constexpr vec3(const Real& _x, const Real& _y, const Real& _z) : x(_x), y(_y), z(_z) {}
 
     //! Implicit cast from vec3<double> to the current Real
-    vec3(const vec3<double>& a) : x(a.x), y(a.y), z(a.z) {}
+    constexpr vec3(const vec3<double>& a) : x(a.x), y(a.y), z(a.z) {}
 
     //! Implicit cast from vec3<float> to the current Real
-    vec3(const vec3<float>& a) : x(a.x), y(a.y), z(a.z) {}
+    constexpr vec3(const vec3<float>& a) : x(a.x), y(a.y), z(a.z) {}
 
     //! Default construct a 0 vector
     vec3() = default;
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2020 The Regents of the University of Michigan
 # This file is from the freud project, released under the BSD 3-Clause License.
 
+from libc.stdint cimport uint64_t
 from libcpp cimport bool
 
 from freud.util cimport vec3
@@ -42,13 +43,26 @@ cdef extern from "Box.h" namespace "freud::box":
         void wrap(const vec3[float]*, unsigned int, vec3[float]*) const
         void unwrap(const vec3[float]*, const vec3[int]*,
                     unsigned int, vec3[float]*) const
-        vec3[float] centerOfMass(vec3[float]*, size_t, float*) const
+        vec3[float] centerOfMass(const vec3[float]*, size_t, const float*) nogil const
+        void centerOfMassGroups(const vec3[float]*, size_t, const float*,
+                                const unsigned int*, unsigned int,
+                                vec3[float]*) nogil const
         void center(vec3[float]*, size_t, float*) const
         void computeDistances(vec3[float]*, unsigned int,
                               vec3[float]*, unsigned int, float*
                               ) except +
         void computeAllDistances(vec3[float]*, unsigned int,
                                  vec3[float]*, unsigned int, float*)
+        void computeMinDistances(vec3[float]*, unsigned int,
+                                 vec3[float]*, unsigned int, float*,
+                                 unsigned int*) nogil
+        void countDistances(vec3[float]*, unsigned int,
+                            vec3[float]*, unsigned int, float,
+                            unsigned int*) nogil
+        void computeDistanceHistogram(vec3[float]*, unsigned int,
+                                      vec3[float]*, unsigned int,
+                                      unsigned int, float,
+                                      uint64_t*) nogil except +
         void contains(vec3[float]*, unsigned int, bool*) const
         vec3[bool] getPeriodic() const
         bool getPeriodicX() const
@@ -58,3 +72,14 @@ cdef extern from "Box.h" namespace "freud::box":
         void setPeriodicX(bool)
         void setPeriodicY(bool)
         void setPeriodicZ(bool)
+
+    void makeAbsoluteFrames(const Box*, unsigned int, const vec3[float]*,
+                            unsigned int, vec3[float]*) nogil
+    void makeFractionalFrames(const Box*, unsigned int, const vec3[float]*,
+                              unsigned int, vec3[float]*) nogil
+    void getImagesFrames(const Box*, unsigned int, const vec3[float]*,
+                         unsigned int, vec3[int]*) nogil
+    void wrapFrames(const Box*, unsigned int, const vec3[float]*,
+                    unsigned int, vec3[float]*) nogil
+    void unwrapFrames(const Box*, unsigned int, const vec3[float]*,
+                      const vec3[int]*, unsigned int, vec3[float]*) nogil
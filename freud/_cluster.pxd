@@ -1,11 +1,9 @@
 # Copyright (c) 2010-2020 The Regents of the University of Michigan
 # This file is from the freud project, released under the BSD 3-Clause License.
 
-from libcpp.vector cimport vector
-
 cimport freud._locality
 cimport freud.util
-from freud.util cimport uint, vec3
+from freud.util cimport vec3
 
 
 cdef extern from "Cluster.h" namespace "freud::cluster":
@@ -17,7 +15,8 @@ cdef extern from "Cluster.h" namespace "freud::cluster":
                      const unsigned int*) except +
         unsigned int getNumClusters() const
         const freud.util.ManagedArray[unsigned int] &getClusterIdx() const
-        const vector[vector[uint]] getClusterKeys() const
+        const freud.util.ManagedArray[unsigned int] &getClusterKeys() const
+        const freud.util.ManagedArray[size_t] &getClusterKeyOffsets() const
 
 cdef extern from "ClusterProperties.h" namespace "freud::cluster":
     cdef cppclass ClusterProperties:
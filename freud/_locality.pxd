@@ -4,6 +4,7 @@
 from libcpp cimport bool
 from libcpp.memory cimport shared_ptr
 from libcpp.pair cimport pair
+from libcpp.string cimport string
 from libcpp.vector cimport vector
 
 cimport freud._box
@@ -17,6 +18,7 @@ cdef extern from "NeighborBond.h" namespace "freud::locality":
         unsigned int point_idx
         float distance
         float weight
+        vec3[float] vector
         bool operator==(NeighborBond)
         bool operator!=(NeighborBond)
         bool operator<(NeighborBond)
@@ -36,14 +38,16 @@ cdef extern from "NeighborQuery.h" namespace "freud::locality":
         float r_guess
         float scale
         bool exclude_ii
+        bool half
+        bool vectors
 
     cdef cppclass NeighborQuery:
-        NeighborQuery() except +
+        NeighborQuery() nogil except +
         NeighborQuery(const freud._box.Box &,
                       const vec3[float]*,
-                      unsigned int) except +
+                      unsigned int) nogil except +
         shared_ptr[NeighborQueryIterator] query(
-            const vec3[float]*, unsigned int, QueryArgs) except +
+            const vec3[float]*, unsigned int, QueryArgs) nogil except +
         const freud._box.Box & getBox() const
         const vec3[float]* getPoints const
         const unsigned int getNPoints const
@@ -57,58 +61,74 @@ cdef extern from "NeighborQuery.h" namespace "freud::locality":
         NeighborQueryIterator(NeighborQuery*, vec3[float]*, unsigned int)
         bool end()
         NeighborBond next()
-        NeighborList *toNeighborList(bool)
+        NeighborList *toNeighborList(bool, bool) nogil except +
+        void countNeighbors(size_t*) nogil except +
+        void fillNeighbors(const size_t*, unsigned int*, unsigned int*,
+                           float*, vec3[float]*, bool) nogil except +
 
 cdef extern from "RawPoints.h" namespace "freud::locality":
 
     cdef cppclass RawPoints(NeighborQuery):
-        RawPoints() except +
+        RawPoints() nogil except +
         RawPoints(const freud._box.Box,
                   const vec3[float]*,
-                  unsigned int) except +
+                  unsigned int) nogil except +
+        string getStructureName() const
+        double getBuildTime() const
 
 cdef extern from "NeighborList.h" namespace "freud::locality":
     cdef cppclass NeighborList:
         NeighborList()
-        NeighborList(unsigned int)
-        NeighborList(unsigned int, const unsigned int*, unsigned int,
+        NeighborList(size_t)
+        NeighborList(size_t, const unsigned int*, unsigned int,
                      const unsigned int*, unsigned int, const float*,
-                     const float*) except +
+                     const float*, const vec3[float]*) except +
 
-        freud.util.ManagedArray[unsigned int] &getNeighbors()
+        freud.util.ManagedArray[unsigned int] &getQueryPointIndices()
+        freud.util.ManagedArray[unsigned int] &getPointIndices()
         freud.util.ManagedArray[float] &getDistances()
         freud.util.ManagedArray[float] &getWeights()
-        freud.util.ManagedArray[float] &getSegments()
-        freud.util.ManagedArray[float] &getCounts()
-
-        unsigned int getNumBonds() const
+        freud.util.ManagedArray[vec3[float]] &getVectors()
+        freud.util.ManagedArray[size_t] &getSegments()
+        freud.util.ManagedArray[unsigned int] &getCounts()
+        bool hasWeights() const
+        bool hasVectors() const
+        bool isCompressed() const
+        void compress()
+
+        size_t getNumBonds() const
         unsigned int getNumPoints() const
         unsigned int getNumQueryPoints() const
-        void setNumBonds(unsigned int, unsigned int, unsigned int)
-        unsigned int filter[Iterator](const Iterator) except +
-        unsigned int filter_r(float, float) except +
+        void setNumBonds(size_t, unsigned int, unsigned int)
+        size_t filter[Iterator](const Iterator) except +
+        size_t filter_r(float, float) except +
 
-        unsigned int find_first_index(unsigned int)
+        size_t find_first_index(unsigned int)
 
-        void resize(unsigned int)
+        void resize(size_t)
         void copy(const NeighborList &)
         void validate(unsigned int, unsigned int) except +
+        void save(const string &) nogil except +
+        void load(const string &, bool) nogil except +
 
 cdef extern from "LinkCell.h" namespace "freud::locality":
     cdef cppclass LinkCell(NeighborQuery):
-        LinkCell() except +
+        LinkCell() nogil except +
         LinkCell(const freud._box.Box &,
                  const vec3[float]*,
                  unsigned int,
-                 float) except +
+                 float,
+                 bool) nogil except +
         float getCellWidth() const
 
 cdef extern from "AABBQuery.h" namespace "freud::locality":
     cdef cppclass AABBQuery(NeighborQuery):
-        AABBQuery() except +
+        AABBQuery() nogil except +
         AABBQuery(const freud._box.Box,
                   const vec3[float]*,
-                  unsigned int) except +
+                  unsigned int,
+                  bool) nogil except +
+        bool update(const vec3[float]*, float) nogil except +
 
 cdef extern from "BondHistogramCompute.h" namespace "freud::locality":
     cdef cppclass BondHistogramCompute:
@@ -130,14 +150,32 @@ cdef extern from "PeriodicBuffer.h" namespace "freud::locality":
         void compute(
             const NeighborQuery*,
             const vec3[float],
-            const bool) except +
-        vector[vec3[float]] getBufferPoints() const
-        vector[uint] getBufferIds() const
+            const bool,
+            const bool) nogil except +
+        const freud.util.ManagedArray[vec3[float]] &getBufferPoints() const
+        const freud.util.ManagedArray[uint] &getBufferIds() const
+        const freud.util.ManagedArray[vec3[int]] &getBufferImages() const
+        bool getIncludePoints() const
 
 cdef extern from "Voronoi.h" namespace "freud::locality":
     cdef cppclass Voronoi:
-        Voronoi()
+        Voronoi(bool)
         void compute(const NeighborQuery*) nogil except +
+        bool getComputePolytopes() const
         vector[vector[vec3[double]]] getPolytopes() const
         const freud.util.ManagedArray[double] &getVolumes() const
         shared_ptr[NeighborList] getNeighborList() const
+
+cdef extern from "VerletList.h" namespace "freud::locality":
+    cdef cppclass VerletList:
+        VerletList(float, float) except +
+        void compute(
+            const NeighborQuery*,
+            const vec3[float]*,
+            unsigned int,
+            bool) nogil except +
+        shared_ptr[NeighborList] getNeighborList() const
+        float getRMax() const
+        float getSkin() const
+        bool getRebuilt() const
+        unsigned int getNumBuilds() const
@@ -16,7 +16,10 @@ import freud.util
 
 cimport numpy as np
 from cpython.object cimport Py_EQ, Py_NE
+from cython.operator cimport dereference
+from libc.stdint cimport uint64_t
 from libcpp cimport bool as cpp_bool
+from libcpp.vector cimport vector
 
 cimport freud._box
 from freud.util cimport vec3
@@ -180,23 +183,36 @@ cdef class Box:
         """float: The box volume (area in 2D)."""
         return self.thisptr.getVolume()
 
-    def make_absolute(self, fractional_coordinates, out=None):
+    def make_absolute(self, fractional_coordinates, out=None, boxes=None):
         R"""Convert fractional coordinates into absolute coordinates.
 
         Args:
-            fractional_coordinates (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
+            fractional_coordinates (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
                 Fractional coordinate vector(s), between 0 and 1 within
-                parallelepipedal box.
-            out (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
+                parallelepipedal box. All frames of an
+                :math:`\left(N_{frames}, N, 3\right)` array are converted in a
+                single parallel loop.
+            out (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
                 The array in which to place the absolute coordinates. It must be
                 of dtype `np.float32`. If ``None``, this function will return a
                 newly allocated array (Default value = None).
+            boxes (sequence of box-like objects, optional):
+                One box for each frame of an
+                :math:`\left(N_{frames}, N, 3\right)` input, used instead of
+                this box, for example for trajectories with a changing box.
+                Each element may be any object accepted by
+                :meth:`~.from_box`, such as an :math:`\left(N_{frames}, 6\right)`
+                array of box parameters. If ``None``, this box is used for
+                every frame (Default value = None).
 
         Returns:
-            :math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`:
+            :math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`:
                 Absolute coordinate vector(s). If ``out`` is provided, a
                 reference to it is returned.
         """  # noqa: E501
+        if np.ndim(fractional_coordinates) == 3 or boxes is not None:
+            return _transform_frames(
+                self, _MAKE_ABSOLUTE, fractional_coordinates, None, out, boxes)
         fractions = np.asarray(fractional_coordinates).copy()
         flatten = fractions.ndim == 1
         fractions = np.atleast_2d(fractions)
@@ -214,22 +230,35 @@ cdef class Box:
 
         return np.squeeze(out) if flatten else out
 
-    def make_fractional(self, absolute_coordinates, out=None):
+    def make_fractional(self, absolute_coordinates, out=None, boxes=None):
         R"""Convert absolute coordinates into fractional coordinates.
 
         Args:
-            absolute_coordinates (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
-                Absolute coordinate vector(s).
-            out (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
+            absolute_coordinates (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
+                Absolute coordinate vector(s). All frames of an
+                :math:`\left(N_{frames}, N, 3\right)` array are converted in a
+                single parallel loop.
+            out (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
                 The array in which to place the fractional positions. It must be
                 of dtype `np.float32`. If ``None``, this function will return a
                 newly allocated array (Default value = None).
+            boxes (sequence of box-like objects, optional):
+                One box for each frame of an
+                :math:`\left(N_{frames}, N, 3\right)` input, used instead of
+                this box, for example for trajectories with a changing box.
+                Each element may be any object accepted by
+                :meth:`~.from_box`, such as an :math:`\left(N_{frames}, 6\right)`
+                array of box parameters. If ``None``, this box is used for
+                every frame (Default value = None).
 
         Returns:
-            :math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`:
+            :math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`:
                 Fractional coordinate vector(s). If ``out`` is provided, a
                 reference to it is returned.
         """  # noqa: E501
+        if np.ndim(absolute_coordinates) == 3 or boxes is not None:
+            return _transform_frames(
+                self, _MAKE_FRACTIONAL, absolute_coordinates, None, out, boxes)
         vecs = np.asarray(absolute_coordinates).copy()
         flatten = vecs.ndim == 1
         vecs = np.atleast_2d(vecs)
@@ -247,25 +276,44 @@ cdef class Box:
 
         return np.squeeze(out) if flatten else out
 
-    def get_images(self, vecs):
+    def get_images(self, vecs, out=None, boxes=None):
         R"""Returns the images corresponding to unwrapped vectors.
 
         Args:
-            vecs (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
-                Coordinates of unwrapped vector(s).
+            vecs (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
+                Coordinates of unwrapped vector(s). The images of all frames of
+                an :math:`\left(N_{frames}, N, 3\right)` array are computed
+                in a single parallel loop.
+            out (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
+                The array in which to place the image indices. It must be of
+                dtype `np.int32`. If ``None``, this function will return a
+                newly allocated array (Default value = None).
+            boxes (sequence of box-like objects, optional):
+                One box for each frame of an
+                :math:`\left(N_{frames}, N, 3\right)` input, used instead of
+                this box, for example for trajectories with a changing box.
+                Each element may be any object accepted by
+                :meth:`~.from_box`, such as an :math:`\left(N_{frames}, 6\right)`
+                array of box parameters. If ``None``, this box is used for
+                every frame (Default value = None).
 
         Returns:
-            :math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`:
-                Image index vector(s).
+            :math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`:
+                Image index vector(s). If ``out`` is provided, a reference to
+                it is returned.
         """  # noqa: E501
+        if np.ndim(vecs) == 3 or boxes is not None:
+            return _transform_frames(
+                self, _GET_IMAGES, vecs, None, out, boxes)
         vecs = np.asarray(vecs)
         flatten = vecs.ndim == 1
         vecs = np.atleast_2d(vecs)
         vecs = freud.util._convert_array(vecs, shape=(None, 3))
 
-        images = np.zeros(vecs.shape, dtype=np.int32)
+        images = freud.util._convert_array(
+            out, shape=vecs.shape, dtype=np.int32, allow_copy=False)
         cdef const float[:, ::1] l_points = vecs
-        cdef const int[:, ::1] l_result = images
+        cdef int[:, ::1] l_result = images
         cdef unsigned int Np = l_points.shape[0]
         self.thisptr.getImages(<vec3[float]*> &l_points[0, 0], Np,
                                <vec3[int]*> &l_result[0, 0])
@@ -304,7 +352,7 @@ cdef class Box:
         :math:`(xz*L_z, yz*L_z, L_z)`."""
         return self.get_box_vector(2)
 
-    def wrap(self, vecs, out=None):
+    def wrap(self, vecs, out=None, boxes=None):
         R"""Wrap an array of vectors into the box, using periodic boundaries.
 
         .. note:: Since the origin of the box is in the center, wrapping is
@@ -312,18 +360,30 @@ cdef class Box:
                   input vectors.
 
         Args:
-            vecs (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
-                Unwrapped vector(s).
-            out (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
+            vecs (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
+                Unwrapped vector(s). All frames of an
+                :math:`\left(N_{frames}, N, 3\right)` array are wrapped in a
+                single parallel loop.
+            out (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
                 The array in which to place the wrapped vectors. It must be of
                 dtype `np.float32`. If ``None``, this function will
                 return a newly allocated array (Default value = None).
+            boxes (sequence of box-like objects, optional):
+                One box for each frame of an
+                :math:`\left(N_{frames}, N, 3\right)` input, used instead of
+                this box, for example for trajectories with a changing box.
+                Each element may be any object accepted by
+                :meth:`~.from_box`, such as an :math:`\left(N_{frames}, 6\right)`
+                array of box parameters. If ``None``, this box is used for
+                every frame (Default value = None).
 
         Returns:
-            :math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`:
+            :math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`:
                 Vector(s) wrapped into the box. If ``out`` is provided, a
                 reference to it is returned.
         """  # noqa: E501
+        if np.ndim(vecs) == 3 or boxes is not None:
+            return _transform_frames(self, _WRAP, vecs, None, out, boxes)
         vecs = np.asarray(vecs)
         flatten = vecs.ndim == 1
         vecs = np.atleast_2d(vecs)
@@ -340,26 +400,40 @@ cdef class Box:
 
         return np.squeeze(out) if flatten else out
 
-    def unwrap(self, vecs, imgs, out=None):
+    def unwrap(self, vecs, imgs, out=None, boxes=None):
         R"""Unwrap an array of vectors inside the box back into real space,
         using an array of image indices that determine how many times to unwrap
         in each dimension.
 
         Args:
-            vecs (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
-                Vector(s) to be unwrapped.
-            imgs (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`):
-                Image indices for vector(s).
-            out (:math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
+            vecs (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
+                Vector(s) to be unwrapped. All frames of an
+                :math:`\left(N_{frames}, N, 3\right)` array are unwrapped in a
+                single parallel loop.
+            imgs (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`):
+                Image indices for vector(s). For an
+                :math:`\left(N_{frames}, N, 3\right)` array of vectors, the
+                images must have the same shape.
+            out (:math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray` or :code:`None`):
                 The array in which to place the unwrapped vectors. It must be of
                 dtype `np.float32`. If ``None``, this function will
                 return a newly allocated array (Default value = None).
+            boxes (sequence of box-like objects, optional):
+                One box for each frame of an
+                :math:`\left(N_{frames}, N, 3\right)` input, used instead of
+                this box, for example for trajectories with a changing box.
+                Each element may be any object accepted by
+                :meth:`~.from_box`, such as an :math:`\left(N_{frames}, 6\right)`
+                array of box parameters. If ``None``, this box is used for
+                every frame (Default value = None).
 
         Returns:
-            :math:`\left(3, \right)` or :math:`\left(N, 3\right)` :class:`numpy.ndarray`:
+            :math:`\left(3, \right)`, :math:`\left(N, 3\right)`, or :math:`\left(N_{frames}, N, 3\right)` :class:`numpy.ndarray`:
                 Unwrapped vector(s). If ``out`` is provided, a reference to it is
                 returned.
         """  # noqa: E501
+        if np.ndim(vecs) == 3 or boxes is not None:
+            return _transform_frames(self, _UNWRAP, vecs, imgs, out, boxes)
         vecs = np.asarray(vecs)
         flatten = vecs.ndim == 1
         vecs = np.atleast_2d(vecs)
@@ -384,12 +458,18 @@ cdef class Box:
 
         return np.squeeze(out) if flatten else out
 
-    def center_of_mass(self, vecs, masses=None):
+    def center_of_mass(self, vecs, masses=None, groups=None):
         R"""Compute center of mass of an array of vectors, using periodic boundaries.
 
         This calculation accounts for periodic images. `This Wikipedia page
         <https://en.wikipedia.org/wiki/Center_of_mass#Systems_with_periodic_boundary_conditions>`_
-        describes the mathematics of this method.
+        describes the mathematics of this method. The sums over all vectors
+        are computed in parallel and accumulated in double precision.
+
+        If :code:`groups` is provided, the centers of mass of all groups (for
+        example molecules or clusters) are computed in a single pass over the
+        vectors. Groups without any vectors or with zero total mass have a
+        center of mass of NaN.
 
         Example::
 
@@ -400,7 +480,10 @@ cdef class Box:
             >>> np.mean(points, axis=0)  # Does not account for periodic images
             array([0., 0., 0.])
             >>> box.center_of_mass(points)  # Accounts for periodic images
-            array([-0.1845932,  0.       ,  0.       ])
+            array([-0.18459368,  0.        ,  0.        ])
+            >>> box.center_of_mass(points, groups=[0, 0, 1])
+            array([[-1.,  0.,  0.],
+                   [ 2.,  0.,  0.]], dtype=float32)
 
         Args:
             vecs (:math:`\left(N, 3\right)` :class:`numpy.ndarray`):
@@ -408,24 +491,53 @@ cdef class Box:
             masses (:math:`\left(N, 3\right)` :class:`numpy.ndarray`):
                 Masses corresponding to each vector, defaulting to 1 if not
                 provided or :code:`None` (Default value = :code:`None`).
+            groups (:math:`\left(N, \right)` :class:`numpy.ndarray`):
+                Non-negative integer group index of each vector, such as
+                :attr:`freud.cluster.Cluster.cluster_idx`. If :code:`None`,
+                all vectors belong to a single group
+                (Default value = :code:`None`).
 
         Returns:
-            :math:`\left(3\right)` :class:`numpy.ndarray`:
-                Center of mass.
+            :math:`\left(3\right)` or :math:`\left(N_{groups}, 3\right)` :class:`numpy.ndarray`:
+                Center of mass, or the centers of mass of groups
+                :math:`0, \ldots, \max(\text{groups})` if :code:`groups`
+                is provided.
         """  # noqa: E501
         vecs = freud.util._convert_array(vecs, shape=(None, 3))
         cdef const float[:, ::1] l_points = vecs
+        cdef size_t Np = l_points.shape[0]
+        cdef const vec3[float]* l_points_ptr = NULL
+        if Np > 0:
+            l_points_ptr = <const vec3[float]*> &l_points[0, 0]
 
-        cdef float* l_masses_ptr = NULL
-        cdef float[::1] l_masses
+        cdef const float* l_masses_ptr = NULL
+        cdef const float[::1] l_masses
         if masses is not None:
             l_masses = freud.util._convert_array(masses, shape=(len(vecs), ))
-            l_masses_ptr = &l_masses[0]
-
-        cdef size_t Np = l_points.shape[0]
-        cdef vec3[float] result = self.thisptr.centerOfMass(
-            <vec3[float]*> &l_points[0, 0], Np, l_masses_ptr)
-        return np.asarray([result.x, result.y, result.z])
+            if Np > 0:
+                l_masses_ptr = &l_masses[0]
+
+        cdef vec3[float] result
+        if groups is None:
+            with nogil:
+                result = self.thisptr.centerOfMass(l_points_ptr, Np, l_masses_ptr)
+            return np.asarray([result.x, result.y, result.z])
+
+        groups = np.asarray(groups)
+        if groups.size > 0 and np.min(groups) < 0:
+            raise ValueError("The group indices must be non-negative.")
+        groups = freud.util._convert_array(groups, shape=(Np, ), dtype=np.uint32)
+        cdef const unsigned int[::1] l_groups = groups
+        cdef unsigned int n_groups = int(np.max(groups)) + 1 if Np > 0 else 0
+        centers = np.empty((n_groups, 3), dtype=np.float32)
+        if n_groups == 0:
+            return centers
+        cdef float[:, ::1] l_centers = centers
+        with nogil:
+            self.thisptr.centerOfMassGroups(
+                l_points_ptr, Np, l_masses_ptr, &l_groups[0], n_groups,
+                <vec3[float]*> &l_centers[0, 0])
+        return centers
 
     def center(self, vecs, masses=None):
         R"""Subtract center of mass from an array of vectors, using periodic boundaries.
@@ -440,8 +552,8 @@ cdef class Box:
             >>> box = freud.Box.cube(10)
             >>> points = [[-1, -1, 0], [-1, 1, 0], [2, 0, 0]]
             >>> box.center(points)
-            array([[-0.8154068, -1.0000002,  0.       ],
-                   [-0.8154068,  1.       ,  0.       ],
+            array([[-0.8154063, -1.       ,  0.       ],
+                   [-0.8154063,  1.       ,  0.       ],
                    [ 2.1845937,  0.       ,  0.       ]], dtype=float32)
 
         Args:
@@ -516,6 +628,15 @@ cdef class Box:
             points (:math:`\left(N_{points}, 3 \right)` :class:`numpy.ndarray`):
                 Array of points with same length as ``query_points``.
 
+        .. note::
+
+            The returned array holds :math:`N_{query\_points} N_{points}`
+            distances. When only a reduction of the distances is needed, the
+            methods :meth:`~.compute_min_distances`,
+            :meth:`~.count_distances`, and
+            :meth:`~.compute_distance_histogram` compute it in parallel tiles
+            without storing the distance matrix.
+
         Returns:
             :math:`\left(N_{query\_points}, N_{points}, \right)` :class:`numpy.ndarray`:
                 Array of distances between query points and points.
@@ -540,6 +661,138 @@ cdef class Box:
 
         return np.asarray(distances)
 
+    def compute_min_distances(self, query_points, points):
+        R"""Calculate the distance from each query point to its nearest point, using periodic boundaries.
+
+        This computes the minimum and argmin of each row of
+        :meth:`~.compute_all_distances` without storing the full distance
+        matrix, using memory proportional to :math:`N_{query\_points}`.
+
+        Args:
+            query_points (:math:`\left(N_{query\_points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of query points.
+            points (:math:`\left(N_{points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of points.
+
+        Returns:
+            tuple(:math:`\left(N_{query\_points}, \right)` :class:`numpy.ndarray`, :math:`\left(N_{query\_points}, \right)` :class:`numpy.ndarray`):
+                The distance from each query point to its nearest point, and
+                the index of that point (the smallest index in case of ties).
+        """  # noqa: E501
+        query_points = freud.util._convert_array(
+            np.atleast_2d(query_points), shape=(None, 3))
+        points = freud.util._convert_array(
+            np.atleast_2d(points), shape=(None, 3))
+
+        cdef:
+            const float[:, ::1] l_query_points = query_points
+            const float[:, ::1] l_points = points
+            unsigned int n_query_points = query_points.shape[0]
+            unsigned int n_points = points.shape[0]
+            float[::1] distances = np.empty(n_query_points, dtype=np.float32)
+            unsigned int[::1] indices = np.empty(
+                n_query_points, dtype=np.uint32)
+
+        if n_points == 0:
+            raise ValueError("At least one point is required.")
+        if n_query_points > 0:
+            with nogil:
+                self.thisptr.computeMinDistances(
+                    <vec3[float]*> &l_query_points[0, 0], n_query_points,
+                    <vec3[float]*> &l_points[0, 0], n_points,
+                    &distances[0], &indices[0])
+        return np.asarray(distances), np.asarray(indices)
+
+    def count_distances(self, query_points, points, r_max):
+        R"""Count the points within a distance of each query point, using periodic boundaries.
+
+        This counts the entries of each row of :meth:`~.compute_all_distances`
+        that are less than :code:`r_max` without storing the full distance
+        matrix, using memory proportional to :math:`N_{query\_points}`.
+
+        Args:
+            query_points (:math:`\left(N_{query\_points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of query points.
+            points (:math:`\left(N_{points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of points.
+            r_max (float):
+                Cutoff distance. Points at distances less than :code:`r_max`
+                are counted.
+
+        Returns:
+            :math:`\left(N_{query\_points}, \right)` :class:`numpy.ndarray`:
+                Number of points within :code:`r_max` of each query point.
+        """  # noqa: E501
+        query_points = freud.util._convert_array(
+            np.atleast_2d(query_points), shape=(None, 3))
+        points = freud.util._convert_array(
+            np.atleast_2d(points), shape=(None, 3))
+
+        cdef:
+            const float[:, ::1] l_query_points = query_points
+            const float[:, ::1] l_points = points
+            unsigned int n_query_points = query_points.shape[0]
+            unsigned int n_points = points.shape[0]
+            float l_r_max = r_max
+            unsigned int[::1] counts = np.zeros(
+                n_query_points, dtype=np.uint32)
+
+        if n_query_points > 0 and n_points > 0:
+            with nogil:
+                self.thisptr.countDistances(
+                    <vec3[float]*> &l_query_points[0, 0], n_query_points,
+                    <vec3[float]*> &l_points[0, 0], n_points, l_r_max,
+                    &counts[0])
+        return np.asarray(counts)
+
+    def compute_distance_histogram(self, query_points, points, bins, r_max):
+        R"""Calculate a histogram of the distances between all pairs of query points and points, using periodic boundaries.
+
+        This histograms all entries of :meth:`~.compute_all_distances`
+        without storing the full distance matrix, using memory proportional
+        to the number of bins per thread.
+
+        Args:
+            query_points (:math:`\left(N_{query\_points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of query points.
+            points (:math:`\left(N_{points}, 3 \right)` :class:`numpy.ndarray`):
+                Array of points.
+            bins (unsigned int):
+                Number of bins, evenly spaced between 0 and :code:`r_max`.
+            r_max (float):
+                Upper edge of the last bin. Pairs at distances of
+                :code:`r_max` or more are not counted.
+
+        Returns:
+            :math:`\left(N_{bins}, \right)` :class:`numpy.ndarray`:
+                Number of pairs in each bin.
+        """  # noqa: E501
+        query_points = freud.util._convert_array(
+            np.atleast_2d(query_points), shape=(None, 3))
+        points = freud.util._convert_array(
+            np.atleast_2d(points), shape=(None, 3))
+
+        cdef:
+            const float[:, ::1] l_query_points = query_points
+            const float[:, ::1] l_points = points
+            unsigned int n_query_points = query_points.shape[0]
+            unsigned int n_points = points.shape[0]
+            unsigned int l_bins = bins
+            float l_r_max = r_max
+            vec3[float]* l_query_points_ptr = NULL
+            vec3[float]* l_points_ptr = NULL
+            uint64_t[::1] histogram = np.zeros(max(l_bins, 1), dtype=np.uint64)
+
+        if n_query_points > 0:
+            l_query_points_ptr = <vec3[float]*> &l_query_points[0, 0]
+        if n_points > 0:
+            l_points_ptr = <vec3[float]*> &l_points[0, 0]
+        with nogil:
+            self.thisptr.computeDistanceHistogram(
+                l_query_points_ptr, n_query_points, l_points_ptr, n_points,
+                l_bins, l_r_max, &histogram[0])
+        return np.asarray(histogram)
+
     def contains(self, points):
         R"""Returns boolean array (mask) corresponding to point membership in a box.
 
@@ -895,6 +1148,95 @@ cdef class Box:
         return cls(Lx=L, Ly=L, Lz=0, xy=0, xz=0, yz=0, is2D=True)
 
 
+cdef enum _FrameOperation:
+    _MAKE_ABSOLUTE
+    _MAKE_FRACTIONAL
+    _GET_IMAGES
+    _WRAP
+    _UNWRAP
+
+
+cdef _transform_frames(Box box, _FrameOperation operation, vecs, imgs, out,
+                       boxes):
+    R"""Apply a box operation to an :math:`\left(N_{frames}, N, 3\right)`
+    array of vectors, using one box per frame.
+
+    All frames are processed by a single parallel C++ loop. If boxes is None,
+    the given box is used for every frame.
+    """
+    if np.ndim(vecs) != 3:
+        raise ValueError(
+            "boxes may only be given with an (N_frames, N, 3) array of "
+            "vectors.")
+    vecs = freud.util._convert_array(vecs, shape=(None, None, 3))
+    cdef unsigned int n_frames = vecs.shape[0]
+    cdef unsigned int Np = vecs.shape[1]
+
+    cdef vector[freud._box.Box] frame_boxes
+    if boxes is None:
+        frame_boxes.assign(n_frames, dereference(box.thisptr))
+    else:
+        if len(boxes) != n_frames:
+            raise ValueError(
+                "The number of boxes must match the number of frames.")
+        for frame_box in boxes:
+            frame_box = freud.util._convert_box(
+                frame_box, dimensions=box.dimensions)
+            frame_boxes.push_back(dereference((<Box> frame_box).thisptr))
+
+    if operation == _GET_IMAGES:
+        out = freud.util._convert_array(
+            out, shape=vecs.shape, dtype=np.int32, allow_copy=False)
+    else:
+        out = freud.util._convert_array(
+            out, shape=vecs.shape, allow_copy=False)
+    if operation == _UNWRAP:
+        imgs = freud.util._convert_array(
+            np.broadcast_to(imgs, vecs.shape), shape=vecs.shape,
+            dtype=np.int32)
+    if n_frames == 0 or Np == 0:
+        return out
+
+    cdef const freud._box.Box * l_boxes = frame_boxes.data()
+    cdef const float[:, :, ::1] l_points = vecs
+    cdef const vec3[float] * l_points_ptr = \
+        <const vec3[float]*> &l_points[0, 0, 0]
+    cdef float[:, :, ::1] l_out
+    cdef int[:, :, ::1] l_images_out
+    cdef const int[:, :, ::1] l_imgs
+
+    if operation == _GET_IMAGES:
+        l_images_out = out
+        with nogil:
+            freud._box.getImagesFrames(
+                l_boxes, n_frames, l_points_ptr, Np,
+                <vec3[int]*> &l_images_out[0, 0, 0])
+        return out
+
+    l_out = out
+    if operation == _UNWRAP:
+        l_imgs = imgs
+    with nogil:
+        if operation == _MAKE_ABSOLUTE:
+            freud._box.makeAbsoluteFrames(
+                l_boxes, n_frames, l_points_ptr, Np,
+                <vec3[float]*> &l_out[0, 0, 0])
+        elif operation == _MAKE_FRACTIONAL:
+            freud._box.makeFractionalFrames(
+                l_boxes, n_frames, l_points_ptr, Np,
+                <vec3[float]*> &l_out[0, 0, 0])
+        elif operation == _WRAP:
+            freud._box.wrapFrames(
+                l_boxes, n_frames, l_points_ptr, Np,
+                <vec3[float]*> &l_out[0, 0, 0])
+        elif operation == _UNWRAP:
+            freud._box.unwrapFrames(
+                l_boxes, n_frames, l_points_ptr,
+                <const vec3[int]*> &l_imgs[0, 0, 0], Np,
+                <vec3[float]*> &l_out[0, 0, 0])
+    return out
+
+
 cdef BoxFromCPP(const freud._box.Box & cppbox):
     b = Box(cppbox.getLx(), cppbox.getLy(), cppbox.getLz(),
             cppbox.getTiltFactorXY(), cppbox.getTiltFactorXZ(),
@@ -45,7 +45,7 @@ cdef class Cluster(_PairCompute):
     the :code:`cluster_idx` array. Given a key value per point (e.g. the
     polymer id), the compute function will process clusters with the key values
     in mind and provide a list of keys that are present in each cluster in the
-    attribute :code:`cluster_keys`, as a list of lists. If keys are not
+    attribute :code:`cluster_keys`, as a list of arrays. If keys are not
     provided, every point is assigned a key corresponding to its index, and
     :code:`cluster_keys` contains the point ids present in each cluster.
     """
@@ -116,10 +116,35 @@ cdef class Cluster(_PairCompute):
 
     @_Compute._computed_property
     def cluster_keys(self):
-        """list(list): A list of lists of the keys contained in each
-        cluster."""
-        cluster_keys = self.thisptr.getClusterKeys()
-        return cluster_keys
+        """list(:class:`numpy.ndarray`): A list of the keys contained in each
+        cluster. The arrays are views of :attr:`cluster_key_values` and do not
+        copy the keys, but one array is created for every cluster. For systems
+        with many clusters, :attr:`cluster_key_values` and
+        :attr:`cluster_key_offsets` provide the same keys without creating any
+        per-cluster arrays."""
+        if self.num_clusters == 0:
+            return []
+        offsets = self.cluster_key_offsets
+        return np.split(self.cluster_key_values, offsets[1:len(offsets) - 1])
+
+    @_Compute._computed_property
+    def cluster_key_values(self):
+        """(:math:`N_{points}`) :class:`numpy.ndarray`: The keys of all
+        clusters, stored cluster by cluster in order of increasing point index
+        within each cluster. The keys of cluster :math:`i` are
+        :code:`cluster_key_values[cluster_key_offsets[i]:cluster_key_offsets[i + 1]]`."""  # noqa: E501
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getClusterKeys(),
+            freud.util.arr_type_t.UNSIGNED_INT)
+
+    @_Compute._computed_property
+    def cluster_key_offsets(self):
+        """(:math:`N_{clusters} + 1`) :class:`numpy.ndarray`: The offset of
+        the first key of each cluster in :attr:`cluster_key_values`, followed
+        by the total number of keys."""
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getClusterKeyOffsets(),
+            freud.util.arr_type_t.SIZE_T)
 
     def __repr__(self):
         return "freud.cluster.{cls}()".format(cls=type(self).__name__)
@@ -57,7 +57,7 @@ cdef class _QueryArgs:
     cdef freud._locality.QueryArgs * thisptr
 
 cdef class _PairCompute(_Compute):
-    pass
+    cdef NeighborQuery _nq
 
 cdef class _SpatialHistogram(_PairCompute):
     cdef float r_max
@@ -73,3 +73,7 @@ cdef class Voronoi(_Compute):
     cdef freud._locality.Voronoi * thisptr
     cdef NeighborList _nlist
     cdef freud.box.Box _box
+
+cdef class VerletList(_Compute):
+    cdef freud._locality.VerletList * thisptr
+    cdef NeighborList _nlist
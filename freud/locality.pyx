@@ -6,6 +6,7 @@ The :mod:`freud.locality` module contains data structures to efficiently
 locate points based on their proximity to other points.
 """
 import inspect
+import os
 
 import numpy as np
 
@@ -16,6 +17,7 @@ cimport numpy as np
 from cython.operator cimport dereference
 from libcpp cimport bool as cbool
 from libcpp.memory cimport shared_ptr
+from libcpp.string cimport string
 from libcpp.vector cimport vector
 
 cimport freud._locality
@@ -39,7 +41,7 @@ cdef class _QueryArgs:
 
     def __cinit__(self, mode=None, r_min=None, r_max=None, r_guess=None,
                   num_neighbors=None, exclude_ii=None,
-                  scale=None, **kwargs):
+                  scale=None, half=None, vectors=None, **kwargs):
         if type(self) == _QueryArgs:
             self.thisptr = new freud._locality.QueryArgs()
             self.mode = mode
@@ -55,6 +57,10 @@ cdef class _QueryArgs:
                 self.exclude_ii = exclude_ii
             if scale is not None:
                 self.scale = scale
+            if half is not None:
+                self.half = half
+            if vectors is not None:
+                self.vectors = vectors
             if len(kwargs):
                 err_str = ", ".join(
                     "{} = {}".format(k, v) for k, v in kwargs.items())
@@ -151,15 +157,32 @@ cdef class _QueryArgs:
     def scale(self, value):
         self.thisptr.scale = value
 
+    @property
+    def half(self):
+        return self.thisptr.half
+
+    @half.setter
+    def half(self, value):
+        self.thisptr.half = value
+
+    @property
+    def vectors(self):
+        return self.thisptr.vectors
+
+    @vectors.setter
+    def vectors(self, value):
+        self.thisptr.vectors = value
+
     def __repr__(self):
         return ("freud.locality.{cls}(mode={mode}, r_max={r_max}, "
                 "num_neighbors={num_neighbors}, exclude_ii={exclude_ii}, "
-                "scale={scale})").format(
+                "scale={scale}, half={half}, vectors={vectors})").format(
                     cls=type(self).__name__,
                     mode=self.mode, r_max=self.r_max,
                     num_neighbors=self.num_neighbors,
                     exclude_ii=self.exclude_ii,
-                    scale=self.scale)
+                    scale=self.scale, half=self.half,
+                    vectors=self.vectors)
 
     def __str__(self):
         return repr(self)
@@ -200,7 +223,7 @@ cdef class NeighborQueryResult:
 
         raise StopIteration
 
-    def toNeighborList(self, sort_by_distance=False):
+    def toNeighborList(self, sort_by_distance=False, count_first=False):
         """Convert query result to a freud :class:`~NeighborList`.
 
         Args:
@@ -208,6 +231,15 @@ cdef class NeighborQueryResult:
                 If :code:`True`, sort neighboring bonds by distance.
                 If :code:`False`, sort neighboring bonds by point index
                 (Default value = :code:`False`).
+            count_first (bool):
+                If :code:`True`, run the query twice, first counting the
+                neighbors of each query point and then writing bonds directly
+                into the final neighbor list. This lowers peak memory usage
+                and avoids a global sort of all bonds, which is beneficial
+                for queries producing very large numbers of bonds. The
+                resulting neighbor list is compressed (see
+                :meth:`NeighborList.compress`) (Default value =
+                :code:`False`).
 
         Returns:
             :class:`~NeighborList`: A :class:`~NeighborList` containing all
@@ -220,8 +252,12 @@ cdef class NeighborQueryResult:
                 self.points.shape[0],
                 dereference(self.query_args.thisptr))
 
-        cdef freud._locality.NeighborList *cnlist = dereference(
-            iterator).toNeighborList(sort_by_distance)
+        cdef cbool l_sort_by_distance = sort_by_distance
+        cdef cbool l_count_first = count_first
+        cdef freud._locality.NeighborList *cnlist
+        with nogil:
+            cnlist = dereference(iterator).toNeighborList(
+                l_sort_by_distance, l_count_first)
         cdef NeighborList nl = _nlist_from_cnlist(cnlist)
         # Explicitly manage a manually created nlist so that it will be
         # deleted when the Python object is.
@@ -229,6 +265,72 @@ cdef class NeighborQueryResult:
 
         return nl
 
+    def to_arrays(self, sort_by_distance=False, vectors=False):
+        R"""Find all neighbors of the query and return them as arrays.
+
+        Like :meth:`toNeighborList` with :code:`count_first=True`, the query
+        is run twice: the first pass counts the neighbors of each query point,
+        and the second pass writes bonds directly into arrays of the final
+        size. Both passes run without holding the GIL, and no
+        :class:`~NeighborList` or Python object per bond is created, making
+        this the most efficient way to pass neighbors to other array-based
+        code.
+
+        Args:
+            sort_by_distance (bool):
+                If :code:`True`, sort the bonds of each query point by
+                distance. If :code:`False`, sort them by point index
+                (Default value = :code:`False`).
+            vectors (bool):
+                If :code:`True`, also return the bond vectors pointing from
+                each query point to its neighbor, wrapped into the box
+                (Default value = :code:`False`).
+
+        Returns:
+            tuple of :class:`numpy.ndarray`:
+                The query point indices (:math:`N_{bonds}`), point indices
+                (:math:`N_{bonds}`), and distances (:math:`N_{bonds}`) of all
+                bonds, sorted by query point index, followed by the bond
+                vectors (:math:`N_{bonds}`, 3) if :code:`vectors` is
+                :code:`True`.
+        """
+        cdef const float[:, ::1] l_points = self.points
+        cdef shared_ptr[freud._locality.NeighborQueryIterator] iterator = \
+            self.nq.nqptr.query(
+                <vec3[float]*> &l_points[0, 0],
+                self.points.shape[0],
+                dereference(self.query_args.thisptr))
+
+        cdef vector[size_t] offsets = vector[size_t](self.points.shape[0] + 1)
+        with nogil:
+            dereference(iterator).countNeighbors(offsets.data())
+        cdef size_t num_bonds = offsets.back()
+
+        query_point_indices = np.empty(num_bonds, dtype=np.uint32)
+        point_indices = np.empty(num_bonds, dtype=np.uint32)
+        distances = np.empty(num_bonds, dtype=np.float32)
+        bond_vectors = np.empty((num_bonds if vectors else 0, 3),
+                                dtype=np.float32)
+
+        cdef unsigned int[::1] l_query_point_indices = query_point_indices
+        cdef unsigned int[::1] l_point_indices = point_indices
+        cdef float[::1] l_distances = distances
+        cdef float[:, ::1] l_vectors = bond_vectors
+        cdef cbool c_sort_by_distance = sort_by_distance
+        cdef vec3[float]* vectors_ptr = NULL
+        if num_bonds > 0:
+            if vectors:
+                vectors_ptr = <vec3[float]*> &l_vectors[0, 0]
+            with nogil:
+                dereference(iterator).fillNeighbors(
+                    offsets.data(), &l_query_point_indices[0],
+                    &l_point_indices[0], &l_distances[0], vectors_ptr,
+                    c_sort_by_distance)
+
+        if vectors:
+            return query_point_indices, point_indices, distances, bond_vectors
+        return query_point_indices, point_indices, distances
+
 
 cdef class NeighborQuery:
     R"""Class representing a set of points along with the ability to query for
@@ -297,6 +399,16 @@ cdef class NeighborQuery:
                 not provided, but in some cases inference is not possible, in
                 which case it will default to 3 (Default value = None).
 
+        Systems that are not already a :class:`~.NeighborQuery` are wrapped
+        in an object that builds a spatial data structure when first
+        queried. Ball queries of systems dense enough that a cell of width
+        :code:`r_max` holds at least two points on average use a
+        :class:`~.LinkCell` with :code:`cell_width` equal to :code:`r_max`,
+        while all other queries use an :class:`~.AABBQuery`. The
+        :code:`structure` and :code:`build_time` attributes of the returned
+        object report which structure was used by the most recent query and
+        how many seconds it took to build.
+
         Returns:
             :class:`freud.locality.NeighborQuery`:
                 The same :class:`~.NeighborQuery` object if one is given, or an
@@ -445,7 +557,8 @@ cdef class NeighborList:
     index :math:`j`. The first bond index corresponding to a given query point
     can be found in :math:`\log(N_{bonds})` time using
     :meth:`find_first_index`, because bonds are ordered by the query point
-    index.
+    index. Neighbor lists stored in compressed form (see :meth:`compress`)
+    find the first bond index in constant time.
 
     .. note::
 
@@ -476,7 +589,7 @@ cdef class NeighborList:
 
     @classmethod
     def from_arrays(cls, num_query_points, num_points, query_point_indices,
-                    point_indices, distances, weights=None):
+                    point_indices, distances, weights=None, vectors=None):
         R"""Create a NeighborList from a set of bond information arrays.
 
         Example::
@@ -514,7 +627,12 @@ cdef class NeighborList:
                 points.
             weights (:class:`np.ndarray`, optional):
                 Array of per-bond weights (if :code:`None` is given, use a
-                value of 1 for each weight) (Default value = :code:`None`).
+                value of 1 for each weight without storing a weights array)
+                (Default value = :code:`None`).
+            vectors ((:math:`N_{bonds}`, 3) :class:`np.ndarray`, optional):
+                Array of bond vectors pointing from each query point to its
+                neighbor, wrapped into the box (if :code:`None` is given, no
+                vectors are stored) (Default value = :code:`None`).
         """  # noqa 501
         query_point_indices = freud.util._convert_array(
             query_point_indices, shape=(None,), dtype=np.uint32)
@@ -524,25 +642,38 @@ cdef class NeighborList:
         distances = freud.util._convert_array(
             distances, shape=query_point_indices.shape)
 
-        if weights is None:
-            weights = np.ones(query_point_indices.shape, dtype=np.float32)
-        weights = freud.util._convert_array(
-            weights, shape=query_point_indices.shape)
-
         cdef const unsigned int[::1] l_query_point_indices = \
             query_point_indices
         cdef const unsigned int[::1] l_point_indices = point_indices
         cdef const float[::1] l_distances = distances
-        cdef const float[::1] l_weights = weights
-        cdef unsigned int l_num_bonds = l_query_point_indices.shape[0]
+        cdef const float[::1] l_weights
+        cdef const float *l_weights_ptr = NULL
+        cdef const float[:, ::1] l_vectors
+        cdef const vec3[float] *l_vectors_ptr = NULL
+        cdef size_t l_num_bonds = l_query_point_indices.shape[0]
         cdef unsigned int l_num_query_points = num_query_points
         cdef unsigned int l_num_points = num_points
 
+        # Without weights, the C++ NeighborList does not store a weights
+        # array and treats every bond as having unit weight.
+        if weights is not None:
+            weights = freud.util._convert_array(
+                weights, shape=query_point_indices.shape)
+            l_weights = weights
+            l_weights_ptr = &l_weights[0]
+
+        if vectors is not None:
+            vectors = freud.util._convert_array(
+                vectors, shape=(query_point_indices.shape[0], 3))
+            l_vectors = vectors
+            l_vectors_ptr = <const vec3[float]*> &l_vectors[0, 0]
+
         cdef NeighborList result
         result = cls()
         result.thisptr = new freud._locality.NeighborList(
             l_num_bonds, &l_query_point_indices[0], l_num_query_points,
-            &l_point_indices[0], l_num_points, &l_distances[0], &l_weights[0])
+            &l_point_indices[0], l_num_points, &l_distances[0], l_weights_ptr,
+            l_vectors_ptr)
 
         return result
 
@@ -586,10 +717,23 @@ cdef class NeighborList:
             return new_copy
 
     def __getitem__(self, key):
-        R"""Access the bond array by index or slice."""
-        return freud.util.make_managed_numpy_array(
-            &self.thisptr.getNeighbors(),
-            freud.util.arr_type_t.UNSIGNED_INT)[key]
+        R"""Access the bond array by index or slice.
+
+        The bonds are stored as separate arrays of query point indices and
+        point indices, so the selected bonds are returned as a new array of
+        dtype ``np.uint32`` rather than as a view into the neighbor list.
+        Use :attr:`query_point_indices` and :attr:`point_indices` to access
+        the bonds without copying them."""
+        # Index the columns before stacking them so that only the selected
+        # bonds are copied.
+        if isinstance(key, tuple):
+            row_key, column_key = key[0], key[1:]
+        else:
+            row_key, column_key = key, ()
+        bonds = np.stack(
+            (self.query_point_indices[row_key], self.point_indices[row_key]),
+            axis=-1)
+        return bonds[(Ellipsis,) + column_key] if column_key else bonds
 
     @property
     def query_point_indices(self):
@@ -597,7 +741,9 @@ cdef class NeighborList:
         each bond. This array is read-only to prevent breakage of
         :meth:`~.find_first_index()`. Equivalent to indexing with
         :code:`[:, 0]`."""
-        return self[:, 0]
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getQueryPointIndices(),
+            freud.util.arr_type_t.UNSIGNED_INT)
 
     @property
     def point_indices(self):
@@ -605,16 +751,67 @@ cdef class NeighborList:
         bond. This array is read-only to prevent breakage of
         :meth:`~.find_first_index()`. Equivalent to indexing with :code:`[:,
         1]`."""
-        return self[:, 1]
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getPointIndices(),
+            freud.util.arr_type_t.UNSIGNED_INT)
 
     @property
     def weights(self):
         """(:math:`N_{bonds}`) :class:`np.ndarray`: The weights for each bond.
-        By default, bonds have a weight of 1."""
+        By default, bonds have a weight of 1. Neighbor lists in which all bonds
+        have unit weight do not store weights until this array is accessed
+        (see :attr:`has_weights`)."""
         return freud.util.make_managed_numpy_array(
             &self.thisptr.getWeights(),
             freud.util.arr_type_t.FLOAT)
 
+    @property
+    def is_compressed(self):
+        """bool: Whether this neighbor list is stored in compressed form (see
+        :meth:`compress`)."""
+        return self.thisptr.isCompressed()
+
+    def compress(self):
+        R"""Store this neighbor list in compressed sparse row form.
+
+        A compressed neighbor list stores the offset of the first bond of each
+        query point instead of the query point index of every bond, saving 4
+        bytes per bond and making :meth:`find_first_index` a constant-time
+        lookup. The :attr:`query_point_indices` array is reconstructed and
+        cached when it is accessed.
+
+        .. note:: This method modifies this object in-place.
+        """
+        self.thisptr.compress()
+        return self
+
+    @property
+    def has_weights(self):
+        """bool: Whether this neighbor list stores an array of per-bond
+        weights. Neighbor lists generated by queries, or created by
+        :meth:`from_arrays` without weights, give every bond a weight of 1
+        without storing a weights array."""
+        return self.thisptr.hasWeights()
+
+    @property
+    def has_vectors(self):
+        """bool: Whether this neighbor list stores an array of per-bond
+        vectors. Neighbor lists generated by queries only store vectors if
+        the :code:`vectors` query argument is :code:`True`."""
+        return self.thisptr.hasVectors()
+
+    @property
+    def vectors(self):
+        """(:math:`N_{bonds}`, 3) :class:`np.ndarray`: The vectors pointing
+        from each query point to its neighbor, wrapped into the box. Only
+        available if :attr:`has_vectors` is :code:`True`."""
+        if not self.thisptr.hasVectors():
+            raise ValueError(
+                "This NeighborList does not store bond vectors.")
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getVectors(),
+            freud.util.arr_type_t.FLOAT, 3)
+
     @property
     def distances(self):
         """(:math:`N_{bonds}`) :class:`np.ndarray`: The distances for each
@@ -626,10 +823,13 @@ cdef class NeighborList:
     @property
     def segments(self):
         """(:math:`N_{query\\_points}`) :class:`np.ndarray`: A segment array
-        indicating the first bond index for each query point."""
+        indicating the first bond index for each query point, or 0 for query
+        points without bonds. The array has
+        dtype ``np.intp`` so that it can index lists with more than
+        :math:`2^{32}` bonds."""
         return freud.util.make_managed_numpy_array(
             &self.thisptr.getSegments(),
-            freud.util.arr_type_t.UNSIGNED_INT)
+            freud.util.arr_type_t.SIZE_T)
 
     @property
     def neighbor_counts(self):
@@ -702,6 +902,83 @@ cdef class NeighborList:
         self.thisptr.filter_r(r_max, r_min)
         return self
 
+    def save(self, path):
+        R"""Write this neighbor list to a binary file.
+
+        The file can be read with :meth:`load`. Bonds are always written in
+        compressed sparse row form (see :meth:`compress`), using the native
+        byte order. The file starts with a 64 byte header:
+
+        ====== ======= ================= ===================================
+        Offset Type    Field             Description
+        ====== ======= ================= ===================================
+        0      char[8] magic             :code:`b"FREUDNL\0"`
+        8      uint32  version           File format version, currently 1
+        12     uint32  byte_order        :code:`0x01020304` in native order
+        16     uint32  flags             Bit 0: weights are stored, bit 1:
+                                         vectors are stored
+        20     uint32  num_query_points  :math:`N_{query\_points}`
+        24     uint32  num_points        :math:`N_{points}`
+        28     uint32  reserved          Zero
+        32     uint64  num_bonds         :math:`N_{bonds}`
+        40     uint8   padding           Zeros up to byte 64
+        ====== ======= ================= ===================================
+
+        The header is followed by these arrays, each starting at the next
+        multiple of 64 bytes after the end of the previous one:
+
+        1. :code:`uint64[num_query_points + 1]`: offsets, such that the bonds
+           of query point :math:`i` are :code:`offsets[i]` to
+           :code:`offsets[i + 1] - 1` (the :attr:`segments` followed by
+           :math:`N_{bonds}`).
+        2. :code:`uint32[num_bonds]`: :attr:`point_indices`.
+        3. :code:`float32[num_bonds]`: :attr:`distances`.
+        4. :code:`float32[num_bonds]`: :attr:`weights`, only if flag bit 0 is
+           set.
+        5. :code:`float32[num_bonds, 3]`: :attr:`vectors`, only if flag bit 1
+           is set.
+
+        Args:
+            path (str or path-like):
+                Path of the file to write.
+        """
+        cdef string c_path = os.fsencode(path)
+        with nogil:
+            self.thisptr.save(c_path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        R"""Read a neighbor list written by :meth:`save`.
+
+        The loaded neighbor list is compressed (see :meth:`compress`). With
+        :code:`mmap=True`, the file is memory mapped copy-on-write and the
+        arrays of the neighbor list, as well as the NumPy arrays returned by
+        its properties, refer directly to the mapped memory without copying
+        it. Only the parts of the file that are accessed are read from disk,
+        and the file is unmapped once no array refers to it. Memory mapping is
+        not supported on Windows, where the file is always read.
+
+        The header and offsets of the file are always validated. The point
+        indices are only checked against :code:`num_points` when the file is
+        read, since checking them would read all of a memory mapped file.
+
+        Args:
+            path (str or path-like):
+                Path of the file to read.
+            mmap (bool, optional):
+                Whether to memory map the file instead of reading it into
+                newly allocated arrays (Default value = :code:`True`).
+
+        Returns:
+            :class:`freud.locality.NeighborList`: The loaded neighbor list.
+        """
+        cdef string c_path = os.fsencode(path)
+        cdef cbool c_mmap = mmap
+        cdef NeighborList result = cls()
+        with nogil:
+            result.thisptr.load(c_path, c_mmap)
+        return result
+
 
 cdef NeighborList _nlist_from_cnlist(freud._locality.NeighborList *c_nlist):
     """Create a Python NeighborList object that points to an existing C++
@@ -798,21 +1075,37 @@ cdef class _RawPoints(NeighborQuery):
 
     def __cinit__(self, box, points):
         cdef const float[:, ::1] l_points
+        cdef const vec3[float]* points_ptr
+        cdef unsigned int n_points
         cdef freud.box.Box b
         if type(self) is _RawPoints:
             # Assume valid set of arguments is passed
             b = freud.util._convert_box(box)
             self.points = freud.util._convert_array(points, shape=(None, 3))
             l_points = self.points
-            self.thisptr = self.nqptr = new freud._locality.RawPoints(
-                dereference(b.thisptr),
-                <vec3[float]*> &l_points[0, 0],
-                self.points.shape[0])
+            points_ptr = <vec3[float]*> &l_points[0, 0]
+            n_points = l_points.shape[0]
+            with nogil:
+                self.thisptr = self.nqptr = new freud._locality.RawPoints(
+                    dereference(b.thisptr), points_ptr, n_points)
 
     def __dealloc__(self):
         if type(self) is _RawPoints:
             del self.thisptr
 
+    @property
+    def structure(self):
+        """str: Name of the class of the spatial data structure used for the
+        most recent query, or :code:`None` if no query has been run."""
+        name = self.thisptr.getStructureName().decode('utf-8')
+        return name if name else None
+
+    @property
+    def build_time(self):
+        """float: Time in seconds taken to build the spatial data structure
+        used for the most recent query."""
+        return self.thisptr.getBuildTime()
+
 
 cdef class AABBQuery(NeighborQuery):
     R"""Use an Axis-Aligned Bounding Box (AABB) tree :cite:`howard2016` to
@@ -825,10 +1118,19 @@ cdef class AABBQuery(NeighborQuery):
             Simulation box.
         points ((:math:`N`, 3) :class:`numpy.ndarray`):
             The points to use to build the tree.
+        reorder (bool, optional):
+            If :code:`True`, build the tree from a copy of the points sorted
+            along a space-filling (Morton) curve, so that points close in
+            space are close in memory. This speeds up queries of points in
+            arbitrary order, at the cost of sorting and copying the points.
+            Query results and computes always use the original point indices
+            (Default value = :code:`False`).
     """
 
-    def __cinit__(self, box, points):
+    def __cinit__(self, box, points, cbool reorder=False):
         cdef const float[:, ::1] l_points
+        cdef const vec3[float]* points_ptr
+        cdef unsigned int n_points
         cdef freud.box.Box b
         if type(self) is AABBQuery:
             # Assume valid set of arguments is passed
@@ -836,15 +1138,55 @@ cdef class AABBQuery(NeighborQuery):
             self.points = freud.util._convert_array(
                 points, shape=(None, 3)).copy()
             l_points = self.points
-            self.thisptr = self.nqptr = new freud._locality.AABBQuery(
-                dereference(b.thisptr),
-                <vec3[float]*> &l_points[0, 0],
-                self.points.shape[0])
+            points_ptr = <vec3[float]*> &l_points[0, 0]
+            n_points = l_points.shape[0]
+            with nogil:
+                self.thisptr = self.nqptr = new freud._locality.AABBQuery(
+                    dereference(b.thisptr), points_ptr, n_points, reorder)
 
     def __dealloc__(self):
         if type(self) is AABBQuery:
             del self.thisptr
 
+    def update(self, points, rebuild_threshold=2.0):
+        R"""Update the tree with new positions of the same points.
+
+        Rather than building a new tree, the existing tree is refit to the new
+        positions, which is much faster when points have only moved slightly
+        (e.g. between consecutive frames of a trajectory). The tree topology
+        is kept, so its quality degrades as points move further from the
+        positions it was built with. When the total surface area of the refit
+        tree exceeds :code:`rebuild_threshold` times that of the last full
+        build, the tree is rebuilt from scratch.
+
+        The box is not changed by this method.
+
+        Example::
+
+            aq = freud.locality.AABBQuery(box, frames[0])
+            for points in frames:
+                aq.update(points)
+                nlist = aq.query(points, {'r_max': 1.5}).toNeighborList()
+
+        Args:
+            points ((:math:`N`, 3) :class:`numpy.ndarray`):
+                The new point coordinates. The number of points must be the
+                same as the number used to build the tree.
+            rebuild_threshold (float, optional):
+                Maximum allowed ratio of the refit tree's cost to the cost of
+                the last fully built tree before the tree is rebuilt. Use
+                :code:`numpy.inf` to never rebuild (Default value = 2.0).
+        """
+        points = freud.util._convert_array(
+            points, shape=(self.points.shape[0], 3)).copy()
+        cdef const float[:, ::1] l_points = points
+        cdef const vec3[float]* points_ptr = <vec3[float]*> &l_points[0, 0]
+        cdef float threshold = rebuild_threshold
+        with nogil:
+            self.thisptr.update(points_ptr, threshold)
+        self.points = points
+        return self
+
 
 cdef class LinkCell(NeighborQuery):
     R"""Supports efficiently finding all points in a set within a certain
@@ -861,18 +1203,27 @@ cdef class LinkCell(NeighborQuery):
             Width of cells. If not provided, :class:`~.LinkCell` will
             estimate a cell width based on the number of points and the box
             size, assuming a constant density of points in the box.
+        reorder (bool, optional):
+            If :code:`True`, bin a copy of the points sorted along a
+            space-filling (Morton) curve, so that points close in space are
+            close in memory. This speeds up queries of points in arbitrary
+            order, at the cost of sorting and copying the points. Query
+            results and computes always use the original point indices
+            (Default value = :code:`False`).
     """
 
-    def __cinit__(self, box, points, cell_width=0):
+    def __cinit__(self, box, points, float cell_width=0, cbool reorder=False):
         cdef freud.box.Box b = freud.util._convert_box(box)
         cdef const float[:, ::1] l_points
         self.points = freud.util._convert_array(
             points, shape=(None, 3)).copy()
         l_points = self.points
-        self.thisptr = self.nqptr = new freud._locality.LinkCell(
-            dereference(b.thisptr),
-            <vec3[float]*> &l_points[0, 0],
-            self.points.shape[0], cell_width)
+        cdef const vec3[float]* points_ptr = <vec3[float]*> &l_points[0, 0]
+        cdef unsigned int n_points = l_points.shape[0]
+        with nogil:
+            self.thisptr = self.nqptr = new freud._locality.LinkCell(
+                dereference(b.thisptr), points_ptr, n_points, cell_width,
+                reorder)
 
     def __dealloc__(self):
         del self.thisptr
@@ -883,6 +1234,64 @@ cdef class LinkCell(NeighborQuery):
         return self.thisptr.getCellWidth()
 
 
+def build_many(systems, neighbor_query_type=AABBQuery, max_workers=None,
+               **kwargs):
+    R"""Build neighbor query objects for many systems concurrently.
+
+    Constructing an :class:`~.AABBQuery` or :class:`~.LinkCell` releases the
+    GIL, so structures for several frames of a trajectory can be built at
+    the same time from a pool of Python threads. The same applies to
+    structures constructed directly in user-managed threads, for example to
+    overlap reading the next frame with building the tree of the current
+    one.
+
+    Example::
+
+        >>> import freud
+        >>> frames = [freud.data.make_random_system(10, 100, seed=i)
+        ...           for i in range(4)]
+        >>> aqs = freud.locality.build_many(frames)
+        >>> len(aqs)
+        4
+
+    Args:
+        systems (iterable):
+            Systems to build structures for. Each system may be any object
+            that is a valid argument to
+            :meth:`freud.locality.NeighborQuery.from_system`.
+        neighbor_query_type (type, optional):
+            The :class:`~.NeighborQuery` subclass to construct, either
+            :class:`~.AABBQuery` or :class:`~.LinkCell`
+            (Default value = :class:`~.AABBQuery`).
+        max_workers (int, optional):
+            Maximum number of threads used to build structures. If
+            :code:`None`, the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` is used
+            (Default value = :code:`None`).
+        **kwargs:
+            Additional arguments passed to the constructor of
+            :code:`neighbor_query_type`, e.g. :code:`cell_width` for
+            :class:`~.LinkCell`.
+
+    Returns:
+        list[:class:`~.NeighborQuery`]: The constructed structures, in the
+        same order as :code:`systems`.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if neighbor_query_type not in (AABBQuery, LinkCell):
+        raise ValueError(
+            "neighbor_query_type must be freud.locality.AABBQuery or "
+            "freud.locality.LinkCell.")
+
+    def build(system):
+        nq = NeighborQuery.from_system(system)
+        return neighbor_query_type(nq.box, nq.points, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build, systems))
+
+
 cdef class _PairCompute(_Compute):
     R"""Parent class for all compute classes in freud that depend on finding
     nearest neighbors.
@@ -918,6 +1327,9 @@ cdef class _PairCompute(_Compute):
                 arguments to use to find bonds (Default value = :code:`None`).
         """  # noqa E501
         cdef NeighborQuery nq = NeighborQuery.from_system(system)
+        # Keep the system so that the structure it uses to find neighbors
+        # during the compute can be reported afterwards.
+        self._nq = nq
 
         # Resolve the two possible ways of passing neighbors (query arguments
         # or neighbor lists) based on the type of the neighbors argument.
@@ -962,6 +1374,29 @@ cdef class _PairCompute(_Compute):
         raise NotImplementedError(
             NO_DEFAULT_QUERY_ARGS_MESSAGE.format(type(self).__name__))
 
+    @property
+    def neighbor_query_structure(self):
+        """str: Name of the class of the spatial data structure used to find
+        neighbors in the most recent call to :code:`compute`, or :code:`None`
+        if no neighbors were queried. Systems that are not already a
+        :class:`~.NeighborQuery` choose their structure as described in
+        :meth:`~.NeighborQuery.from_system`."""
+        if self._nq is None:
+            return None
+        if isinstance(self._nq, _RawPoints):
+            return self._nq.structure
+        return type(self._nq).__name__
+
+    @property
+    def neighbor_query_build_time(self):
+        """float: Time in seconds taken to build the spatial data structure
+        reported by :attr:`neighbor_query_structure`, or :code:`None` if the
+        system passed to :code:`compute` was already a
+        :class:`~.NeighborQuery` or no neighbors were queried."""
+        if not isinstance(self._nq, _RawPoints) or self._nq.structure is None:
+            return None
+        return self._nq.build_time
+
 
 cdef class _SpatialHistogram(_PairCompute):
     R"""Parent class for all compute classes in freud that perform a spatial
@@ -1079,7 +1514,8 @@ cdef class PeriodicBuffer(_Compute):
     def __dealloc__(self):
         del self.thisptr
 
-    def compute(self, system, buffer, cbool images=False):
+    def compute(self, system, buffer, cbool images=False,
+                cbool include_points=True):
         R"""Compute the periodic buffer.
 
         Args:
@@ -1095,6 +1531,11 @@ cdef class PeriodicBuffer(_Compute):
                 each side, meaning that one image doubles the box side lengths,
                 two images triples the box side lengths, and so on.
                 (Default value = :code:`False`).
+            include_points (bool, optional):
+                If ``False``, only :attr:`buffer_ids` and
+                :attr:`buffer_images` are computed, and the buffer point
+                positions are not stored. Positions can be reconstructed from
+                these arrays when needed (Default value = :code:`True`).
         """
         cdef NeighborQuery nq = _make_default_nq(system)
         cdef vec3[float] buffer_vec
@@ -1106,21 +1547,45 @@ cdef class PeriodicBuffer(_Compute):
         else:
             raise ValueError('buffer must be a scalar or have length 3.')
 
-        self.thisptr.compute(nq.get_ptr(), buffer_vec, images)
+        cdef freud._locality.NeighborQuery* nq_ptr = nq.get_ptr()
+        with nogil:
+            self.thisptr.compute(nq_ptr, buffer_vec, images, include_points)
         return self
 
     @_Compute._computed_property
     def buffer_points(self):
         """:math:`\\left(N_{buffer}, 3\\right)` :class:`numpy.ndarray`: The
-        buffer point positions."""
-        points = self.thisptr.getBufferPoints()
-        return np.asarray([[p.x, p.y, p.z] for p in points])
+        buffer point positions.
+
+        These are only available if :meth:`compute` was called with
+        ``include_points=True``. Otherwise, the position of buffer point
+        ``i`` is that of point ``buffer_ids[i]`` shifted by the box lattice
+        vectors weighted by ``buffer_images[i]``, wrapped into
+        :attr:`buffer_box` if ``images=True``."""
+        if not self.thisptr.getIncludePoints():
+            raise ValueError(
+                "The buffer points were not stored. Call compute with "
+                "include_points=True to access them.")
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getBufferPoints(),
+            freud.util.arr_type_t.FLOAT, 3)
 
     @_Compute._computed_property
     def buffer_ids(self):
         """:math:`\\left(N_{buffer}\\right)` :class:`numpy.ndarray`: The buffer
         point ids."""
-        return np.asarray(self.thisptr.getBufferIds())
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getBufferIds(),
+            freud.util.arr_type_t.UNSIGNED_INT)
+
+    @_Compute._computed_property
+    def buffer_images(self):
+        """:math:`\\left(N_{buffer}, 3\\right)` :class:`numpy.ndarray`: The
+        integer images, in units of the box lattice vectors, by which each
+        buffer point is shifted from its original point."""
+        return freud.util.make_managed_numpy_array(
+            &self.thisptr.getBufferImages(),
+            freud.util.arr_type_t.INT, 3)
 
     @_Compute._computed_property
     def buffer_box(self):
@@ -1149,10 +1614,17 @@ cdef class Voronoi(_Compute):
 
     The voro++ library :cite:`Rycroft2009` is used for fast computations of the
     Voronoi diagram.
+
+    Args:
+        compute_polytopes (bool, optional):
+            Whether to compute the vertices of each Voronoi polytope. If
+            :code:`False`, only :attr:`nlist` and :attr:`volumes` are
+            computed, which saves time and memory for large systems
+            (Default value = :code:`True`).
     """
 
-    def __cinit__(self):
-        self.thisptr = new freud._locality.Voronoi()
+    def __cinit__(self, cbool compute_polytopes=True):
+        self.thisptr = new freud._locality.Voronoi(compute_polytopes)
         self._nlist = NeighborList()
 
     def __dealloc__(self):
@@ -1171,10 +1643,20 @@ cdef class Voronoi(_Compute):
         self._box = nq.box
         return self
 
+    @property
+    def compute_polytopes(self):
+        """bool: Whether polytope vertices are computed."""
+        return self.thisptr.getComputePolytopes()
+
     @_Compute._computed_property
     def polytopes(self):
         """list[:class:`numpy.ndarray`]: A list of :class:`numpy.ndarray`
-        defining Voronoi polytope vertices for each cell."""
+        defining Voronoi polytope vertices for each cell. Only available if
+        :attr:`compute_polytopes` is :code:`True`."""
+        if not self.thisptr.getComputePolytopes():
+            raise ValueError(
+                "Polytopes were not computed. Create the Voronoi object with "
+                "compute_polytopes=True to access them.")
         polytopes = []
         cdef vector[vector[vec3[double]]] raw_polytopes = \
             self.thisptr.getPolytopes()
@@ -1225,8 +1707,8 @@ cdef class Voronoi(_Compute):
         return self._nlist
 
     def __repr__(self):
-        return "freud.locality.{cls}()".format(
-            cls=type(self).__name__)
+        return "freud.locality.{cls}(compute_polytopes={compute_polytopes})".format(
+            cls=type(self).__name__, compute_polytopes=self.compute_polytopes)
 
     def __str__(self):
         return repr(self)
@@ -1261,3 +1743,128 @@ cdef class Voronoi(_Compute):
             return freud.plot._ax_to_bytes(self.plot())
         except (AttributeError, ImportError):
             return None
+
+
+cdef class VerletList(_Compute):
+    R"""Reuse a neighbor list across frames using a Verlet skin.
+
+    Computing the same pair quantities on every frame of a trajectory
+    normally requires finding all neighbors from scratch on each frame. A
+    :class:`VerletList` instead finds all bonds within a distance of
+    :code:`r_max + skin` and stores them along with the current positions.
+    On later frames, if no point has moved more than :code:`skin / 2` since
+    the bonds were found, every pair within :code:`r_max` must still be
+    among the stored bonds, so only their distances and vectors are
+    recomputed before keeping the bonds within :code:`r_max` (as
+    :meth:`NeighborList.filter_r` does). Otherwise, the stored bonds are
+    rebuilt. When :code:`query_points` are given, the bonds are rebuilt once
+    the largest displacement of any point plus that of any query point
+    exceeds :code:`skin`.
+
+    The bonds are also rebuilt when the box, the number of points, or the
+    query points change. Displacements are measured with the minimum image
+    convention, so points wrapped back into the box are not counted as
+    moving.
+
+    The resulting :attr:`nlist` can be passed as the :code:`neighbors`
+    argument of any compute using the same points and query points, such as
+    :class:`freud.order.Steinhardt` or :class:`freud.density.RDF`.
+
+    .. note::
+
+        A larger skin makes rebuilds less frequent but increases the number
+        of bonds that must be refreshed on every frame. A skin of a few
+        tenths of the typical particle spacing is a common choice.
+
+    Args:
+        r_max (float):
+            Cutoff distance of the neighbor list.
+        skin (float):
+            Extra distance searched when building the stored bonds.
+
+    Example::
+
+        >>> import freud
+        >>> box, points = freud.data.make_random_system(10, 100, seed=0)
+        >>> verlet = freud.locality.VerletList(r_max=1.5, skin=0.3)
+        >>> rdf = freud.density.RDF(bins=50, r_max=1.5)
+        >>> for frame in range(3):
+        ...     points = box.wrap(points + 0.01)
+        ...     nlist = verlet.compute((box, points)).nlist
+        ...     rdf = rdf.compute((box, points), neighbors=nlist, reset=False)
+    """
+
+    def __cinit__(self, float r_max, float skin):
+        self.thisptr = new freud._locality.VerletList(r_max, skin)
+        self._nlist = _nlist_from_cnlist(self.thisptr.getNeighborList().get())
+
+    def __dealloc__(self):
+        del self.thisptr
+
+    def compute(self, system, query_points=None):
+        R"""Update the neighbor list for the current positions.
+
+        Args:
+            system:
+                Any object that is a valid argument to
+                :class:`freud.locality.NeighborQuery.from_system`.
+            query_points ((:math:`N_{query\_points}`, 3) :class:`numpy.ndarray`, optional):
+                Query points used to find bonds. Uses the system's points
+                and excludes bonds from a point to itself if :code:`None`
+                (Default value = :code:`None`).
+        """  # noqa E501
+        cdef NeighborQuery nq = NeighborQuery.from_system(system)
+        cdef cbool exclude_ii = query_points is None
+
+        if query_points is None:
+            query_points = nq.points
+        else:
+            query_points = freud.util._convert_array(
+                query_points, shape=(None, 3))
+        cdef const float[:, ::1] l_query_points = query_points
+        cdef unsigned int num_query_points = l_query_points.shape[0]
+        cdef const vec3[float]* query_points_ptr = NULL
+        if num_query_points > 0:
+            query_points_ptr = <vec3[float]*> &l_query_points[0, 0]
+        cdef freud._locality.NeighborQuery* nq_ptr = nq.get_ptr()
+
+        with nogil:
+            self.thisptr.compute(
+                nq_ptr, query_points_ptr, num_query_points, exclude_ii)
+        return self
+
+    @property
+    def r_max(self):
+        """float: Cutoff distance of the neighbor list."""
+        return self.thisptr.getRMax()
+
+    @property
+    def skin(self):
+        """float: Extra distance searched when building the stored
+        bonds."""
+        return self.thisptr.getSkin()
+
+    @_Compute._computed_property
+    def nlist(self):
+        R""":class:`~.locality.NeighborList`: Bonds within :code:`r_max`
+        for the most recently computed positions. The same object is
+        updated in place by every call to :meth:`compute`."""
+        return self._nlist
+
+    @_Compute._computed_property
+    def rebuilt(self):
+        """bool: Whether the last call to :meth:`compute` rebuilt the stored
+        bonds."""
+        return self.thisptr.getRebuilt()
+
+    @property
+    def num_builds(self):
+        """int: Number of times the stored bonds have been built."""
+        return self.thisptr.getNumBuilds()
+
+    def __repr__(self):
+        return "freud.locality.{cls}(r_max={r_max}, skin={skin})".format(
+            cls=type(self).__name__, r_max=self.r_max, skin=self.skin)
+
+    def __str__(self):
+        return repr(self)
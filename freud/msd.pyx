@@ -198,13 +198,10 @@ cdef class MSD(_Compute):
             images = freud.util._convert_array(
                 images, shape=positions.shape, dtype=np.int32)
 
-        # Make sure we aren't modifying the provided array
+        # Unwrapping writes to a new array, so the provided array is not
+        # modified. All frames are unwrapped in a single parallel loop.
         if self._box is not None and images is not None:
-            unwrapped_positions = positions.copy()
-            for i in range(positions.shape[0]):
-                unwrapped_positions[i, :, :] = self._box.unwrap(
-                    unwrapped_positions[i, :, :], images[i, :, :])
-            positions = unwrapped_positions
+            positions = self._box.unwrap(positions, images)
 
         if self.mode == 'window':
             # First compute the first term r^2(k+m) - r^2(k)
@@ -24,6 +24,8 @@ ctypedef enum arr_type_t:
     COMPLEX_DOUBLE
     UNSIGNED_INT
     BOOL
+    SIZE_T
+    INT
 
 
 ctypedef union arr_ptr_t:
@@ -34,6 +36,8 @@ ctypedef union arr_ptr_t:
     ManagedArray[double complex] *complex_double_ptr
     ManagedArray[uint] *uint_ptr
     ManagedArray[bool] *bool_ptr
+    ManagedArray[size_t] *size_t_ptr
+    ManagedArray[int] *int_ptr
 
 
 cdef class _ManagedArrayContainer:
@@ -80,6 +84,19 @@ cdef class _ManagedArrayContainer:
                                          element_size)
             obj.thisptr.bool_ptr = new ManagedArray[bool](
                 dereference(<const ManagedArray[bool] *>array))
+        elif arr_type == arr_type_t.SIZE_T:
+            # Exposed as NumPy's signed index type, which has the same size
+            # as size_t, so that arrays of bond indices can be used directly
+            # for indexing operations like np.add.reduceat.
+            obj = _ManagedArrayContainer(arr_type, np.NPY_INTP,
+                                         element_size)
+            obj.thisptr.size_t_ptr = new ManagedArray[size_t](
+                dereference(<const ManagedArray[size_t] *>array))
+        elif arr_type == arr_type_t.INT:
+            obj = _ManagedArrayContainer(arr_type, np.NPY_INT32,
+                                         element_size)
+            obj.thisptr.int_ptr = new ManagedArray[int](
+                dereference(<const ManagedArray[int] *>array))
 
         return obj
 
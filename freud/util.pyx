@@ -61,6 +61,10 @@ cdef class _ManagedArrayContainer:
             return tuple(self.thisptr.complex_double_ptr.shape())
         elif self.data_type == arr_type_t.BOOL:
             return tuple(self.thisptr.bool_ptr.shape())
+        elif self.data_type == arr_type_t.SIZE_T:
+            return tuple(self.thisptr.size_t_ptr.shape())
+        elif self.data_type == arr_type_t.INT:
+            return tuple(self.thisptr.int_ptr.shape())
 
     @property
     def element_size(self):
@@ -79,6 +83,10 @@ cdef class _ManagedArrayContainer:
             del self.thisptr.complex_double_ptr
         elif self.data_type == arr_type_t.BOOL:
             del self.thisptr.bool_ptr
+        elif self.data_type == arr_type_t.SIZE_T:
+            del self.thisptr.size_t_ptr
+        elif self.data_type == arr_type_t.INT:
+            del self.thisptr.int_ptr
 
     cdef void set_as_base(self, arr):
         """Sets the base of arr to be this object and increases the
@@ -100,6 +108,10 @@ cdef class _ManagedArrayContainer:
             return self.thisptr.complex_double_ptr.get()
         elif self.data_type == arr_type_t.BOOL:
             return self.thisptr.bool_ptr.get()
+        elif self.data_type == arr_type_t.SIZE_T:
+            return self.thisptr.size_t_ptr.get()
+        elif self.data_type == arr_type_t.INT:
+            return self.thisptr.int_ptr.get()
 
     def __array__(self):
         """Convert the underlying data array into a read-only numpy array.
@@ -117,6 +117,32 @@ class TestBox:
         points = [[10, -5, -5], [0, 0.5, 0]]
         npt.assert_allclose(box.wrap(points), [[-2, -1, -1], [0, 0.5, 0]], rtol=1e-6)
 
+    @pytest.mark.parametrize(
+        "box",
+        [
+            freud.box.Box.cube(10),
+            freud.box.Box(8, 9, 10, 0.3, 0.2, -0.4),
+            freud.box.Box(8, 9, 0, 0.3, is2D=True),
+        ],
+    )
+    @pytest.mark.parametrize("periodic", [(True, True, True), (True, False, True)])
+    def test_wrap_orthorhombic_triclinic(self, box, periodic):
+        box.periodic = periodic
+        np.random.seed(0)
+        points = np.random.uniform(-30, 30, (10000, 3)).astype(np.float32)
+        points[:10] = 0
+        points[10:20] = box.make_absolute([1, 1, 1])
+        points[20:30] = box.make_absolute([0.5, 0.5, 0.5]) + 4 * box.Lx
+        if box.is2D:
+            points[:, 2] = 0
+
+        # Wrap the fractional coordinates in double precision as a reference
+        fractions = box.make_fractional(points).astype(np.float64)
+        fractions[:, list(periodic)] = np.mod(fractions[:, list(periodic)], 1)
+        npt.assert_array_equal(
+            box.wrap(points), box.make_absolute(fractions.astype(np.float32))
+        )
+
     def test_wrap_out_provided_with_input_array(self):
         box = freud.box.Box(2, 2, 2, 1, 0, 0)
         points = [[10, -5, -5], [0, 0.5, 0]]
@@ -279,6 +305,66 @@ class TestBox:
         com = box.make_absolute(com_angle / (2 * np.pi))
         npt.assert_allclose(box.center_of_mass(points, masses), com, atol=1e-6)
 
+    @pytest.mark.parametrize("n_groups", [10, 200])
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_center_of_mass_groups(self, weighted, n_groups):
+        box = freud.box.Box(8, 9, 10, 0.3, 0.2, -0.4)
+        np.random.seed(0)
+        points = np.random.uniform(-10, 10, (1000, 3)).astype(np.float32)
+        masses = np.random.uniform(0.5, 2, len(points)) if weighted else None
+        groups = np.random.randint(0, n_groups, len(points))
+        groups[groups == 5] = 4
+        groups[-1] = n_groups - 1
+
+        centers = box.center_of_mass(points, masses, groups=groups)
+        assert centers.shape == (n_groups, 3)
+        for group in range(n_groups):
+            if group == 5:
+                assert np.all(np.isnan(centers[group]))
+                continue
+            selected = groups == group
+            npt.assert_allclose(
+                centers[group],
+                box.center_of_mass(
+                    points[selected], None if masses is None else masses[selected]
+                ),
+                atol=1e-5,
+            )
+
+        npt.assert_allclose(
+            box.center_of_mass(points, masses, groups=np.zeros(len(points), int))[0],
+            box.center_of_mass(points, masses),
+            atol=1e-5,
+        )
+
+        with pytest.raises(ValueError):
+            box.center_of_mass(points, groups=-groups)
+        with pytest.raises(ValueError):
+            box.center_of_mass(points, groups=groups[:-1])
+
+    def test_center_of_mass_groups_many_points(self):
+        # Enough points that the groups are sorted in several blocks.
+        box = freud.box.Box(8, 9, 10, 0.3, 0.2, -0.4)
+        np.random.seed(0)
+        points = np.random.uniform(-10, 10, (100000, 3)).astype(np.float32)
+        masses = np.random.uniform(0.5, 2, len(points))
+        n_groups = 1000
+        groups = np.random.randint(0, n_groups, len(points))
+
+        phases = np.exp(2 * np.pi * 1j * box.make_fractional(points).astype(np.float64))
+        sums = np.zeros((n_groups, 3), dtype=np.complex128)
+        np.add.at(sums, groups, masses[:, np.newaxis] * phases)
+        expected = box.wrap(box.make_absolute(np.angle(sums) / (2 * np.pi)))
+        centers = box.center_of_mass(points, masses, groups=groups)
+        npt.assert_allclose(box.wrap(centers - expected), 0, atol=1e-4)
+
+    def test_center_of_mass_many_points(self):
+        box = freud.box.Box.cube(10)
+        np.random.seed(0)
+        center = np.array([4.9, -2, 3], dtype=np.float32)
+        points = center + np.random.normal(scale=0.01, size=(1000000, 3))
+        npt.assert_allclose(box.center_of_mass(points), center, atol=1e-4)
+
     def test_center(self):
         box = freud.box.Box.cube(5)
 
@@ -362,6 +448,69 @@ class TestBox:
         npt.assert_equal(box.make_fractional(f_point, out=f_point), f_point)
         npt.assert_equal(f_point, f_point)
 
+    @pytest.mark.parametrize("per_frame_boxes", [False, True])
+    def test_frames(self, per_frame_boxes):
+        box = freud.box.Box(2, 3, 4, 0.1, 0.2, 0.3)
+        np.random.seed(0)
+        points = np.random.uniform(-10, 10, size=(4, 50, 3)).astype(np.float32)
+        if per_frame_boxes:
+            boxes = [
+                freud.box.Box(2 + i, 3, 4 - 0.5 * i, 0.1 * i, 0.2, 0.3)
+                for i in range(len(points))
+            ]
+            # Arrays of box parameters are also accepted.
+            box_params = np.array([[b.Lx, b.Ly, b.Lz, b.xy, b.xz, b.yz] for b in boxes])
+            kwargs = dict(boxes=box_params)
+        else:
+            boxes = [box] * len(points)
+            kwargs = {}
+
+        def per_frame(method, *args):
+            return np.array(
+                [
+                    getattr(frame_box, method)(*(arg[i] for arg in args))
+                    for i, frame_box in enumerate(boxes)
+                ]
+            )
+
+        images = box.get_images(points, **kwargs)
+        assert images.dtype == np.int32
+        npt.assert_equal(images, per_frame("get_images", points))
+        wrapped = box.wrap(points, **kwargs)
+        npt.assert_allclose(wrapped, per_frame("wrap", points), atol=1e-5)
+        npt.assert_allclose(
+            box.unwrap(wrapped, images, **kwargs),
+            per_frame("unwrap", wrapped, images),
+            atol=1e-5,
+        )
+        fractions = box.make_fractional(points, **kwargs)
+        npt.assert_allclose(fractions, per_frame("make_fractional", points), atol=1e-5)
+        npt.assert_allclose(
+            box.make_absolute(fractions, **kwargs),
+            per_frame("make_absolute", fractions),
+            atol=1e-5,
+        )
+
+        # Results are written in place into out.
+        out = np.empty_like(points)
+        assert box.wrap(points, out=out, **kwargs) is out
+        npt.assert_equal(out, wrapped)
+        images_out = np.empty(points.shape, dtype=np.int32)
+        assert box.get_images(points, out=images_out, **kwargs) is images_out
+        npt.assert_equal(images_out, images)
+
+    def test_frames_invalid(self):
+        box = freud.box.Box.cube(2)
+        points = np.zeros((3, 5, 3), dtype=np.float32)
+        with pytest.raises(ValueError):
+            box.wrap(points, boxes=[box, box])
+        with pytest.raises(ValueError, match="N_frames, N, 3"):
+            box.wrap(points[0], boxes=[box] * 3)
+        with pytest.raises(ValueError, match="N_frames, N, 3"):
+            box.wrap(points[0], boxes=[box] * 5)
+        with pytest.raises(ValueError):
+            box.wrap(points, boxes=[freud.box.Box.square(2)] * 3)
+
     def test_vectors(self):
         """Test getting lattice vectors"""
         b_list = [1, 2, 3, 0.1, 0.2, 0.3]
@@ -592,6 +741,33 @@ class TestBox:
             distances, [[1.0, 0.0, 1.0], [np.sqrt(2), 1.0, 0.0]], rtol=1e-6
         )
 
+    def test_distance_reductions(self):
+        # Sizes that do not divide evenly into tiles of the distance matrix.
+        box = freud.box.Box(5, 6, 7, 0.5, 0.1, 0.2)
+        np.random.seed(0)
+        query_points = box.make_absolute(np.random.rand(37, 3))
+        points = box.make_absolute(np.random.rand(2500, 3))
+        distances = box.compute_all_distances(query_points, points)
+
+        min_distances, min_indices = box.compute_min_distances(query_points, points)
+        npt.assert_allclose(min_distances, distances.min(axis=1))
+        npt.assert_equal(min_indices, distances.argmin(axis=1))
+
+        r_max = 2.0
+        counts = box.count_distances(query_points, points, r_max)
+        npt.assert_equal(counts, np.sum(distances < r_max, axis=1))
+
+        histogram = box.compute_distance_histogram(query_points, points, 10, r_max)
+        expected, _ = np.histogram(distances, bins=10, range=(0, r_max))
+        assert histogram.sum() == np.sum(distances < r_max)
+        # Distances close to bin edges may fall in neighboring bins.
+        npt.assert_allclose(histogram, expected, atol=2)
+
+        with pytest.raises(ValueError):
+            box.compute_distance_histogram(query_points, points, 0, r_max)
+        with pytest.raises(ValueError):
+            box.compute_min_distances(query_points, np.empty((0, 3)))
+
     def test_contains_2d(self):
         box = freud.box.Box(2, 3, 0, 1, 0, 0)
         points = np.random.uniform(-0.5, 0.5, size=(100, 3)).astype(np.float32)
@@ -154,6 +154,50 @@ class TestCluster:
 
         assert np.all(ckeys == check_values)
 
+    def test_cluster_query_matches_nlist(self):
+        """Check that clustering from a query (which only needs to find each
+        pair once) matches clustering from a full NeighborList."""
+        box, points = freud.data.make_random_system(10, 500, seed=0)
+        query_args = dict(r_max=0.6, exclude_ii=True)
+        nq = freud.locality.AABBQuery(box, points)
+        nlist = nq.query(points, query_args).toNeighborList()
+
+        clust_query = freud.cluster.Cluster().compute(nq, neighbors=query_args)
+        clust_nlist = freud.cluster.Cluster().compute(nq, neighbors=nlist)
+        assert clust_query.num_clusters == clust_nlist.num_clusters
+        npt.assert_equal(clust_query.cluster_idx, clust_nlist.cluster_idx)
+
+    def test_cluster_ordering_and_keys(self):
+        """Check cluster labels and CSR keys against a reference computed from
+        the connected components of the neighbor graph."""
+        csgraph = pytest.importorskip("scipy.sparse.csgraph")
+        sparse = pytest.importorskip("scipy.sparse")
+        box, points = freud.data.make_random_system(10, 2000, seed=1)
+        nq = freud.locality.AABBQuery(box, points)
+        nlist = nq.query(points, dict(r_max=0.7, exclude_ii=True)).toNeighborList()
+        keys = np.random.default_rng(0).integers(0, 100, len(points))
+
+        clust = freud.cluster.Cluster().compute(nq, keys=keys, neighbors=nlist)
+
+        graph = sparse.coo_matrix(
+            (np.ones(len(nlist)), (nlist.query_point_indices, nlist.point_indices)),
+            shape=(len(points), len(points)),
+        )
+        num_components, labels = csgraph.connected_components(graph, directed=False)
+        sizes = np.bincount(labels)
+        min_ids = np.array([np.flatnonzero(labels == c)[0] for c in range(len(sizes))])
+        # Clusters are sorted by size, then by their minimum point index.
+        order = np.lexsort((min_ids, -sizes))
+        expected_idx = np.argsort(order)[labels]
+
+        assert clust.num_clusters == num_components
+        npt.assert_equal(clust.cluster_idx, expected_idx)
+        npt.assert_equal(np.diff(clust.cluster_key_offsets), sizes[order])
+        assert len(clust.cluster_keys) == num_components
+        for cluster, cluster_keys in enumerate(clust.cluster_keys):
+            npt.assert_equal(cluster_keys, keys[expected_idx == cluster])
+            assert np.shares_memory(cluster_keys, clust.cluster_key_values)
+
     def test_repr(self):
         clust = freud.cluster.Cluster()
         assert str(clust) == str(eval(repr(clust)))
@@ -180,7 +224,7 @@ class TestClusterManagedArray(ManagedArrayTestBase):
 
     @property
     def computed_properties(self):
-        return ["cluster_idx"]
+        return ["cluster_idx", "cluster_key_values"]
 
     def compute(self):
         box = freud.box.Box.cube(10)
@@ -111,6 +111,22 @@ class TestRDF:
             avg_counts = rdf.rdf * ndens * bin_volumes
             npt.assert_allclose(rdf.n_r, np.cumsum(avg_counts), rtol=tolerance)
 
+    def test_query_matches_nlist(self):
+        """Check that a self-query (which only needs to find each pair once)
+        gives the same histogram as a full NeighborList."""
+        r_max = 3.0
+        box, points = freud.data.make_random_system(10, 1000, seed=0)
+        query_args = dict(r_max=r_max, exclude_ii=True)
+        for nq in (
+            freud.locality.AABBQuery(box, points),
+            freud.locality.LinkCell(box, points, r_max),
+        ):
+            nlist = nq.query(points, query_args).toNeighborList()
+            rdf_query = freud.density.RDF(10, r_max).compute(nq, neighbors=query_args)
+            rdf_nlist = freud.density.RDF(10, r_max).compute(nq, neighbors=nlist)
+            npt.assert_equal(rdf_query.bin_counts, rdf_nlist.bin_counts)
+            npt.assert_equal(rdf_query.rdf, rdf_nlist.rdf)
+
     def test_repr(self):
         rdf = freud.density.RDF(r_max=10, bins=100, r_min=0.5)
         assert str(rdf) == str(eval(repr(rdf)))
@@ -116,6 +116,54 @@ class TestNeighborList:
         # should be able to further filter
         self.nlist.filter_r(2.5)
 
+    @pytest.mark.parametrize("compressed", [False, True])
+    def test_filter_large(self, compressed):
+        # Lists spanning many blocks of the parallel filter, with query points
+        # that have no bonds or lose all of their bonds.
+        box, points = freud.data.make_random_system(20, 4000, seed=0)
+        nlist = (
+            freud.locality.AABBQuery(box, points)
+            .query(points[::2], dict(r_max=2.5, vectors=True))
+            .toNeighborList()
+        )
+        nlist = freud.locality.NeighborList.from_arrays(
+            len(points),
+            len(points),
+            nlist.query_point_indices * 2,
+            nlist.point_indices,
+            nlist.distances,
+            np.random.rand(len(nlist)),
+            nlist.vectors,
+        )
+        assert len(nlist) > 50000
+        filt = (nlist.query_point_indices % 3 != 0) & (nlist.distances > 1)
+        expected = nlist.copy()
+        if compressed:
+            nlist.compress()
+
+        keep_r = np.logical_and(nlist.distances >= 1.5, nlist.distances < 2)
+        for args, mask in (((filt,), filt), ((2, 1.5), keep_r[filt])):
+            if len(args) == 1:
+                nlist.filter(*args)
+            else:
+                nlist.filter_r(*args)
+            expected = freud.locality.NeighborList.from_arrays(
+                len(points),
+                len(points),
+                expected.query_point_indices[mask],
+                expected.point_indices[mask],
+                expected.distances[mask],
+                expected.weights[mask],
+                expected.vectors[mask],
+            )
+            assert nlist.is_compressed == compressed
+            npt.assert_equal(nlist[:], expected[:])
+            npt.assert_equal(nlist.distances, expected.distances)
+            npt.assert_equal(nlist.weights, expected.weights)
+            npt.assert_equal(nlist.vectors, expected.vectors)
+            npt.assert_equal(nlist.neighbor_counts, expected.neighbor_counts)
+            npt.assert_equal(nlist.segments, expected.segments)
+
     def test_find_first_index(self):
         nlist = self.nlist
         for (idx, i) in enumerate(nlist.query_point_indices):
@@ -201,6 +249,141 @@ class TestNeighborList:
                 4, 4, query_point_indices, point_indices, distances, weights
             )
 
+    def test_unit_weights(self):
+        # Query results have unit weights and do not store a weights array
+        nlist = self.nq.query(self.nq.points, self.query_args).toNeighborList()
+        assert not nlist.has_weights
+
+        # Filtering and copying preserve the absence of weights
+        nlist.filter_r(2.5)
+        assert not nlist.has_weights
+        nlist2 = nlist.copy()
+        assert not nlist2.has_weights
+
+        # Accessing the weights materializes an array of ones
+        npt.assert_equal(nlist.weights, 1)
+        assert nlist.weights.shape == (len(nlist),)
+        assert nlist.has_weights
+        assert not nlist2.has_weights
+
+        # Lists created from arrays only store weights if they are given
+        nlist = freud.locality.NeighborList.from_arrays(
+            nlist2.num_query_points,
+            nlist2.num_points,
+            nlist2.query_point_indices,
+            nlist2.point_indices,
+            nlist2.distances,
+        )
+        assert not nlist.has_weights
+        nlist = freud.locality.NeighborList.from_arrays(
+            nlist2.num_query_points,
+            nlist2.num_points,
+            nlist2.query_point_indices,
+            nlist2.point_indices,
+            nlist2.distances,
+            nlist2.weights,
+        )
+        assert nlist.has_weights
+
+    def test_vectors(self):
+        points = self.nq.points
+        assert not self.nlist.has_vectors
+        nlist = self.nq.query(
+            points, dict(self.query_args, vectors=True)
+        ).toNeighborList()
+        assert nlist.has_vectors
+        npt.assert_allclose(
+            nlist.vectors,
+            self.nq.box.wrap(
+                points[nlist.point_indices] - points[nlist.query_point_indices]
+            ),
+            atol=1e-5,
+        )
+        npt.assert_allclose(
+            np.linalg.norm(nlist.vectors, axis=-1), nlist.distances, rtol=1e-5
+        )
+
+        # Filtering and compressing keep the vector of each bond
+        nlist2 = nlist.copy().compress()
+        nlist2.filter_r(2.5)
+        mask = nlist.distances < 2.5
+        npt.assert_equal(nlist2.vectors, nlist.vectors[mask])
+
+        # Lists created from arrays only store vectors if they are given
+        nlist3 = freud.locality.NeighborList.from_arrays(
+            nlist.num_query_points,
+            nlist.num_points,
+            nlist.query_point_indices,
+            nlist.point_indices,
+            nlist.distances,
+        )
+        assert not nlist3.has_vectors
+        with pytest.raises(ValueError):
+            nlist3.vectors
+        nlist3 = freud.locality.NeighborList.from_arrays(
+            nlist.num_query_points,
+            nlist.num_points,
+            nlist.query_point_indices,
+            nlist.point_indices,
+            nlist.distances,
+            vectors=nlist.vectors,
+        )
+        npt.assert_equal(nlist3.vectors, nlist.vectors)
+
+    def test_compress(self):
+        nlist = self.nq.query(self.nq.points, self.query_args).toNeighborList()
+        nlist_compressed = nlist.copy().compress()
+        assert not nlist.is_compressed
+        assert nlist_compressed.is_compressed
+
+        npt.assert_equal(nlist_compressed.segments, nlist.segments)
+        npt.assert_equal(nlist_compressed.neighbor_counts, nlist.neighbor_counts)
+        for i in range(nlist.num_query_points + 1):
+            assert nlist_compressed.find_first_index(i) == nlist.find_first_index(i)
+        npt.assert_equal(
+            nlist_compressed.query_point_indices, nlist.query_point_indices
+        )
+        npt.assert_equal(nlist_compressed.point_indices, nlist.point_indices)
+        npt.assert_equal(nlist_compressed.distances, nlist.distances)
+        npt.assert_equal(nlist_compressed[:], nlist[:])
+
+        # Filtering preserves compression
+        nlist.filter_r(2.5)
+        nlist_compressed.filter_r(2.5)
+        assert nlist_compressed.is_compressed
+        npt.assert_equal(nlist_compressed.segments, nlist.segments)
+        npt.assert_equal(nlist_compressed.neighbor_counts, nlist.neighbor_counts)
+        npt.assert_equal(nlist_compressed[:], nlist[:])
+        npt.assert_equal(nlist_compressed.copy()[:], nlist[:])
+
+    def test_compress_empty_query_points(self):
+        query_point_indices = [0, 0, 2, 2, 2]
+        point_indices = [1, 2, 0, 1, 3]
+        distances = np.ones(len(query_point_indices))
+        nlist = freud.locality.NeighborList.from_arrays(
+            4, 4, query_point_indices, point_indices, distances
+        )
+        nlist_compressed = nlist.copy().compress()
+        npt.assert_equal(nlist.neighbor_counts, [2, 0, 3, 0])
+        npt.assert_equal(nlist.segments, [0, 0, 2, 0])
+        npt.assert_equal(nlist_compressed.neighbor_counts, nlist.neighbor_counts)
+        npt.assert_equal(nlist_compressed.segments, nlist.segments)
+
+        # Computes give the same results with compressed lists
+        ld = freud.density.LocalDensity(3, 1)
+        npt.assert_allclose(
+            ld.compute(self.nq, neighbors=nlist_compressed).density,
+            ld.compute(self.nq, neighbors=nlist).density,
+        )
+
+    def test_count_first_compressed(self):
+        nlist = self.nq.query(self.nq.points, self.query_args).toNeighborList(
+            count_first=True
+        )
+        assert nlist.is_compressed
+        nlist2 = self.nq.query(self.nq.points, self.query_args).toNeighborList()
+        npt.assert_equal(nlist[:], nlist2[:])
+
     def test_indexing_empty(self):
         # Ensure that empty NeighborLists have the right shape
         nlist = self.nq.query(np.empty((0, 3)), self.query_args).toNeighborList()
@@ -246,6 +429,71 @@ class TestNeighborList:
         npt.assert_equal(nlist.segments, nlist2.segments)
         npt.assert_equal(nlist.neighbor_counts, nlist2.neighbor_counts)
 
+    @pytest.mark.parametrize("mmap", [True, False])
+    @pytest.mark.parametrize("weights, vectors", [(False, True), (True, False)])
+    def test_save_load(self, tmp_path, mmap, weights, vectors):
+        nlist = self.nq.query(
+            self.nq.points, dict(self.query_args, vectors=True)
+        ).toNeighborList()
+        nlist = freud.locality.NeighborList.from_arrays(
+            self.N,
+            self.N,
+            nlist.query_point_indices,
+            nlist.point_indices,
+            nlist.distances,
+            np.random.rand(len(nlist)) if weights else None,
+            nlist.vectors if vectors else None,
+        )
+        path = tmp_path / "nlist.bin"
+        nlist.save(path)
+        loaded = freud.locality.NeighborList.load(path, mmap=mmap)
+        assert loaded.is_compressed
+        assert loaded.has_weights == weights
+        assert loaded.has_vectors == vectors
+        assert loaded.num_query_points == nlist.num_query_points
+        assert loaded.num_points == nlist.num_points
+        npt.assert_equal(loaded[:], nlist[:])
+        npt.assert_equal(loaded.distances, nlist.distances)
+        npt.assert_equal(loaded.weights, nlist.weights)
+        npt.assert_equal(loaded.segments, nlist.segments)
+        npt.assert_equal(loaded.neighbor_counts, nlist.neighbor_counts)
+        if vectors:
+            npt.assert_equal(loaded.vectors, nlist.vectors)
+
+        # Arrays remain valid after the neighbor list is deleted.
+        distances = loaded.distances
+        del loaded
+        npt.assert_equal(distances, nlist.distances)
+
+    def test_load_invalid(self, tmp_path):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(b"\0" * 128)
+        with pytest.raises(ValueError):
+            freud.locality.NeighborList.load(path)
+        with pytest.raises(OSError):
+            freud.locality.NeighborList.load(tmp_path / "missing.bin")
+
+    def test_load_corrupt_header(self, tmp_path):
+        path = tmp_path / "nlist.bin"
+        self.nlist.save(path)
+        data = bytearray(path.read_bytes())
+
+        # A number of bonds whose sections would not fit in 64-bit offsets.
+        huge_bonds = bytearray(data)
+        huge_bonds[32:40] = np.uint64(2**62).tobytes()
+        path.write_bytes(huge_bonds)
+        for mmap in [True, False]:
+            with pytest.raises(ValueError):
+                freud.locality.NeighborList.load(path, mmap=mmap)
+
+        # Point indices that are not less than the number of points are
+        # detected when the file is read.
+        few_points = bytearray(data)
+        few_points[24:28] = np.uint32(1).tobytes()
+        path.write_bytes(few_points)
+        with pytest.raises(ValueError):
+            freud.locality.NeighborList.load(path, mmap=False)
+
     def test_ordering_default(self):
         # default behavior sorts by (i, j, distance)
         tuples = list(
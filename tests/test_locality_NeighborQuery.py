@@ -1,5 +1,6 @@
 import itertools
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib
 import numpy as np
@@ -319,6 +320,77 @@ class NeighborQueryTest:
 
         npt.assert_equal(set(result_list), set(list_nlist))
 
+    @pytest.mark.parametrize("sort_by_distance", [False, True])
+    @pytest.mark.parametrize(
+        "query_args",
+        [dict(r_max=2), dict(r_max=2, r_min=0.5), dict(num_neighbors=6)],
+    )
+    def test_query_to_nlist_count_first(self, query_args, sort_by_distance):
+        """Test that counting neighbors before filling the NeighborList gives
+        the same result as collecting and sorting all bonds."""
+        L = 10  # Box Dimensions
+        N = 400  # number of particles
+
+        box, ref_points = freud.data.make_random_system(L, N, seed=0)
+        _, points = freud.data.make_random_system(L, N, seed=1)
+
+        nq = self.build_query_object(box, ref_points, L / 10)
+
+        nlist = nq.query(points, query_args).toNeighborList(sort_by_distance)
+        nlist_count_first = nq.query(points, query_args).toNeighborList(
+            sort_by_distance, count_first=True
+        )
+        npt.assert_equal(
+            nlist_count_first.query_point_indices, nlist.query_point_indices
+        )
+        npt.assert_equal(nlist_count_first.point_indices, nlist.point_indices)
+        npt.assert_equal(nlist_count_first.distances, nlist.distances)
+        npt.assert_equal(nlist_count_first.weights, nlist.weights)
+
+    @pytest.mark.parametrize("sort_by_distance", [False, True])
+    @pytest.mark.parametrize(
+        "query_args",
+        [dict(r_max=2), dict(r_max=2, r_min=0.5), dict(num_neighbors=6)],
+    )
+    def test_query_to_arrays(self, query_args, sort_by_distance):
+        """Test that query results converted to arrays match the
+        NeighborList."""
+        L = 10  # Box Dimensions
+        N = 400  # number of particles
+
+        box, ref_points = freud.data.make_random_system(L, N, seed=0)
+        _, points = freud.data.make_random_system(L, N, seed=1)
+
+        nq = self.build_query_object(box, ref_points, L / 10)
+
+        nlist = nq.query(points, query_args).toNeighborList(sort_by_distance)
+        arrays = nq.query(points, query_args).to_arrays(sort_by_distance)
+        assert len(arrays) == 3
+        query_point_indices, point_indices, distances = arrays
+        npt.assert_equal(query_point_indices, nlist.query_point_indices)
+        npt.assert_equal(point_indices, nlist.point_indices)
+        npt.assert_equal(distances, nlist.distances)
+
+        *_, vectors = nq.query(points, query_args).to_arrays(
+            sort_by_distance, vectors=True
+        )
+        npt.assert_allclose(
+            vectors,
+            box.wrap(ref_points[point_indices] - points[query_point_indices]),
+            atol=1e-5,
+        )
+        npt.assert_allclose(np.linalg.norm(vectors, axis=-1), distances, rtol=1e-5)
+
+    def test_query_to_arrays_empty(self):
+        box = freud.box.Box.cube(10)
+        points = np.array([[0, 0, 0], [4, 4, 4]], dtype=np.float32)
+        nq = self.build_query_object(box, points, 1)
+        arrays = nq.query(points, dict(r_max=1, exclude_ii=True)).to_arrays(
+            vectors=True
+        )
+        assert [len(a) for a in arrays] == [0, 0, 0, 0]
+        assert arrays[3].shape == (0, 3)
+
     def test_reciprocal(self):
         """Test that, for a random set of points, for each (i, j) neighbor
         pair there also exists a (j, i) neighbor pair for one set of points"""
@@ -375,6 +447,32 @@ class NeighborQueryTest:
 
         assert ij1 == ij2
 
+    def test_half(self):
+        """Test that half queries find each pair of a self-query once."""
+        L, r_max, N = (10, 2.01, 1024)
+
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        nq = self.build_query_object(box, points, r_max)
+        query_args = dict(mode="ball", r_max=r_max, exclude_ii=True)
+        full = nq.query(points, query_args).toNeighborList()
+        half = nq.query(points, dict(query_args, half=True)).toNeighborList()
+
+        mask = full.query_point_indices < full.point_indices
+        npt.assert_equal(half.query_point_indices, full.query_point_indices[mask])
+        npt.assert_equal(half.point_indices, full.point_indices[mask])
+        npt.assert_equal(half.distances, full.distances[mask])
+
+        # Without exclude_ii, each self-pair is kept once.
+        query_args["exclude_ii"] = False
+        full = nq.query(points, query_args).toNeighborList()
+        half = nq.query(points, dict(query_args, half=True)).toNeighborList()
+        mask = full.query_point_indices <= full.point_indices
+        npt.assert_equal(half.query_point_indices, full.query_point_indices[mask])
+        npt.assert_equal(half.point_indices, full.point_indices[mask])
+
+        with pytest.raises(RuntimeError):
+            list(nq.query(points, dict(num_neighbors=4, half=True)))
+
     def test_exhaustive_search(self):
         L, r_max, N = (10, 1.999, 32)
 
@@ -546,6 +644,62 @@ class NeighborQueryTest:
                 for i in range(N):
                     assert ([i, i] == nlist_array).all(axis=1).any()
 
+    @pytest.mark.parametrize("num_neighbors", [4, 16, 64])
+    def test_query_nearest_brute_force(self, num_neighbors):
+        L = 10
+        N = 1000
+        box, points = freud.data.make_random_system(L, N, seed=num_neighbors)
+        nq = self.build_query_object(box, points, 1)
+        nlist = nq.query(
+            points, dict(num_neighbors=num_neighbors, exclude_ii=True)
+        ).toNeighborList()
+        assert len(nlist) == N * num_neighbors
+
+        # Compare the distances of the k nearest neighbors against a brute
+        # force minimum image calculation.
+        for i in range(0, N, 50):
+            distances = box.compute_distances(np.tile(points[i], (N, 1)), points)
+            distances = np.sort(np.delete(distances, i))[:num_neighbors]
+            found = nlist.distances[nlist.query_point_indices == i]
+            npt.assert_allclose(np.sort(found), distances, rtol=1e-5, atol=1e-5)
+
+    @pytest.mark.parametrize(
+        "periodic", [(False, False, False), (True, True, False), (False, True, True)]
+    )
+    @pytest.mark.parametrize(
+        "query_args",
+        [
+            dict(r_max=1.5, exclude_ii=True),
+            dict(num_neighbors=8, exclude_ii=True),
+            dict(num_neighbors=4, r_max=2, r_min=0.5),
+        ],
+    )
+    def test_non_periodic(self, periodic, query_args):
+        L = 10
+        N = 500
+        box = freud.box.Box.cube(L)
+        box.periodic = periodic
+        np.random.seed(0)
+        # Points may lie outside of the box along non-periodic axes.
+        fractions = np.random.rand(N, 3)
+        for dim in range(3):
+            if not periodic[dim]:
+                fractions[:, dim] = np.random.uniform(-0.2, 1.2, N)
+        points = box.make_absolute(fractions).astype(np.float32)
+        nq = self.build_query_object(box, points, 1.5)
+        nlist = nq.query(points, query_args).toNeighborList()
+
+        for i in range(0, N, 25):
+            distances = np.linalg.norm(box.wrap(points - points[i]), axis=1)
+            mask = (distances >= query_args.get("r_min", 0)) & (
+                distances < query_args.get("r_max", np.inf)
+            )
+            if query_args.get("exclude_ii", False):
+                mask[i] = False
+            expected = np.sort(distances[mask])[: query_args.get("num_neighbors")]
+            found = nlist.distances[nlist.query_point_indices == i]
+            npt.assert_allclose(np.sort(found), expected, rtol=1e-5, atol=1e-5)
+
     def test_duplicate_cell_shells(self):
         box = freud.box.Box.square(5)
         points = [[-1.5, 0, 0]]
@@ -654,6 +808,80 @@ class TestNeighborQueryAABB(NeighborQueryTest):
                 else:
                     original_nlist = nlist
 
+    @pytest.mark.parametrize("rebuild_threshold", [np.inf, 1.0])
+    def test_update(self, rebuild_threshold):
+        """Ensure that updated trees give the same results as new trees."""
+        N = 500
+        L = 10
+        r_max = 1.5
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        aq = freud.locality.AABBQuery(box, points)
+        np.random.seed(1)
+        for _ in range(5):
+            points = box.wrap(points + np.random.normal(scale=0.1, size=points.shape))
+            aq.update(points, rebuild_threshold)
+            npt.assert_allclose(aq.points, points)
+            for query_args in (
+                dict(r_max=r_max, exclude_ii=True),
+                dict(num_neighbors=6, exclude_ii=True),
+            ):
+                nlist1 = aq.query(points, query_args).toNeighborList()
+                nlist2 = (
+                    freud.locality.AABBQuery(box, points)
+                    .query(points, query_args)
+                    .toNeighborList()
+                )
+                assert nlist_equal(nlist1, nlist2)
+
+    def test_update_invalid(self):
+        box, points = freud.data.make_random_system(10, 100, seed=0)
+        aq = freud.locality.AABBQuery(box, points)
+        with pytest.raises(ValueError):
+            aq.update(points[:-1])
+
+        box2d, points2d = freud.data.make_random_system(10, 100, is2D=True, seed=0)
+        aq = freud.locality.AABBQuery(box2d, points2d)
+        with pytest.raises(ValueError):
+            aq.update(points)
+        npt.assert_allclose(aq.points, points2d)
+
+
+class TestNeighborQueryAABBReorder(TestNeighborQueryAABB):
+    @classmethod
+    def build_query_object(cls, box, ref_points, r_max=None):
+        return freud.locality.AABBQuery(box, ref_points, reorder=True)
+
+    def test_reorder_matches(self):
+        N = 1000
+        L = 10
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        aq = freud.locality.AABBQuery(box, points)
+        aq_reorder = freud.locality.AABBQuery(box, points, reorder=True)
+        npt.assert_allclose(aq_reorder.points, points)
+        for query_args in (
+            dict(r_max=1.5, exclude_ii=True),
+            dict(num_neighbors=6, exclude_ii=True),
+            dict(r_max=1.5, exclude_ii=True, half=True),
+        ):
+            nlist = aq.query(points, query_args).toNeighborList()
+            nlist_reorder = aq_reorder.query(points, query_args).toNeighborList()
+            assert nlist_equal(nlist, nlist_reorder)
+            npt.assert_allclose(nlist.distances, nlist_reorder.distances)
+
+        rng = np.random.default_rng(1)
+        points += rng.normal(scale=0.05, size=points.shape).astype(np.float32)
+        points = box.wrap(points)
+        aq_reorder.update(points)
+        nlist = (
+            freud.locality.AABBQuery(box, points)
+            .query(points, dict(r_max=1.5, exclude_ii=True))
+            .toNeighborList()
+        )
+        nlist_reorder = aq_reorder.query(
+            points, dict(r_max=1.5, exclude_ii=True)
+        ).toNeighborList()
+        assert nlist_equal(nlist, nlist_reorder)
+
 
 class TestNeighborQueryLinkCell(NeighborQueryTest):
     @classmethod
@@ -692,6 +920,128 @@ class TestNeighborQueryLinkCell(NeighborQueryTest):
         assert nlist_equal(nlist1, nlist2)
 
 
+class TestNeighborQueryLinkCellReorder(TestNeighborQueryLinkCell):
+    @classmethod
+    def build_query_object(cls, box, ref_points, r_max=None):
+        if r_max is None:
+            raise ValueError("Building LinkCells requires passing an r_max.")
+        return freud.locality.LinkCell(box, ref_points, r_max, reorder=True)
+
+    def test_reorder_matches(self):
+        N = 1000
+        L = 10
+        r_max = 1.5
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        lc = freud.locality.LinkCell(box, points, r_max)
+        lc_reorder = freud.locality.LinkCell(box, points, r_max, reorder=True)
+        npt.assert_allclose(lc_reorder.points, points)
+        for query_args in (
+            dict(r_max=r_max, exclude_ii=True),
+            dict(num_neighbors=6, exclude_ii=True),
+            dict(r_max=r_max, exclude_ii=True, half=True),
+        ):
+            nlist = lc.query(points, query_args).toNeighborList()
+            nlist_reorder = lc_reorder.query(points, query_args).toNeighborList()
+            assert nlist_equal(nlist, nlist_reorder)
+            npt.assert_allclose(nlist.distances, nlist_reorder.distances)
+
+        rdf = freud.density.RDF(bins=10, r_max=r_max)
+        rdf.compute(lc, neighbors=dict(r_max=r_max, exclude_ii=True))
+        rdf_reorder = freud.density.RDF(bins=10, r_max=r_max)
+        rdf_reorder.compute(lc_reorder, neighbors=dict(r_max=r_max, exclude_ii=True))
+        npt.assert_allclose(rdf.bin_counts, rdf_reorder.bin_counts)
+
+
+class TestRawPoints:
+    def test_structure_selection(self):
+        L = 10
+        N = 2000
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        nq = freud.locality.NeighborQuery.from_system((box, points))
+        assert nq.structure is None
+        assert nq.build_time == 0
+
+        # Dense ball queries use a cell list.
+        r_max = 1.5
+        nlist = nq.query(points, dict(r_max=r_max)).toNeighborList()
+        assert nq.structure == "LinkCell"
+        assert nq.build_time > 0
+        check_nlist = (
+            freud.locality.AABBQuery(box, points)
+            .query(points, dict(r_max=r_max))
+            .toNeighborList()
+        )
+        npt.assert_array_equal(
+            nlist.query_point_indices, check_nlist.query_point_indices
+        )
+        npt.assert_array_equal(nlist.point_indices, check_nlist.point_indices)
+        npt.assert_allclose(nlist.distances, check_nlist.distances, atol=1e-5)
+
+        # Sparse ball queries and nearest neighbor queries use a tree.
+        nq.query(points, dict(r_max=0.2)).toNeighborList()
+        assert nq.structure == "AABBQuery"
+        nq.query(points, dict(num_neighbors=4)).toNeighborList()
+        assert nq.structure == "AABBQuery"
+
+        # Large cutoffs relative to the box use a tree.
+        nq.query(points, dict(r_max=L / 3 + 0.1)).toNeighborList()
+        assert nq.structure == "AABBQuery"
+
+    def test_compute(self):
+        box, points = freud.data.make_random_system(10, 2000, seed=1)
+        nq = freud.locality.NeighborQuery.from_system((box, points))
+        rdf = freud.density.RDF(bins=20, r_max=2)
+        rdf.compute(nq)
+        assert nq.structure == "LinkCell"
+        rdf_check = freud.density.RDF(bins=20, r_max=2)
+        rdf_check.compute(freud.locality.AABBQuery(box, points))
+        npt.assert_allclose(rdf.bin_counts, rdf_check.bin_counts)
+
+        # Computes report the structure used for systems passed as tuples.
+        assert rdf_check.neighbor_query_structure == "AABBQuery"
+        assert rdf_check.neighbor_query_build_time is None
+        rdf_check.compute((box, points))
+        assert rdf_check.neighbor_query_structure == "LinkCell"
+        assert rdf_check.neighbor_query_build_time >= 0
+
+    def test_concurrent_queries(self):
+        box, points = freud.data.make_random_system(10, 500, seed=3)
+        nq = freud.locality.NeighborQuery.from_system((box, points))
+        aq = freud.locality.AABBQuery(box, points)
+        r_maxes = [1.6, 1.8, 2.0, 3.4] * 4
+
+        # Queries release the GIL, so threads may build and replace the
+        # cached structures of one system concurrently.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            nlists = list(
+                executor.map(
+                    lambda r_max: nq.query(points, dict(r_max=r_max)).toNeighborList(),
+                    r_maxes,
+                )
+            )
+        for r_max, nlist in zip(r_maxes, nlists):
+            expected = aq.query(points, dict(r_max=r_max)).toNeighborList()
+            npt.assert_equal(nlist.query_point_indices, expected.query_point_indices)
+            npt.assert_equal(nlist.point_indices, expected.point_indices)
+
+    def test_replaced_structure(self):
+        box, points = freud.data.make_random_system(10, 2000, seed=2)
+        nq = freud.locality.NeighborQuery.from_system((box, points))
+        aq = freud.locality.AABBQuery(box, points)
+
+        # Only the most recent cell list is kept, but an unfinished query
+        # keeps using the cell list it started with.
+        bonds = iter(nq.query(points, dict(r_max=1.5)))
+        first_bond = next(bonds)
+        assert nq.structure == "LinkCell"
+        for r_max in (1.0, 1.25):
+            nq.query(points, dict(r_max=r_max)).toNeighborList()
+            assert nq.structure == "LinkCell"
+        pairs = {(i, j) for i, j, _ in [first_bond, *bonds]}
+        expected = {(i, j) for i, j, _ in aq.query(points, dict(r_max=1.5))}
+        assert pairs == expected
+
+
 class TestMultipleMethods:
     """Check that different methods of making a NeighborList give the same
     result."""
@@ -713,3 +1063,35 @@ class TestMultipleMethods:
                 continue
             check_nlist = nq.query(query_points, neighbors).toNeighborList()
             assert nlist_equal(nlist, check_nlist)
+
+    def test_build_many(self):
+        r_max = 1.5
+        frames = [
+            freud.data.make_random_system(10, 200, seed=seed) for seed in range(4)
+        ]
+        for nq_type, kwargs in (
+            (freud.locality.AABBQuery, {}),
+            (freud.locality.LinkCell, dict(cell_width=r_max)),
+        ):
+            nqs = freud.locality.build_many(frames, nq_type, max_workers=2, **kwargs)
+            assert len(nqs) == len(frames)
+            for nq, (box, points) in zip(nqs, frames):
+                assert isinstance(nq, nq_type)
+                assert nq.box == box
+                npt.assert_allclose(nq.points, points)
+                nlist = nq.query(points, dict(r_max=r_max)).toNeighborList()
+                check_nlist = (
+                    freud.locality.AABBQuery(box, points)
+                    .query(points, dict(r_max=r_max))
+                    .toNeighborList()
+                )
+                assert nlist_equal(nlist, check_nlist)
+
+        with pytest.raises(ValueError):
+            freud.locality.build_many(frames, freud.locality.NeighborQuery)
+
+        # Invalid systems raise the same errors as building them directly.
+        box2d, points2d = freud.data.make_random_system(10, 10, is2D=True)
+        points2d[-1, 2] = 1
+        with pytest.raises(ValueError):
+            freud.locality.build_many([(box2d, points2d)])
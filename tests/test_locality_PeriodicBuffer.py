@@ -1,5 +1,6 @@
 import numpy as np
 import numpy.testing as npt
+import pytest
 
 import freud
 
@@ -204,6 +205,36 @@ class TestPeriodicBuffer:
         assert len(pbuff.buffer_ids) == 3 * N
         npt.assert_array_equal(pbuff.buffer_box.L, box.L * np.array([2, 1, 2]))
 
+    def test_buffer_images(self):
+        N = 50  # Number of points
+        np.random.seed(0)
+        box = freud.box.Box(Lx=5, Ly=6, Lz=7, xy=0.5, xz=0.1, yz=0.2)
+        positions = box.make_absolute(np.random.rand(N, 3))
+        pbuff = freud.locality.PeriodicBuffer()
+
+        for buffer, images in ((2.5, False), ([1, 0, 2], True)):
+            pbuff.compute((box, positions), buffer=buffer, images=images)
+            buffer_points = np.copy(pbuff.buffer_points)
+            buffer_ids = np.copy(pbuff.buffer_ids)
+            buffer_images = np.copy(pbuff.buffer_images)
+            assert buffer_images.shape == (len(buffer_ids), 3)
+            assert not np.any(np.all(buffer_images == 0, axis=1))
+
+            # The buffer points can be reconstructed from ids and images.
+            reconstructed = positions[buffer_ids] + buffer_images @ box.to_matrix().T
+            if images:
+                reconstructed = pbuff.buffer_box.wrap(reconstructed)
+            npt.assert_allclose(reconstructed, buffer_points, atol=1e-5)
+
+            # Omitting the points gives the same ids and images.
+            pbuff.compute(
+                (box, positions), buffer=buffer, images=images, include_points=False
+            )
+            npt.assert_array_equal(pbuff.buffer_ids, buffer_ids)
+            npt.assert_array_equal(pbuff.buffer_images, buffer_images)
+            with pytest.raises(ValueError):
+                pbuff.buffer_points
+
     def test_repr(self):
         pbuff = freud.locality.PeriodicBuffer()
         assert str(pbuff) == str(eval(repr(pbuff)))
@@ -0,0 +1,135 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+import freud
+
+
+def sorted_bonds(nlist):
+    order = np.lexsort((nlist.point_indices, nlist.query_point_indices))
+    return (
+        nlist.query_point_indices[order],
+        nlist.point_indices[order],
+        nlist.distances[order],
+    )
+
+
+def assert_nlist_matches_query(nlist, system, query_args, query_points=None):
+    nq = freud.locality.AABBQuery.from_system(system)
+    if query_points is None:
+        query_points = nq.points
+    expected = nq.query(query_points, query_args).toNeighborList()
+    for actual_array, expected_array in zip(
+        sorted_bonds(nlist), sorted_bonds(expected)
+    ):
+        npt.assert_allclose(actual_array, expected_array, rtol=1e-5, atol=1e-5)
+
+
+class TestVerletList:
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            freud.locality.VerletList(r_max=0, skin=0.1)
+        with pytest.raises(ValueError):
+            freud.locality.VerletList(r_max=1, skin=-0.1)
+
+    def test_trajectory(self):
+        L = 10
+        N = 500
+        r_max = 1.5
+        skin = 0.4
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        rng = np.random.default_rng(0)
+        verlet = freud.locality.VerletList(r_max, skin)
+        assert verlet.r_max == r_max
+        assert np.isclose(verlet.skin, skin)
+
+        rebuilds = []
+        for frame in range(10):
+            verlet.compute((box, points))
+            rebuilds.append(verlet.rebuilt)
+            assert_nlist_matches_query(
+                verlet.nlist, (box, points), dict(r_max=r_max, exclude_ii=True)
+            )
+            points = box.wrap(
+                points + rng.normal(scale=0.03, size=points.shape).astype(np.float32)
+            )
+
+        # The first frame always builds, and small displacements allow the
+        # stored bonds to be reused for some of the later frames.
+        assert rebuilds[0]
+        assert not all(rebuilds[1:])
+        assert verlet.num_builds == sum(rebuilds)
+
+    def test_rebuild_on_large_displacement(self):
+        L = 10
+        N = 200
+        box, points = freud.data.make_random_system(L, N, seed=1)
+        verlet = freud.locality.VerletList(r_max=1.5, skin=0.2)
+        verlet.compute((box, points))
+        assert verlet.rebuilt
+
+        # Moving every point by the same amount below skin / 2 reuses bonds.
+        points = box.wrap(points + np.float32(0.05))
+        verlet.compute((box, points))
+        assert not verlet.rebuilt
+
+        # Moving a single point too far forces a rebuild.
+        points[0] = box.wrap(points[0] + np.array([0.2, 0, 0], dtype=np.float32))
+        verlet.compute((box, points))
+        assert verlet.rebuilt
+        assert verlet.num_builds == 2
+        assert_nlist_matches_query(
+            verlet.nlist, (box, points), dict(r_max=1.5, exclude_ii=True)
+        )
+
+    def test_rebuild_on_box_change(self):
+        box, points = freud.data.make_random_system(10, 200, seed=2)
+        verlet = freud.locality.VerletList(r_max=1.5, skin=0.2)
+        verlet.compute((box, points))
+        box = freud.box.Box.cube(10.5)
+        verlet.compute((box, points))
+        assert verlet.rebuilt
+        assert_nlist_matches_query(
+            verlet.nlist, (box, points), dict(r_max=1.5, exclude_ii=True)
+        )
+
+    def test_query_points(self):
+        L = 10
+        box, points = freud.data.make_random_system(L, 300, seed=3)
+        _, query_points = freud.data.make_random_system(L, 100, seed=4)
+        rng = np.random.default_rng(1)
+        verlet = freud.locality.VerletList(r_max=2, skin=0.5)
+        for frame in range(5):
+            verlet.compute((box, points), query_points)
+            assert_nlist_matches_query(
+                verlet.nlist,
+                (box, points),
+                dict(r_max=2, exclude_ii=False),
+                query_points,
+            )
+            points = box.wrap(
+                points + rng.normal(scale=0.02, size=points.shape).astype(np.float32)
+            )
+            query_points = box.wrap(
+                query_points
+                + rng.normal(scale=0.02, size=query_points.shape).astype(np.float32)
+            )
+
+    def test_compute_matches(self):
+        box, points = freud.data.make_random_system(10, 500, seed=5)
+        verlet = freud.locality.VerletList(r_max=1.5, skin=0.3)
+        points = box.wrap(points + np.float32(0.05))
+        verlet.compute((box, points))
+        points = box.wrap(points + np.float32(0.05))
+        verlet.compute((box, points))
+        assert not verlet.rebuilt
+
+        ql = freud.order.Steinhardt(6)
+        ql.compute((box, points), neighbors=dict(r_max=1.5))
+        ql_verlet = freud.order.Steinhardt(6)
+        ql_verlet.compute((box, points), neighbors=verlet.nlist)
+        npt.assert_allclose(ql.particle_order, ql_verlet.particle_order, atol=1e-5)
+
+    def test_repr(self):
+        verlet = freud.locality.VerletList(r_max=1.5, skin=0.25)
+        assert str(verlet) == str(eval(repr(verlet)))
@@ -328,9 +328,45 @@ class TestVoronoi:
         )
         npt.assert_allclose(wrapped_distances, vor.nlist.distances)
 
+    @pytest.mark.parametrize("is2D", [False, True])
+    def test_parallel_matches_serial(self, is2D):
+        box, points = freud.data.make_random_system(10, 2000, is2D=is2D, seed=0)
+        with freud.parallel.NumThreads(1):
+            serial = freud.locality.Voronoi().compute((box, points))
+        with freud.parallel.NumThreads(4):
+            parallel = freud.locality.Voronoi().compute((box, points))
+
+        for attr in ("query_point_indices", "point_indices", "distances", "weights"):
+            npt.assert_array_equal(
+                getattr(parallel.nlist, attr), getattr(serial.nlist, attr)
+            )
+        npt.assert_array_equal(parallel.volumes, serial.volumes)
+        for parallel_polytope, serial_polytope in zip(
+            parallel.polytopes, serial.polytopes
+        ):
+            npt.assert_array_equal(parallel_polytope, serial_polytope)
+
+    @pytest.mark.parametrize("is2D", [False, True])
+    def test_no_polytopes(self, is2D):
+        box, points = freud.data.make_random_system(10, 500, is2D=is2D, seed=1)
+        vor = freud.locality.Voronoi().compute((box, points))
+        vor_light = freud.locality.Voronoi(compute_polytopes=False)
+        assert not vor_light.compute_polytopes
+        vor_light.compute((box, points))
+
+        for attr in ("query_point_indices", "point_indices", "distances", "weights"):
+            npt.assert_array_equal(
+                getattr(vor_light.nlist, attr), getattr(vor.nlist, attr)
+            )
+        npt.assert_array_equal(vor_light.volumes, vor.volumes)
+        with pytest.raises(ValueError):
+            vor_light.polytopes
+
     def test_repr(self):
         vor = freud.locality.Voronoi()
         assert str(vor) == str(eval(repr(vor)))
+        vor = freud.locality.Voronoi(compute_polytopes=False)
+        assert str(vor) == str(eval(repr(vor)))
 
     def test_attributes(self):
         # Test that the class attributes are protected
@@ -479,6 +479,32 @@ class TestPMFTXY(PMFT2DTestBase):
         )
         npt.assert_array_equal(pmft.bin_counts, [[0, 0, 0], [0, 0, 0], [0, 1, 0]])
 
+    def test_nlist_without_vectors(self):
+        """Bond vectors computed from the points must match the vectors stored
+        in neighbor lists generated by queries."""
+        box, points = freud.data.make_random_system(self.L, 200, is2D=True, seed=0)
+        angles = np.random.default_rng(0).uniform(0, 2 * np.pi, len(points))
+        nlist = (
+            freud.locality.AABBQuery(box, points)
+            .query(points, dict(r_max=3.0, exclude_ii=True, vectors=True))
+            .toNeighborList()
+        )
+        nlist_no_vectors = freud.locality.NeighborList.from_arrays(
+            len(points),
+            len(points),
+            nlist.query_point_indices,
+            nlist.point_indices,
+            nlist.distances,
+        )
+        assert nlist.has_vectors
+        assert not nlist_no_vectors.has_vectors
+
+        pmft = freud.pmft.PMFTXY(*self.limits, bins=self.bins)
+        pmft.compute((box, points), angles, neighbors=nlist)
+        bin_counts = pmft.bin_counts.copy()
+        pmft.compute((box, points), angles, neighbors=nlist_no_vectors)
+        npt.assert_equal(pmft.bin_counts, bin_counts)
+
     def test_orientation_with_query_points(self):
         """The orientations should be associated with the query points if they
         are provided."""